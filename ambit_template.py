@@ -21,9 +21,11 @@ def main():
                             'write_results_every'   : 1, # frequency for results output (negative value for no output, 1 for every time step, etc.)
                             'write_results_every_0D': 1, # OPTIONAL: for flow0d results (default: write_results_every)
                             'write_restart_every'   : 1, # OPTIONAL: if restart info should be written (default: -1)
+                            'checkpoint_type'       : 'MPIIO', # OPTIONAL: MPIIO - one binary file per vector and step (needed as input for model order reduction), MPIIO_onefile or HDF5 - one file per step (default: 'MPIIO')
                             'output_path'           : ''+basepath+'/tmp/', # where results are written to
                             'output_path_0D'        : ''+basepath+'/tmp/', # OPTIONAL: different output path for flow0d results (default: output_path)
                             'results_to_write'      : ['displacement','velocity','pressure','cauchystress'], # see io_routines.py for what to write
+                            'results_format'        : 'XDMF', # OPTIONAL: format of the solid mechanics results - XDMF or VTX (ADIOS2, needs dolfinx built with ADIOS2) (default: 'XDMF')
                             'simname'               : 'my_simulation_name', # how to name the output (attention: there is no warning, results will be overwritten if existent)
                             'restart_step'          : 0} # OPTIONAL: at which time step to restart a former simulation (that crashed and shoud be resumed or whatever) (default: 0)
 
@@ -84,7 +86,9 @@ def main():
                             'order_pres'            : 1, # order of pressure interpolation (solid, fluid mechanics)
                             'quad_degree'           : 1, # quadrature degree q (number of integration points: n(q) = ((q+2)//2)**dim) --> can be 1 for linear tets, should be >= 3 for linear hexes, should be >= 5 for quadratic tets/hexes
                             'incompressible_2field' : False, # if we want to use a 2-field functional for pressure dofs (always applies for fluid, optional for solid mechanics)
-                            'prestress_initial'     : False} # OPTIONAL: if we want to use MULF prestressing (Gee et al. 2010) prior to solving a dynamic/other kind of solid or solid-coupled problem (experimental, not thoroughly tested!) (default: False)
+                            'prestress_initial'     : False, # OPTIONAL: if we want to use MULF prestressing (Gee et al. 2010) prior to solving a dynamic/other kind of solid or solid-coupled problem (experimental, not thoroughly tested!) (default: False)
+                            'jit_compile_args'      : ['-O3','-march=native'], # OPTIONAL: extra C compiler flags for the JIT-compiled form kernels (compiled ones are cached separately per flag set) (default: none, i.e. the FFCx defaults)
+                            'form_compiler_params_jac' : {}} # OPTIONAL: FFCx parameters for the generation of the tangent stiffness kernel (default: {}, i.e. the FFCx defaults)
     
     # for solid_flow0d or fluid_flow0d problem type
     COUPLING_PARAMS      = {'surface_ids'           : [[1],[2]], # coupling surfaces (for syspul* models: order is lv, rv, la, ra - has to be consistent with chamber_models dict)
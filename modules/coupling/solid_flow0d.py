@@ -238,10 +238,8 @@ class SolidmechanicsFlow0DSolver():
                 self.pb.constr_old.append(sum(con)*self.pb.cq_factor[i])
 
         if bool(self.pb.pbf.chamber_models):
-            self.pb.pbf.y = []
+            self.pb.pbf.y = [curve(self.pb.pbs.t_init) for curve in self.pb.pbf.activation_curves]
             for ch in ['lv','rv','la','ra']:
-                if self.pb.pbf.chamber_models[ch]['type']=='0D_elast': self.pb.pbf.y.append(self.pb.pbs.ti.timecurves(self.pb.pbf.chamber_models[ch]['activation_curve'])(self.pb.pbs.t_init))
-                if self.pb.pbf.chamber_models[ch]['type']=='0D_elast_prescr': self.pb.pbf.y.append(self.pb.pbs.ti.timecurves(self.pb.pbf.chamber_models[ch]['elastance_curve'])(self.pb.pbs.t_init))
                 if self.pb.pbf.chamber_models[ch]['type']=='0D_prescr': self.pb.pbf.c.append(self.pb.pbs.ti.timecurves(self.pb.pbf.chamber_models[ch]['prescribed_curve'])(self.pb.pbs.t_init))
 
         # initially evaluate 0D model at old state
@@ -336,6 +334,9 @@ class SolidmechanicsFlow0DSolver():
                     sys.stdout.flush()
                 break
             
+        # close 0D result files
+        self.pb.pbf.cardvasc0D.close_output()
+
         if self.pb.comm.rank == 0: # only proc 0 should print this
             print('Program complete. Time for computation: %.4f s (= %.2f min)' % ( time.time()-start, (time.time()-start)/60. ))
             sys.stdout.flush()
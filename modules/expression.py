@@ -12,9 +12,13 @@ import numpy as np
 class template:
     def __init__(self):
         self.val = 0.0
+        self.buf = None
 
+    # output buffer is allocated once per number of points and re-filled on each call
     def evaluate(self, x):
-        return np.full(x.shape[1], self.val)
+        if self.buf is None or self.buf.shape[0] != x.shape[1]: self.buf = np.empty(x.shape[1])
+        self.buf.fill(self.val)
+        return self.buf
 
 
 # template vector expression class    
@@ -23,8 +27,11 @@ class template_vector:
         self.val_x = 0.0
         self.val_y = 0.0
         self.val_z = 0.0
+        self.buf = None
 
     def evaluate(self, x):
-        return ( np.full(x.shape[1], self.val_x),
-                 np.full(x.shape[1], self.val_y),
-                 np.full(x.shape[1], self.val_z) )
+        if self.buf is None or self.buf.shape[1] != x.shape[1]: self.buf = np.empty((3,x.shape[1]))
+        self.buf[0].fill(self.val_x)
+        self.buf[1].fill(self.val_y)
+        self.buf[2].fill(self.val_z)
+        return self.buf
@@ -27,14 +27,13 @@ class cardiovascular0Dbase(ode):
     # check for cardiac cycle periodicity 
     def cycle_check(self, var, varTc, varTc_old, t, cycle, cyclerr, eps_periodic, check='allvar', inioutpath=None, nm='', induce_pert_after_cycl=-1):
         
-        if isinstance(varTc, np.ndarray): vs, ve = 0, len(varTc)
-        else: vs, ve = var.getOwnershipRange()
-
         is_periodic = False
         
-        if self.T_cycl > 0. and np.isclose(t, self.T_cycl):
+        # end of cycle reached (same tolerances as np.isclose, but without its array overhead on a scalar)
+        if self.T_cycl > 0. and abs(t - self.T_cycl) <= 1.0e-8 + 1.0e-5*abs(self.T_cycl):
             
-            varTc[vs:ve] = var[vs:ve]
+            if isinstance(varTc, np.ndarray): varTc[:] = var
+            else: var.copy(varTc)
             
             if check is not None: is_periodic = self.check_periodic(varTc, varTc_old, eps_periodic, check, cyclerr)
             
@@ -46,7 +45,8 @@ class cardiovascular0Dbase(ode):
             if is_periodic and inioutpath is not None:
                 self.write_initial(inioutpath, nm, varTc_old, varTc)
             
-            varTc_old[vs:ve] = varTc[vs:ve]
+            if isinstance(varTc, np.ndarray): varTc_old[:] = varTc
+            else: varTc.copy(varTc_old)
                 
             # update cycle counter
             cycle[0] += 1
@@ -55,16 +55,13 @@ class cardiovascular0Dbase(ode):
 
 
     # some perturbations/diseases we want to simulate (mr: mitral regurgitation, ms: mitral stenosis, ar: aortic regurgitation, as: aortic stenosis)
+    # the perturbed valve resistances are symbolic parameters of the expressions, so only their values change
     def induce_perturbation(self, perturb_type, perturb_factor):
 
-        if perturb_type=='mr': self.R_vin_l_max *= perturb_factor
-        if perturb_type=='ms': self.R_vin_l_min *= perturb_factor
-        if perturb_type=='ar': self.R_vout_l_max *= perturb_factor
-        if perturb_type=='as': self.R_vout_l_min *= perturb_factor
-
-        # arrays need re-initialization, expressions have to be re-set
-        self.setup_arrays(), self.set_compartment_interfaces()
-        self.equation_map(), self.set_stiffness(), self.lambdify_expressions()
+        if perturb_type=='mr': self.set_parameter('R_vin_l_max', self.get_parameter('R_vin_l_max')*perturb_factor)
+        if perturb_type=='ms': self.set_parameter('R_vin_l_min', self.get_parameter('R_vin_l_min')*perturb_factor)
+        if perturb_type=='ar': self.set_parameter('R_vout_l_max', self.get_parameter('R_vout_l_max')*perturb_factor)
+        if perturb_type=='as': self.set_parameter('R_vout_l_min', self.get_parameter('R_vout_l_min')*perturb_factor)
 
     
     # set pressure function for 3D FEM model (FEniCS)
@@ -186,6 +183,13 @@ class cardiovascular0Dbase(ode):
             else:
                 raise NameError("Unknown chamber model for chamber %s!" % (ch))
 
+        # elastance parameters (E_max, E_min) of the chambers with time-varying elastance, in the order of the activation list y
+        # (None for elastances prescribed directly by the user) - so that evaluate_chamber_state does not have to dispatch on the chambers
+        self.elastparams = []
+        for ch, E_params in [('lv', ['E_v_max_l','E_v_min_l']), ('rv', ['E_v_max_r','E_v_min_r']), ('la', ['E_at_max_l','E_at_min_l']), ('ra', ['E_at_max_r','E_at_min_r'])]:
+            if self.chmodels[ch]['type']=='0D_elast': self.elastparams.append(tuple(getattr(self, E) for E in E_params))
+            if self.chmodels[ch]['type']=='0D_elast_prescr': self.elastparams.append(None)
+
 
     # set coupling state (populate x and c vectors with Sympy symbols) according to case and coupling quantity (can be volume, flux, or pressure)
     def set_coupling_state(self, ch, chvars, chfncs=[]):
@@ -270,34 +274,19 @@ class cardiovascular0Dbase(ode):
         
         chamber_funcs=[]
 
-        ci=0
-        for i, ch in enumerate(['lv','rv','la','ra']):
+        for ci, E_params in enumerate(self.elastparams):
 
-            if self.chmodels[ch]['type']=='0D_elast':
+            if E_params is not None:
                 
-                if ch == 'lv': E_max, E_min = self.E_v_max_l,  self.E_v_min_l
-                if ch == 'rv': E_max, E_min = self.E_v_max_r,  self.E_v_min_r
-                if ch == 'la': E_max, E_min = self.E_at_max_l, self.E_at_min_l
-                if ch == 'ra': E_max, E_min = self.E_at_max_r, self.E_at_min_r
+                E_max, E_min = E_params
 
                 # time-varying elastance model (y should be normalized activation function provided by user)
-                E_ch_t = (E_max - E_min) * y[ci] + E_min
-                
-                chamber_funcs.append(E_ch_t)
-                
-                ci+=1
+                chamber_funcs.append((E_max - E_min) * y[ci] + E_min)
 
-            elif self.chmodels[ch]['type']=='0D_elast_prescr':
-                
-                E_ch_t = y[ci]
-                
-                chamber_funcs.append(E_ch_t)
-                
-                ci+=1
-                
             else:
                 
-                pass
+                # prescribed elastance
+                chamber_funcs.append(y[ci])
             
         return chamber_funcs
 
@@ -80,13 +80,13 @@ class cardiovascular0Dsyspul(cardiovascular0Dbase):
         self.E_at_max_r = params['E_at_max_r']
         self.E_at_min_r = params['E_at_min_r']
 
-        # valve resistances
-        self.R_vin_l_min = params['R_vin_l_min']
-        self.R_vin_l_max = params['R_vin_l_max']
+        # valve resistances - the left heart ones are symbolic parameters, since they may be perturbed (see induce_perturbation)
+        self.R_vin_l_min = self.symbolic_parameter('R_vin_l_min', params['R_vin_l_min'])
+        self.R_vin_l_max = self.symbolic_parameter('R_vin_l_max', params['R_vin_l_max'])
         self.R_vin_r_min = params['R_vin_r_min']
         self.R_vin_r_max = params['R_vin_r_max']
-        self.R_vout_l_min = params['R_vout_l_min']
-        self.R_vout_l_max = params['R_vout_l_max']
+        self.R_vout_l_min = self.symbolic_parameter('R_vout_l_min', params['R_vout_l_min'])
+        self.R_vout_l_max = self.symbolic_parameter('R_vout_l_max', params['R_vout_l_max'])
         self.R_vout_r_min = params['R_vout_r_min']
         self.R_vout_r_max = params['R_vout_r_max']
         
@@ -506,34 +506,34 @@ def postprocess_groups_syspul(groups, coronarymodel=None, indpertaftercyl=0, mul
     
     # index 0
     groups.append({'pres_time_sys_l'  : ['p_at_l', 'p_v_l', 'p_ar_sys', 'p_ven_sys'],
-                'tex'              : ['$p_{\\\mathrm{at}}^{\\\ell}$', '$p_{\\\mathrm{v}}^{\\\ell}$', '$p_{\\\mathrm{ar}}^{\\\mathrm{sys}}$', '$p_{\\\mathrm{ven}}^{\\\mathrm{sys}}$'],
+                'tex'              : ['$p_{\\mathrm{at}}^{\\ell}$', '$p_{\\mathrm{v}}^{\\ell}$', '$p_{\\mathrm{ar}}^{\\mathrm{sys}}$', '$p_{\\mathrm{ven}}^{\\mathrm{sys}}$'],
                 'lines'            : [1, 2, 3, 15]})
     # index 1
     groups.append({'pres_time_pul_r'  : ['p_at_r', 'p_v_r', 'p_ar_pul', 'p_ven_pul'],
-                'tex'              : ['$p_{\\\mathrm{at}}^{r}$', '$p_{\\\mathrm{v}}^{r}$', '$p_{\\\mathrm{ar}}^{\\\mathrm{pul}}$', '$p_{\\\mathrm{ven}}^{\\\mathrm{pul}}$'],
+                'tex'              : ['$p_{\\mathrm{at}}^{r}$', '$p_{\\mathrm{v}}^{r}$', '$p_{\\mathrm{ar}}^{\\mathrm{pul}}$', '$p_{\\mathrm{ven}}^{\\mathrm{pul}}$'],
                 'lines'            : [16, 17, 18, 20]})
     # index 2
     groups.append({'flux_time_sys_l'  : ['q_vin_l', 'q_vout_l', 'q_ar_sys', 'q_ven1_sys', 'q_ven2_sys'],
-                'tex'              : ['$q_{\\\mathrm{v,in}}^{\\\ell}$', '$q_{\\\mathrm{v,out}}^{\\\ell}$', '$q_{\\\mathrm{ar}}^{\\\mathrm{sys}}$', '$q_{\\\mathrm{ven,1}}^{\\\mathrm{sys}}$', '$q_{\\\mathrm{ven,2}}^{\\\mathrm{sys}}$'],
+                'tex'              : ['$q_{\\mathrm{v,in}}^{\\ell}$', '$q_{\\mathrm{v,out}}^{\\ell}$', '$q_{\\mathrm{ar}}^{\\mathrm{sys}}$', '$q_{\\mathrm{ven,1}}^{\\mathrm{sys}}$', '$q_{\\mathrm{ven,2}}^{\\mathrm{sys}}$'],
                 'lines'            : [1, 2, 3, 15, 151]})
     # index 3
     groups.append({'flux_time_pul_r'  : ['q_vin_r', 'q_vout_r', 'q_ar_pul', 'q_ven1_pul', 'q_ven2_pul', 'q_ven3_pul', 'q_ven4_pul', 'q_ven5_pul'],
-                'tex'              : ['$q_{\\\mathrm{v,in}}^{r}$', '$q_{\\\mathrm{v,out}}^{r}$', '$q_{\\\mathrm{ar}}^{\\\mathrm{pul}}$', '$q_{\\\mathrm{ven,1}}^{\\\mathrm{pul}}$', '$q_{\\\mathrm{ven,2}}^{\\\mathrm{pul}}$', '$q_{\\\mathrm{ven,3}}^{\\\mathrm{pul}}$', '$q_{\\\mathrm{ven,4}}^{\\\mathrm{pul}}$', '$q_{\\\mathrm{ven,5}}^{\\\mathrm{pul}}$'],
+                'tex'              : ['$q_{\\mathrm{v,in}}^{r}$', '$q_{\\mathrm{v,out}}^{r}$', '$q_{\\mathrm{ar}}^{\\mathrm{pul}}$', '$q_{\\mathrm{ven,1}}^{\\mathrm{pul}}$', '$q_{\\mathrm{ven,2}}^{\\mathrm{pul}}$', '$q_{\\mathrm{ven,3}}^{\\mathrm{pul}}$', '$q_{\\mathrm{ven,4}}^{\\mathrm{pul}}$', '$q_{\\mathrm{ven,5}}^{\\mathrm{pul}}$'],
                 'lines'            : [16, 17, 18, 20, 201, 202, 203, 204]})    
     # index 4
     groups.append({'vol_time_l_r'     : ['V_at_l', 'V_v_l', 'V_at_r', 'V_v_r'],
-                'tex'              : ['$V_{\\\mathrm{at}}^{\\\ell}$', '$V_{\\\mathrm{v}}^{\\\ell}$', '$V_{\\\mathrm{at}}^{r}$', '$V_{\\\mathrm{v}}^{r}$'],
+                'tex'              : ['$V_{\\mathrm{at}}^{\\ell}$', '$V_{\\mathrm{v}}^{\\ell}$', '$V_{\\mathrm{at}}^{r}$', '$V_{\\mathrm{v}}^{r}$'],
                 'lines'            : [1, 2, 16, 17]})    
     # index 5
     groups.append({'vol_time_compart' : ['V_at_l', 'V_v_l', 'V_at_r', 'V_v_r', 'V_ar_sys', 'V_ven_sys', 'V_ar_pul', 'V_ven_pul'],
-                'tex'              : ['$V_{\\\mathrm{at}}^{\\\ell}$', '$V_{\\\mathrm{v}}^{\\\ell}$', '$V_{\\\mathrm{at}}^{r}$', '$V_{\\\mathrm{v}}^{r}$', '$V_{\\\mathrm{ar}}^{\\\mathrm{sys}}$', '$V_{\\\mathrm{ven}}^{\\\mathrm{sys}}$', '$V_{\\\mathrm{ar}}^{\\\mathrm{pul}}$', '$V_{\\\mathrm{ven}}^{\\\mathrm{pul}}$'],
+                'tex'              : ['$V_{\\mathrm{at}}^{\\ell}$', '$V_{\\mathrm{v}}^{\\ell}$', '$V_{\\mathrm{at}}^{r}$', '$V_{\\mathrm{v}}^{r}$', '$V_{\\mathrm{ar}}^{\\mathrm{sys}}$', '$V_{\\mathrm{ven}}^{\\mathrm{sys}}$', '$V_{\\mathrm{ar}}^{\\mathrm{pul}}$', '$V_{\\mathrm{ven}}^{\\mathrm{pul}}$'],
                 'lines'            : [1, 2, 16, 17, 3, 15, 18, 20]})
 
     if coronarymodel == 'ZCRp_CRd_lr':
         
         # index 6
         groups.append({'flux_time_cor'  : ['q_corp_sys_l_in', 'q_corp_sys_l', 'q_corp_sys_r_in', 'q_corp_sys_r', 'q_cord_sys_l', 'q_cord_sys_r'],
-                    'tex'              : ['$q_{\\\mathrm{cor,p,in}}^{\\\mathrm{sys},\\\ell}$', '$q_{\\\mathrm{cor,p}}^{\\\mathrm{sys},\\\ell}$', '$q_{\\\mathrm{cor,p,in}}^{\\\mathrm{sys},r}$', '$q_{\\\mathrm{cor,p}}^{\\\mathrm{sys},r}$', '$q_{\\\mathrm{cor,d}}^{\\\mathrm{sys},\\\ell}$', '$q_{\\\mathrm{cor,d}}^{\\\mathrm{sys},r}$'],
+                    'tex'              : ['$q_{\\mathrm{cor,p,in}}^{\\mathrm{sys},\\ell}$', '$q_{\\mathrm{cor,p}}^{\\mathrm{sys},\\ell}$', '$q_{\\mathrm{cor,p,in}}^{\\mathrm{sys},r}$', '$q_{\\mathrm{cor,p}}^{\\mathrm{sys},r}$', '$q_{\\mathrm{cor,d}}^{\\mathrm{sys},\\ell}$', '$q_{\\mathrm{cor,d}}^{\\mathrm{sys},r}$'],
                     'lines'            : [1, 5, 2, 6, 12, 14]})
         
         groups[5]['vol_time_compart'].append('V_corp_sys_l')
@@ -541,10 +541,10 @@ def postprocess_groups_syspul(groups, coronarymodel=None, indpertaftercyl=0, mul
         groups[5]['vol_time_compart'].append('V_cord_sys_l')
         groups[5]['vol_time_compart'].append('V_cord_sys_r')
 
-        groups[5]['tex'].append('$V_{\\\mathrm{cor,p}}^{\\\mathrm{sys},\\\ell}$')
-        groups[5]['tex'].append('$V_{\\\mathrm{cor,p}}^{\\\mathrm{sys},r}$')
-        groups[5]['tex'].append('$V_{\\\mathrm{cor,d}}^{\\\mathrm{sys},\\\ell}$')
-        groups[5]['tex'].append('$V_{\\\mathrm{cor,d}}^{\\\mathrm{sys},r}$')
+        groups[5]['tex'].append('$V_{\\mathrm{cor,p}}^{\\mathrm{sys},\\ell}$')
+        groups[5]['tex'].append('$V_{\\mathrm{cor,p}}^{\\mathrm{sys},r}$')
+        groups[5]['tex'].append('$V_{\\mathrm{cor,d}}^{\\mathrm{sys},\\ell}$')
+        groups[5]['tex'].append('$V_{\\mathrm{cor,d}}^{\\mathrm{sys},r}$')
         
         groups[5]['lines'].append(5)
         groups[5]['lines'].append(6)
@@ -555,21 +555,21 @@ def postprocess_groups_syspul(groups, coronarymodel=None, indpertaftercyl=0, mul
         
         # index 6
         groups.append({'flux_time_cor'  : ['q_corp_sys_in', 'q_corp_sys', 'q_ven2_sys'],
-                    'tex'              : ['$q_{\\\mathrm{cor,p,in}}^{\\\mathrm{sys}}$', '$q_{\\\mathrm{cor,p}}^{\\\mathrm{sys}}$', '$q_{\\\mathrm{cor,d}}^{\\\mathrm{sys}}$'],
+                    'tex'              : ['$q_{\\mathrm{cor,p,in}}^{\\mathrm{sys}}$', '$q_{\\mathrm{cor,p}}^{\\mathrm{sys}}$', '$q_{\\mathrm{cor,d}}^{\\mathrm{sys}}$'],
                     'lines'            : [1, 5, 12]})
         
         groups[5]['vol_time_compart'].append('V_corp_sys')
         groups[5]['vol_time_compart'].append('V_cord_sys')
 
-        groups[5]['tex'].append('$V_{\\\mathrm{cor,p}}^{\\\mathrm{sys}}$')
-        groups[5]['tex'].append('$V_{\\\mathrm{cor,d}}^{\\\mathrm{sys}}$')
+        groups[5]['tex'].append('$V_{\\mathrm{cor,p}}^{\\mathrm{sys}}$')
+        groups[5]['tex'].append('$V_{\\mathrm{cor,d}}^{\\mathrm{sys}}$')
         
         groups[5]['lines'].append(5)
         groups[5]['lines'].append(10)
 
     # all volumes summed up for conservation check
     groups[5]['vol_time_compart'].append('V_all')
-    groups[5]['tex'].append('$\\\sum V$')
+    groups[5]['tex'].append('$\\sum V$')
     groups[5]['lines'].append(99)
     
     # pv loops are only considered for the last cycle
@@ -578,29 +578,29 @@ def postprocess_groups_syspul(groups, coronarymodel=None, indpertaftercyl=0, mul
         if multiscalegandr:
             # index 6
             groups.append({'pres_vol_v_l_r_PERIODIC'  : ['pV_v_l_gandr', 'pV_v_r_gandr', 'pV_v_l_last', 'pV_v_r_last', 'pV_v_l_baseline', 'pV_v_r_baseline'],
-                        'tex'                      : ['$p_{\\\mathrm{v}}^{\\\ell,\\\mathrm{G\\&R}}$', '$p_{\\\mathrm{v}}^{r,\\\mathrm{G\\&R}}$', '$p_{\\\mathrm{v}}^{\\\ell}$', '$p_{\\\mathrm{v}}^{r}$', '$p_{\\\mathrm{v}}^{\\\ell,\\\mathrm{ref}}$', '$p_{\\\mathrm{v}}^{r,\\\mathrm{ref}}$'],
+                        'tex'                      : ['$p_{\\mathrm{v}}^{\\ell,\\mathrm{G\\&R}}$', '$p_{\\mathrm{v}}^{r,\\mathrm{G\\&R}}$', '$p_{\\mathrm{v}}^{\\ell}$', '$p_{\\mathrm{v}}^{r}$', '$p_{\\mathrm{v}}^{\\ell,\\mathrm{ref}}$', '$p_{\\mathrm{v}}^{r,\\mathrm{ref}}$'],
                         'lines'                    : [21, 22, 102, 117, 97, 98]})
             # index 7
             groups.append({'pres_vol_at_l_r_PERIODIC' : ['pV_at_l_gandr', 'pV_at_r_gandr', 'pV_at_l_last', 'pV_at_r_last', 'pV_at_l_baseline', 'pV_at_r_baseline'],
-                        'tex'                      : ['$p_{\\\mathrm{at}}^{\\\ell,\\\mathrm{G\\&R}}$', '$p_{\\\mathrm{at}}^{r,\\\mathrm{G\\&R}}$', '$p_{\\\mathrm{at}}^{\\\ell}$', '$p_{\\\mathrm{at}}^{r}$', '$p_{\\\mathrm{at}}^{\\\ell,\\\mathrm{ref}}$', '$p_{\\\mathrm{at}}^{r,\\\mathrm{ref}}$'],
+                        'tex'                      : ['$p_{\\mathrm{at}}^{\\ell,\\mathrm{G\\&R}}$', '$p_{\\mathrm{at}}^{r,\\mathrm{G\\&R}}$', '$p_{\\mathrm{at}}^{\\ell}$', '$p_{\\mathrm{at}}^{r}$', '$p_{\\mathrm{at}}^{\\ell,\\mathrm{ref}}$', '$p_{\\mathrm{at}}^{r,\\mathrm{ref}}$'],
                         'lines'                    : [23, 24, 101, 116, 97, 98]})
         else:
             # index 6
             groups.append({'pres_vol_v_l_r_PERIODIC'  : ['pV_v_l_last', 'pV_v_r_last', 'pV_v_l_baseline', 'pV_v_r_baseline'],
-                        'tex'                      : ['$p_{\\\mathrm{v}}^{\\\ell}$', '$p_{\\\mathrm{v}}^{r}$', '$p_{\\\mathrm{v}}^{\\\ell,\\\mathrm{ref}}$', '$p_{\\\mathrm{v}}^{r,\\\mathrm{ref}}$'],
+                        'tex'                      : ['$p_{\\mathrm{v}}^{\\ell}$', '$p_{\\mathrm{v}}^{r}$', '$p_{\\mathrm{v}}^{\\ell,\\mathrm{ref}}$', '$p_{\\mathrm{v}}^{r,\\mathrm{ref}}$'],
                         'lines'                    : [2, 17, 97, 98]})
             # index 7
             groups.append({'pres_vol_at_l_r_PERIODIC' : ['pV_at_l_last', 'pV_at_r_last', 'pV_at_l_baseline', 'pV_at_r_baseline'],
-                        'tex'                      : ['$p_{\\\mathrm{at}}^{\\\ell}$', '$p_{\\\mathrm{at}}^{r}$', '$p_{\\\mathrm{at}}^{\\\ell,\\\mathrm{ref}}$', '$p_{\\\mathrm{at}}^{r,\\\mathrm{ref}}$'],
+                        'tex'                      : ['$p_{\\mathrm{at}}^{\\ell}$', '$p_{\\mathrm{at}}^{r}$', '$p_{\\mathrm{at}}^{\\ell,\\mathrm{ref}}$', '$p_{\\mathrm{at}}^{r,\\mathrm{ref}}$'],
                         'lines'                    : [1, 16, 97, 98]})
     else:
         # index 6
         groups.append({'pres_vol_v_l_r_PERIODIC'  : ['pV_v_l_last', 'pV_v_r_last'],
-                    'tex'                      : ['$p_{\\\mathrm{v}}^{\\\ell}$', '$p_{\\\mathrm{v}}^{r}$'],
+                    'tex'                      : ['$p_{\\mathrm{v}}^{\\ell}$', '$p_{\\mathrm{v}}^{r}$'],
                     'lines'                    : [2, 17]})
         # index 7
         groups.append({'pres_vol_at_l_r_PERIODIC' : ['pV_at_l_last', 'pV_at_r_last'],
-                    'tex'                      : ['$p_{\\\mathrm{at}}^{\\\ell}$', '$p_{\\\mathrm{at}}^{r}$'],
+                    'tex'                      : ['$p_{\\mathrm{at}}^{\\ell}$', '$p_{\\mathrm{at}}^{r}$'],
                     'lines'                    : [1, 16]})
         
 
@@ -118,13 +118,13 @@ class cardiovascular0Dsyspulcap(cardiovascular0Dbase):
         self.E_at_max_r = params['E_at_max_r']
         self.E_at_min_r = params['E_at_min_r']
 
-        # valve resistances
-        self.R_vin_l_min = params['R_vin_l_min']
-        self.R_vin_l_max = params['R_vin_l_max']
+        # valve resistances - the left heart ones are symbolic parameters, since they may be perturbed (see induce_perturbation)
+        self.R_vin_l_min = self.symbolic_parameter('R_vin_l_min', params['R_vin_l_min'])
+        self.R_vin_l_max = self.symbolic_parameter('R_vin_l_max', params['R_vin_l_max'])
         self.R_vin_r_min = params['R_vin_r_min']
         self.R_vin_r_max = params['R_vin_r_max']
-        self.R_vout_l_min = params['R_vout_l_min']
-        self.R_vout_l_max = params['R_vout_l_max']
+        self.R_vout_l_min = self.symbolic_parameter('R_vout_l_min', params['R_vout_l_min'])
+        self.R_vout_l_max = self.symbolic_parameter('R_vout_l_max', params['R_vout_l_max'])
         self.R_vout_r_min = params['R_vout_r_min']
         self.R_vout_r_max = params['R_vout_r_max']
         
@@ -653,32 +653,32 @@ def postprocess_groups_syspulcap(groups, indpertaftercyl=0, multiscalegandr=Fals
     
     # index 0
     groups.append({'pres_time_sys_l'  : ['p_at_l', 'p_v_l', 'p_ar_sys', 'p_arperi_sys', 'p_venspl_sys', 'p_venespl_sys', 'p_venmsc_sys', 'p_vencer_sys', 'p_vencor_sys', 'p_ven_sys'],
-                'tex'                 : ['$p_{\\\mathrm{at}}^{\\\ell}$', '$p_{\\\mathrm{v}}^{\\\ell}$', '$p_{\\\mathrm{ar}}^{\\\mathrm{sys}}$', '$p_{\\\mathrm{ar,peri}}^{\\\mathrm{sys}}$', '$p_{\\\mathrm{ven,spl}}^{\\\mathrm{sys}}$', '$p_{\\\mathrm{ven,espl}}^{\\\mathrm{sys}}$', '$p_{\\\mathrm{ven,msc}}^{\\\mathrm{sys}}$', '$p_{\\\mathrm{ven,cer}}^{\\\mathrm{sys}}$', '$p_{\\\mathrm{ven,cor}}^{\\\mathrm{sys}}$', '$p_{\\\mathrm{ven}}^{\\\mathrm{sys}}$'],
+                'tex'                 : ['$p_{\\mathrm{at}}^{\\ell}$', '$p_{\\mathrm{v}}^{\\ell}$', '$p_{\\mathrm{ar}}^{\\mathrm{sys}}$', '$p_{\\mathrm{ar,peri}}^{\\mathrm{sys}}$', '$p_{\\mathrm{ven,spl}}^{\\mathrm{sys}}$', '$p_{\\mathrm{ven,espl}}^{\\mathrm{sys}}$', '$p_{\\mathrm{ven,msc}}^{\\mathrm{sys}}$', '$p_{\\mathrm{ven,cer}}^{\\mathrm{sys}}$', '$p_{\\mathrm{ven,cor}}^{\\mathrm{sys}}$', '$p_{\\mathrm{ven}}^{\\mathrm{sys}}$'],
                 'lines'               : [1, 2, 3, 4, 10, 11, 12, 13, 14, 15]})
     # index 1
     groups.append({'pres_time_pul_r'  : ['p_at_r', 'p_v_r', 'p_ar_pul', 'p_cap_pul', 'p_ven_pul'],
-                'tex'                 : ['$p_{\\\mathrm{at}}^{r}$', '$p_{\\\mathrm{v}}^{r}$', '$p_{\\\mathrm{ar}}^{\\\mathrm{pul}}$', '$p_{\\\mathrm{cap}}^{\\\mathrm{pul}}$', '$p_{\\\mathrm{ven}}^{\\\mathrm{pul}}$'],
+                'tex'                 : ['$p_{\\mathrm{at}}^{r}$', '$p_{\\mathrm{v}}^{r}$', '$p_{\\mathrm{ar}}^{\\mathrm{pul}}$', '$p_{\\mathrm{cap}}^{\\mathrm{pul}}$', '$p_{\\mathrm{ven}}^{\\mathrm{pul}}$'],
                 'lines'               : [16, 17, 18, 19, 20]})
     # index 2
     groups.append({'flux_time_sys_l'  : ['q_vin_l', 'q_vout_l', 'q_ar_sys', 'q_arspl_sys', 'q_arespl_sys', 'q_armsc_sys', 'q_arcer_sys', 'q_arcor_sys', 'q_venspl_sys', 'q_venespl_sys', 'q_venmsc_sys', 'q_vencer_sys', 'q_vencor_sys', 'q_ven_sys'],
-                'tex'                 : ['$q_{\\\mathrm{v,in}}^{\\\ell}$', '$q_{\\\mathrm{v,out}}^{\\\ell}$', '$q_{\\\mathrm{ar}}^{\\\mathrm{sys}}$', '$q_{\\\mathrm{ar,spl}}^{\\\mathrm{sys}}$', '$q_{\\\mathrm{ar,espl}}^{\\\mathrm{sys}}$', '$q_{\\\mathrm{ar,msc}}^{\\\mathrm{sys}}$', '$q_{\\\mathrm{ar,cer}}^{\\\mathrm{sys}}$', '$q_{\\\mathrm{ar,cor}}^{\\\mathrm{sys}}$', '$q_{\\\mathrm{ven,spl}}^{\\\mathrm{sys}}$', '$q_{\\\mathrm{ven,espl}}^{\\\mathrm{sys}}$', '$q_{\\\mathrm{ven,msc}}^{\\\mathrm{sys}}$', '$q_{\\\mathrm{ven,cer}}^{\\\mathrm{sys}}$', '$q_{\\\mathrm{ven,cor}}^{\\\mathrm{sys}}$', '$q_{\\\mathrm{ven}}^{\\\mathrm{sys}}$'],
+                'tex'                 : ['$q_{\\mathrm{v,in}}^{\\ell}$', '$q_{\\mathrm{v,out}}^{\\ell}$', '$q_{\\mathrm{ar}}^{\\mathrm{sys}}$', '$q_{\\mathrm{ar,spl}}^{\\mathrm{sys}}$', '$q_{\\mathrm{ar,espl}}^{\\mathrm{sys}}$', '$q_{\\mathrm{ar,msc}}^{\\mathrm{sys}}$', '$q_{\\mathrm{ar,cer}}^{\\mathrm{sys}}$', '$q_{\\mathrm{ar,cor}}^{\\mathrm{sys}}$', '$q_{\\mathrm{ven,spl}}^{\\mathrm{sys}}$', '$q_{\\mathrm{ven,espl}}^{\\mathrm{sys}}$', '$q_{\\mathrm{ven,msc}}^{\\mathrm{sys}}$', '$q_{\\mathrm{ven,cer}}^{\\mathrm{sys}}$', '$q_{\\mathrm{ven,cor}}^{\\mathrm{sys}}$', '$q_{\\mathrm{ven}}^{\\mathrm{sys}}$'],
                 'lines'               : [1, 2, 3, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15]})
     # index 3
     groups.append({'flux_time_pul_r'  : ['q_vin_r', 'q_vout_r', 'q_ar_pul', 'q_cap_pul', 'q_ven_pul'],
-                'tex'                 : ['$q_{\\\mathrm{v,in}}^{r}$', '$q_{\\\mathrm{v,out}}^{r}$', '$q_{\\\mathrm{ar}}^{\\\mathrm{pul}}$', '$q_{\\\mathrm{cap}}^{\\\mathrm{pul}}$', '$q_{\\\mathrm{ven}}^{\\\mathrm{pul}}$'],
+                'tex'                 : ['$q_{\\mathrm{v,in}}^{r}$', '$q_{\\mathrm{v,out}}^{r}$', '$q_{\\mathrm{ar}}^{\\mathrm{pul}}$', '$q_{\\mathrm{cap}}^{\\mathrm{pul}}$', '$q_{\\mathrm{ven}}^{\\mathrm{pul}}$'],
                 'lines'               : [16, 17, 18, 19, 20]})
     # index 4
     groups.append({'vol_time_l_r'     : ['V_at_l', 'V_v_l', 'V_at_r', 'V_v_r'],
-                'tex'                 : ['$V_{\\\mathrm{at}}^{\\\ell}$', '$V_{\\\mathrm{v}}^{\\\ell}$', '$V_{\\\mathrm{at}}^{r}$', '$V_{\\\mathrm{v}}^{r}$'],
+                'tex'                 : ['$V_{\\mathrm{at}}^{\\ell}$', '$V_{\\mathrm{v}}^{\\ell}$', '$V_{\\mathrm{at}}^{r}$', '$V_{\\mathrm{v}}^{r}$'],
                 'lines'               : [1, 2, 16, 17]})
     # index 5
     groups.append({'vol_time_compart' : ['V_at_l', 'V_v_l', 'V_at_r', 'V_v_r', 'V_ar_sys', 'V_arperi_sys', 'V_venspl_sys', 'V_venespl_sys', 'V_venmsc_sys', 'V_vencer_sys', 'V_vencor_sys', 'V_ven_sys', 'V_ar_pul', 'V_cap_pul', 'V_ven_pul'],
-                'tex'                 : ['$V_{\\\mathrm{at}}^{\\\ell}$', '$V_{\\\mathrm{v}}^{\\\ell}$', '$V_{\\\mathrm{at}}^{r}$', '$V_{\\\mathrm{v}}^{r}$', '$V_{\\\mathrm{ar}}^{\\\mathrm{sys}}$', '$V_{\\\mathrm{ar,peri}}^{\\\mathrm{sys}}$', '$V_{\\\mathrm{ven,spl}}^{\\\mathrm{sys}}$', '$V_{\\\mathrm{ven,espl}}^{\\\mathrm{sys}}$', '$V_{\\\mathrm{ven,msc}}^{\\\mathrm{sys}}$', '$V_{\\\mathrm{ven,cer}}^{\\\mathrm{sys}}$', '$V_{\\\mathrm{ven,cor}}^{\\\mathrm{sys}}$', '$V_{\\\mathrm{ven}}^{\\\mathrm{sys}}$', '$V_{\\\mathrm{ar}}^{\\\mathrm{pul}}$', '$V_{\\\mathrm{cap}}^{\\\mathrm{pul}}$', '$V_{\\\mathrm{ven}}^{\\\mathrm{pul}}$'],
+                'tex'                 : ['$V_{\\mathrm{at}}^{\\ell}$', '$V_{\\mathrm{v}}^{\\ell}$', '$V_{\\mathrm{at}}^{r}$', '$V_{\\mathrm{v}}^{r}$', '$V_{\\mathrm{ar}}^{\\mathrm{sys}}$', '$V_{\\mathrm{ar,peri}}^{\\mathrm{sys}}$', '$V_{\\mathrm{ven,spl}}^{\\mathrm{sys}}$', '$V_{\\mathrm{ven,espl}}^{\\mathrm{sys}}$', '$V_{\\mathrm{ven,msc}}^{\\mathrm{sys}}$', '$V_{\\mathrm{ven,cer}}^{\\mathrm{sys}}$', '$V_{\\mathrm{ven,cor}}^{\\mathrm{sys}}$', '$V_{\\mathrm{ven}}^{\\mathrm{sys}}$', '$V_{\\mathrm{ar}}^{\\mathrm{pul}}$', '$V_{\\mathrm{cap}}^{\\mathrm{pul}}$', '$V_{\\mathrm{ven}}^{\\mathrm{pul}}$'],
                 'lines'               : [1, 2, 16, 17, 3, 4, 10, 11, 12, 13, 14, 15, 18, 19, 20]})
 
     # all volumes summed up for conservation check
     groups[5]['vol_time_compart'].append('V_all')
-    groups[5]['tex'].append('$\\\sum V$')
+    groups[5]['tex'].append('$\\sum V$')
     groups[5]['lines'].append(99)
 
     # pv loops are only considered for the last cycle
@@ -687,29 +687,29 @@ def postprocess_groups_syspulcap(groups, indpertaftercyl=0, multiscalegandr=Fals
         if multiscalegandr:
             # index 6
             groups.append({'pres_vol_v_l_r_PERIODIC'  : ['pV_v_l_gandr', 'pV_v_r_gandr', 'pV_v_l_last', 'pV_v_r_last', 'pV_v_l_baseline', 'pV_v_r_baseline'],
-                        'tex'                      : ['$p_{\\\mathrm{v}}^{\\\ell,\\\mathrm{G\\&R}}$', '$p_{\\\mathrm{v}}^{r,\\\mathrm{G\\&R}}$', '$p_{\\\mathrm{v}}^{\\\ell}$', '$p_{\\\mathrm{v}}^{r}$', '$p_{\\\mathrm{v}}^{\\\ell,\\\mathrm{ref}}$', '$p_{\\\mathrm{v}}^{r,\\\mathrm{ref}}$'],
+                        'tex'                      : ['$p_{\\mathrm{v}}^{\\ell,\\mathrm{G\\&R}}$', '$p_{\\mathrm{v}}^{r,\\mathrm{G\\&R}}$', '$p_{\\mathrm{v}}^{\\ell}$', '$p_{\\mathrm{v}}^{r}$', '$p_{\\mathrm{v}}^{\\ell,\\mathrm{ref}}$', '$p_{\\mathrm{v}}^{r,\\mathrm{ref}}$'],
                         'lines'                    : [21, 22, 102, 117, 97, 98]})
             # index 7
             groups.append({'pres_vol_at_l_r_PERIODIC' : ['pV_at_l_gandr', 'pV_at_r_gandr', 'pV_at_l_last', 'pV_at_r_last', 'pV_at_l_baseline', 'pV_at_r_baseline'],
-                        'tex'                      : ['$p_{\\\mathrm{at}}^{\\\ell,\\\mathrm{G\\&R}}$', '$p_{\\\mathrm{at}}^{r,\\\mathrm{G\\&R}}$', '$p_{\\\mathrm{at}}^{\\\ell}$', '$p_{\\\mathrm{at}}^{r}$', '$p_{\\\mathrm{at}}^{\\\ell,\\\mathrm{ref}}$', '$p_{\\\mathrm{at}}^{r,\\\mathrm{ref}}$'],
+                        'tex'                      : ['$p_{\\mathrm{at}}^{\\ell,\\mathrm{G\\&R}}$', '$p_{\\mathrm{at}}^{r,\\mathrm{G\\&R}}$', '$p_{\\mathrm{at}}^{\\ell}$', '$p_{\\mathrm{at}}^{r}$', '$p_{\\mathrm{at}}^{\\ell,\\mathrm{ref}}$', '$p_{\\mathrm{at}}^{r,\\mathrm{ref}}$'],
                         'lines'                    : [23, 24, 101, 116, 97, 98]})
         else:
             # index 6
             groups.append({'pres_vol_v_l_r_PERIODIC'  : ['pV_v_l_last', 'pV_v_r_last', 'pV_v_l_baseline', 'pV_v_r_baseline'],
-                        'tex'                      : ['$p_{\\\mathrm{v}}^{\\\ell}$', '$p_{\\\mathrm{v}}^{r}$', '$p_{\\\mathrm{v}}^{\\\ell,\\\mathrm{ref}}$', '$p_{\\\mathrm{v}}^{r,\\\mathrm{ref}}$'],
+                        'tex'                      : ['$p_{\\mathrm{v}}^{\\ell}$', '$p_{\\mathrm{v}}^{r}$', '$p_{\\mathrm{v}}^{\\ell,\\mathrm{ref}}$', '$p_{\\mathrm{v}}^{r,\\mathrm{ref}}$'],
                         'lines'                    : [2, 17, 97, 98]})
             # index 7
             groups.append({'pres_vol_at_l_r_PERIODIC' : ['pV_at_l_last', 'pV_at_r_last', 'pV_at_l_baseline', 'pV_at_r_baseline'],
-                        'tex'                      : ['$p_{\\\mathrm{at}}^{\\\ell}$', '$p_{\\\mathrm{at}}^{r}$', '$p_{\\\mathrm{at}}^{\\\ell,\\\mathrm{ref}}$', '$p_{\\\mathrm{at}}^{r,\\\mathrm{ref}}$'],
+                        'tex'                      : ['$p_{\\mathrm{at}}^{\\ell}$', '$p_{\\mathrm{at}}^{r}$', '$p_{\\mathrm{at}}^{\\ell,\\mathrm{ref}}$', '$p_{\\mathrm{at}}^{r,\\mathrm{ref}}$'],
                         'lines'                    : [1, 16, 97, 98]})
     else:
         # index 6
         groups.append({'pres_vol_v_l_r_PERIODIC'  : ['pV_v_l_last', 'pV_v_r_last'],
-                       'tex'                      : ['$p_{\\\mathrm{v}}^{\\\ell}$', '$p_{\\\mathrm{v}}^{r}$'],
+                       'tex'                      : ['$p_{\\mathrm{v}}^{\\ell}$', '$p_{\\mathrm{v}}^{r}$'],
                        'lines'                    : [2, 17]})
         # index 7
         groups.append({'pres_vol_at_l_r_PERIODIC' : ['pV_at_l_last', 'pV_at_r_last'],
-                       'tex'                      : ['$p_{\\\mathrm{at}}^{\\\ell}$', '$p_{\\\mathrm{at}}^{r}$'],
+                       'tex'                      : ['$p_{\\mathrm{at}}^{\\ell}$', '$p_{\\mathrm{at}}^{r}$'],
                        'lines'                    : [1, 16]})
     
     
@@ -1231,32 +1231,32 @@ def postprocess_groups_syspulcapcor(groups, coronarymodel=None, indpertaftercyl=
     
     # index 0
     groups.append({'pres_time_sys_l'  : ['p_at_l', 'p_v_l', 'p_ar_sys', 'p_arperi_sys', 'p_venspl_sys', 'p_venespl_sys', 'p_venmsc_sys', 'p_vencer_sys', 'p_vencor_sys', 'p_ven_sys'],
-                'tex'                 : ['$p_{\\\mathrm{at}}^{\\\ell}$', '$p_{\\\mathrm{v}}^{\\\ell}$', '$p_{\\\mathrm{ar}}^{\\\mathrm{sys}}$', '$p_{\\\mathrm{ar,peri}}^{\\\mathrm{sys}}$', '$p_{\\\mathrm{ven,spl}}^{\\\mathrm{sys}}$', '$p_{\\\mathrm{ven,espl}}^{\\\mathrm{sys}}$', '$p_{\\\mathrm{ven,msc}}^{\\\mathrm{sys}}$', '$p_{\\\mathrm{ven,cer}}^{\\\mathrm{sys}}$', '$p_{\\\mathrm{ven,cor}}^{\\\mathrm{sys}}$', '$p_{\\\mathrm{ven}}^{\\\mathrm{sys}}$'],
+                'tex'                 : ['$p_{\\mathrm{at}}^{\\ell}$', '$p_{\\mathrm{v}}^{\\ell}$', '$p_{\\mathrm{ar}}^{\\mathrm{sys}}$', '$p_{\\mathrm{ar,peri}}^{\\mathrm{sys}}$', '$p_{\\mathrm{ven,spl}}^{\\mathrm{sys}}$', '$p_{\\mathrm{ven,espl}}^{\\mathrm{sys}}$', '$p_{\\mathrm{ven,msc}}^{\\mathrm{sys}}$', '$p_{\\mathrm{ven,cer}}^{\\mathrm{sys}}$', '$p_{\\mathrm{ven,cor}}^{\\mathrm{sys}}$', '$p_{\\mathrm{ven}}^{\\mathrm{sys}}$'],
                 'lines'               : [1, 2, 3, 4, 10, 11, 12, 13, 14, 15]})
     # index 1
     groups.append({'pres_time_pul_r'  : ['p_at_r', 'p_v_r', 'p_ar_pul', 'p_cap_pul', 'p_ven_pul'],
-                'tex'                 : ['$p_{\\\mathrm{at}}^{r}$', '$p_{\\\mathrm{v}}^{r}$', '$p_{\\\mathrm{ar}}^{\\\mathrm{pul}}$', '$p_{\\\mathrm{cap}}^{\\\mathrm{pul}}$', '$p_{\\\mathrm{ven}}^{\\\mathrm{pul}}$'],
+                'tex'                 : ['$p_{\\mathrm{at}}^{r}$', '$p_{\\mathrm{v}}^{r}$', '$p_{\\mathrm{ar}}^{\\mathrm{pul}}$', '$p_{\\mathrm{cap}}^{\\mathrm{pul}}$', '$p_{\\mathrm{ven}}^{\\mathrm{pul}}$'],
                 'lines'               : [16, 17, 18, 19, 20]})
     # index 2
     groups.append({'flux_time_sys_l'  : ['q_vin_l', 'q_vout_l', 'q_ar_sys', 'q_arspl_sys', 'q_arespl_sys', 'q_armsc_sys', 'q_arcer_sys', 'q_arcor_sys', 'q_venspl_sys', 'q_venespl_sys', 'q_venmsc_sys', 'q_vencer_sys', 'q_ven1_sys', 'q_ven2_sys'],
-                'tex'                 : ['$q_{\\\mathrm{v,in}}^{\\\ell}$', '$q_{\\\mathrm{v,out}}^{\\\ell}$', '$q_{\\\mathrm{ar}}^{\\\mathrm{sys}}$', '$q_{\\\mathrm{ar,spl}}^{\\\mathrm{sys}}$', '$q_{\\\mathrm{ar,espl}}^{\\\mathrm{sys}}$', '$q_{\\\mathrm{ar,msc}}^{\\\mathrm{sys}}$', '$q_{\\\mathrm{ar,cer}}^{\\\mathrm{sys}}$', '$q_{\\\mathrm{ar,cor}}^{\\\mathrm{sys}}$', '$q_{\\\mathrm{ven,spl}}^{\\\mathrm{sys}}$', '$q_{\\\mathrm{ven,espl}}^{\\\mathrm{sys}}$', '$q_{\\\mathrm{ven,msc}}^{\\\mathrm{sys}}$', '$q_{\\\mathrm{ven,cer}}^{\\\mathrm{sys}}$', '$q_{\\\mathrm{ven,1}}^{\\\mathrm{sys}}$', '$q_{\\\mathrm{ven,2}}^{\\\mathrm{sys}}$'],
+                'tex'                 : ['$q_{\\mathrm{v,in}}^{\\ell}$', '$q_{\\mathrm{v,out}}^{\\ell}$', '$q_{\\mathrm{ar}}^{\\mathrm{sys}}$', '$q_{\\mathrm{ar,spl}}^{\\mathrm{sys}}$', '$q_{\\mathrm{ar,espl}}^{\\mathrm{sys}}$', '$q_{\\mathrm{ar,msc}}^{\\mathrm{sys}}$', '$q_{\\mathrm{ar,cer}}^{\\mathrm{sys}}$', '$q_{\\mathrm{ar,cor}}^{\\mathrm{sys}}$', '$q_{\\mathrm{ven,spl}}^{\\mathrm{sys}}$', '$q_{\\mathrm{ven,espl}}^{\\mathrm{sys}}$', '$q_{\\mathrm{ven,msc}}^{\\mathrm{sys}}$', '$q_{\\mathrm{ven,cer}}^{\\mathrm{sys}}$', '$q_{\\mathrm{ven,1}}^{\\mathrm{sys}}$', '$q_{\\mathrm{ven,2}}^{\\mathrm{sys}}$'],
                 'lines'               : [1, 2, 3, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15]})
     # index 3
     groups.append({'flux_time_pul_r'  : ['q_vin_r', 'q_vout_r', 'q_ar_pul', 'q_cap_pul', 'q_ven1_pul', 'q_ven2_pul', 'q_ven3_pul', 'q_ven4_pul'],
-                'tex'                 : ['$q_{\\\mathrm{v,in}}^{r}$', '$q_{\\\mathrm{v,out}}^{r}$', '$q_{\\\mathrm{ar}}^{\\\mathrm{pul}}$', '$q_{\\\mathrm{cap}}^{\\\mathrm{pul}}$', '$q_{\\\mathrm{ven,1}}^{\\\mathrm{pul}}$', '$q_{\\\mathrm{ven,2}}^{\\\mathrm{pul}}$', '$q_{\\\mathrm{ven,3}}^{\\\mathrm{pul}}$', '$q_{\\\mathrm{ven,4}}^{\\\mathrm{pul}}$'],
+                'tex'                 : ['$q_{\\mathrm{v,in}}^{r}$', '$q_{\\mathrm{v,out}}^{r}$', '$q_{\\mathrm{ar}}^{\\mathrm{pul}}$', '$q_{\\mathrm{cap}}^{\\mathrm{pul}}$', '$q_{\\mathrm{ven,1}}^{\\mathrm{pul}}$', '$q_{\\mathrm{ven,2}}^{\\mathrm{pul}}$', '$q_{\\mathrm{ven,3}}^{\\mathrm{pul}}$', '$q_{\\mathrm{ven,4}}^{\\mathrm{pul}}$'],
                 'lines'               : [16, 17, 18, 19, 20, 201, 202, 203]})
     # index 4
     groups.append({'vol_time_l_r'     : ['V_at_l', 'V_v_l', 'V_at_r', 'V_v_r'],
-                'tex'                 : ['$V_{\\\mathrm{at}}^{\\\ell}$', '$V_{\\\mathrm{v}}^{\\\ell}$', '$V_{\\\mathrm{at}}^{r}$', '$V_{\\\mathrm{v}}^{r}$'],
+                'tex'                 : ['$V_{\\mathrm{at}}^{\\ell}$', '$V_{\\mathrm{v}}^{\\ell}$', '$V_{\\mathrm{at}}^{r}$', '$V_{\\mathrm{v}}^{r}$'],
                 'lines'               : [1, 2, 16, 17]})
     # index 5
     groups.append({'vol_time_compart' : ['V_at_l', 'V_v_l', 'V_at_r', 'V_v_r', 'V_ar_sys', 'V_arcor_sys', 'V_arperi_sys', 'V_venspl_sys', 'V_venespl_sys', 'V_venmsc_sys', 'V_vencer_sys', 'V_vencor_sys', 'V_ven_sys', 'V_ar_pul', 'V_cap_pul', 'V_ven_pul'],
-                'tex'                 : ['$V_{\\\mathrm{at}}^{\\\ell}$', '$V_{\\\mathrm{v}}^{\\\ell}$', '$V_{\\\mathrm{at}}^{r}$', '$V_{\\\mathrm{v}}^{r}$', '$V_{\\\mathrm{ar}}^{\\\mathrm{sys}}$', '$V_{\\\mathrm{ar,cor}}^{\\\mathrm{sys}}$', '$V_{\\\mathrm{ar,peri}}^{\\\mathrm{sys}}$', '$V_{\\\mathrm{ven,spl}}^{\\\mathrm{sys}}$', '$V_{\\\mathrm{ven,espl}}^{\\\mathrm{sys}}$', '$V_{\\\mathrm{ven,msc}}^{\\\mathrm{sys}}$', '$V_{\\\mathrm{ven,cer}}^{\\\mathrm{sys}}$', '$V_{\\\mathrm{ven,cor}}^{\\\mathrm{sys}}$', '$V_{\\\mathrm{ven}}^{\\\mathrm{sys}}$', '$V_{\\\mathrm{ar}}^{\\\mathrm{pul}}$', '$V_{\\\mathrm{cap}}^{\\\mathrm{pul}}$', '$V_{\\\mathrm{ven}}^{\\\mathrm{pul}}$'],
+                'tex'                 : ['$V_{\\mathrm{at}}^{\\ell}$', '$V_{\\mathrm{v}}^{\\ell}$', '$V_{\\mathrm{at}}^{r}$', '$V_{\\mathrm{v}}^{r}$', '$V_{\\mathrm{ar}}^{\\mathrm{sys}}$', '$V_{\\mathrm{ar,cor}}^{\\mathrm{sys}}$', '$V_{\\mathrm{ar,peri}}^{\\mathrm{sys}}$', '$V_{\\mathrm{ven,spl}}^{\\mathrm{sys}}$', '$V_{\\mathrm{ven,espl}}^{\\mathrm{sys}}$', '$V_{\\mathrm{ven,msc}}^{\\mathrm{sys}}$', '$V_{\\mathrm{ven,cer}}^{\\mathrm{sys}}$', '$V_{\\mathrm{ven,cor}}^{\\mathrm{sys}}$', '$V_{\\mathrm{ven}}^{\\mathrm{sys}}$', '$V_{\\mathrm{ar}}^{\\mathrm{pul}}$', '$V_{\\mathrm{cap}}^{\\mathrm{pul}}$', '$V_{\\mathrm{ven}}^{\\mathrm{pul}}$'],
                 'lines'               : [1, 2, 16, 17, 3, 9, 4, 10, 11, 12, 13, 14, 15, 18, 19, 20]})
     
     # all volumes summed up for conservation check
     groups[5]['vol_time_compart'].append('V_all')
-    groups[5]['tex'].append('$\\\sum V$')
+    groups[5]['tex'].append('$\\sum V$')
     groups[5]['lines'].append(99)
     
     # pv loops are only considered for the last cycle
@@ -1265,29 +1265,29 @@ def postprocess_groups_syspulcapcor(groups, coronarymodel=None, indpertaftercyl=
         if multiscalegandr:
             # index 6
             groups.append({'pres_vol_v_l_r_PERIODIC'  : ['pV_v_l_gandr', 'pV_v_r_gandr', 'pV_v_l_last', 'pV_v_r_last', 'pV_v_l_baseline', 'pV_v_r_baseline'],
-                        'tex'                      : ['$p_{\\\mathrm{v}}^{\\\ell,\\\mathrm{G\\&R}}$', '$p_{\\\mathrm{v}}^{r,\\\mathrm{G\\&R}}$', '$p_{\\\mathrm{v}}^{\\\ell}$', '$p_{\\\mathrm{v}}^{r}$', '$p_{\\\mathrm{v}}^{\\\ell,\\\mathrm{ref}}$', '$p_{\\\mathrm{v}}^{r,\\\mathrm{ref}}$'],
+                        'tex'                      : ['$p_{\\mathrm{v}}^{\\ell,\\mathrm{G\\&R}}$', '$p_{\\mathrm{v}}^{r,\\mathrm{G\\&R}}$', '$p_{\\mathrm{v}}^{\\ell}$', '$p_{\\mathrm{v}}^{r}$', '$p_{\\mathrm{v}}^{\\ell,\\mathrm{ref}}$', '$p_{\\mathrm{v}}^{r,\\mathrm{ref}}$'],
                         'lines'                    : [21, 22, 102, 117, 97, 98]})
             # index 7
             groups.append({'pres_vol_at_l_r_PERIODIC' : ['pV_at_l_gandr', 'pV_at_r_gandr', 'pV_at_l_last', 'pV_at_r_last', 'pV_at_l_baseline', 'pV_at_r_baseline'],
-                        'tex'                      : ['$p_{\\\mathrm{at}}^{\\\ell,\\\mathrm{G\\&R}}$', '$p_{\\\mathrm{at}}^{r,\\\mathrm{G\\&R}}$', '$p_{\\\mathrm{at}}^{\\\ell}$', '$p_{\\\mathrm{at}}^{r}$', '$p_{\\\mathrm{at}}^{\\\ell,\\\mathrm{ref}}$', '$p_{\\\mathrm{at}}^{r,\\\mathrm{ref}}$'],
+                        'tex'                      : ['$p_{\\mathrm{at}}^{\\ell,\\mathrm{G\\&R}}$', '$p_{\\mathrm{at}}^{r,\\mathrm{G\\&R}}$', '$p_{\\mathrm{at}}^{\\ell}$', '$p_{\\mathrm{at}}^{r}$', '$p_{\\mathrm{at}}^{\\ell,\\mathrm{ref}}$', '$p_{\\mathrm{at}}^{r,\\mathrm{ref}}$'],
                         'lines'                    : [23, 24, 101, 116, 97, 98]})
         else:
             # index 6
             groups.append({'pres_vol_v_l_r_PERIODIC'  : ['pV_v_l_last', 'pV_v_r_last', 'pV_v_l_baseline', 'pV_v_r_baseline'],
-                        'tex'                      : ['$p_{\\\mathrm{v}}^{\\\ell}$', '$p_{\\\mathrm{v}}^{r}$', '$p_{\\\mathrm{v}}^{\\\ell,\\\mathrm{ref}}$', '$p_{\\\mathrm{v}}^{r,\\\mathrm{ref}}$'],
+                        'tex'                      : ['$p_{\\mathrm{v}}^{\\ell}$', '$p_{\\mathrm{v}}^{r}$', '$p_{\\mathrm{v}}^{\\ell,\\mathrm{ref}}$', '$p_{\\mathrm{v}}^{r,\\mathrm{ref}}$'],
                         'lines'                    : [2, 17, 97, 98]})
             # index 7
             groups.append({'pres_vol_at_l_r_PERIODIC' : ['pV_at_l_last', 'pV_at_r_last', 'pV_at_l_baseline', 'pV_at_r_baseline'],
-                        'tex'                      : ['$p_{\\\mathrm{at}}^{\\\ell}$', '$p_{\\\mathrm{at}}^{r}$', '$p_{\\\mathrm{at}}^{\\\ell,\\\mathrm{ref}}$', '$p_{\\\mathrm{at}}^{r,\\\mathrm{ref}}$'],
+                        'tex'                      : ['$p_{\\mathrm{at}}^{\\ell}$', '$p_{\\mathrm{at}}^{r}$', '$p_{\\mathrm{at}}^{\\ell,\\mathrm{ref}}$', '$p_{\\mathrm{at}}^{r,\\mathrm{ref}}$'],
                         'lines'                    : [1, 16, 97, 98]})
     else:
         # index 6
         groups.append({'pres_vol_v_l_r_PERIODIC'  : ['pV_v_l_last', 'pV_v_r_last'],
-                       'tex'                      : ['$p_{\\\mathrm{v}}^{\\\ell}$', '$p_{\\\mathrm{v}}^{r}$'],
+                       'tex'                      : ['$p_{\\mathrm{v}}^{\\ell}$', '$p_{\\mathrm{v}}^{r}$'],
                        'lines'                    : [2, 17]})
         # index 7
         groups.append({'pres_vol_at_l_r_PERIODIC' : ['pV_at_l_last', 'pV_at_r_last'],
-                       'tex'                      : ['$p_{\\\mathrm{at}}^{\\\ell}$', '$p_{\\\mathrm{at}}^{r}$'],
+                       'tex'                      : ['$p_{\\mathrm{at}}^{\\ell}$', '$p_{\\mathrm{at}}^{r}$'],
                        'lines'                    : [1, 16]})
     
     
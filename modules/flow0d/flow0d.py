@@ -137,6 +137,13 @@ class Flow0DProblem(problem_base):
         # initialize flow0d time-integration class
         self.ti = timeintegration.timeintegration_flow0d(time_params, time_curves, self.t_init, comm=self.comm)
 
+        # activation/elastance curves of the chambers, resolved once in the order of the y list
+        self.activation_curves = []
+        if bool(self.chamber_models):
+            for ch in ['lv','rv','la','ra']:
+                if self.chamber_models[ch]['type']=='0D_elast': self.activation_curves.append(self.ti.timecurves(self.chamber_models[ch]['activation_curve']))
+                if self.chamber_models[ch]['type']=='0D_elast_prescr': self.activation_curves.append(self.ti.timecurves(self.chamber_models[ch]['elastance_curve']))
+
         if initial_file:
             initialconditions = self.cardvasc0D.set_initial_from_file(initial_file)
         else:
@@ -208,15 +215,8 @@ class Flow0DProblem(problem_base):
     def evaluate_activation(self, t):
         
         # activation curves
-        if bool(self.chamber_models):
-            ci=0
-            for ch in ['lv','rv','la','ra']:
-                if self.chamber_models[ch]['type']=='0D_elast': 
-                    self.y[ci] = self.ti.timecurves(self.chamber_models[ch]['activation_curve'])(t)
-                    ci+=1
-                if self.chamber_models[ch]['type']=='0D_elast_prescr': 
-                    self.y[ci] = self.ti.timecurves(self.chamber_models[ch]['elastance_curve'])(t)
-                    ci+=1
+        for ci, curve in enumerate(self.activation_curves):
+            self.y[ci] = curve(t)
 
 
     def induce_perturbation(self):
@@ -263,10 +263,8 @@ class Flow0DSolver():
             self.pb.c = []
             self.pb.c.append(self.pb.ti.timecurves(self.pb.excitation_curve)(self.pb.t_init))
         if bool(self.pb.chamber_models):
-            self.pb.y = []
+            self.pb.y = [curve(self.pb.t_init) for curve in self.pb.activation_curves]
             for ch in ['lv','rv','la','ra']:
-                if self.pb.chamber_models[ch]['type']=='0D_elast': self.pb.y.append(self.pb.ti.timecurves(self.pb.chamber_models[ch]['activation_curve'])(self.pb.t_init))
-                if self.pb.chamber_models[ch]['type']=='0D_elast_prescr': self.pb.y.append(self.pb.ti.timecurves(self.pb.chamber_models[ch]['elastance_curve'])(self.pb.t_init))
                 if self.pb.chamber_models[ch]['type']=='0D_prescr': self.pb.c.append(self.pb.ti.timecurves(self.pb.chamber_models[ch]['prescribed_curve'])(self.pb.t_init))
 
         self.pb.cardvasc0D.evaluate(self.pb.s_old, self.pb.t_init, self.pb.df_old, self.pb.f_old, None, None, self.pb.c, self.pb.y, self.pb.aux_old)
@@ -327,6 +325,9 @@ class Flow0DSolver():
                     sys.stdout.flush()
                 break
             
+        # close 0D result files
+        self.pb.cardvasc0D.close_output()
+
         if self.pb.comm.rank == 0: # only proc 0 should print this
             print('Program complete. Time for computation: %.4f s (= %.2f min)' % ( time.time()-start, (time.time()-start)/60. ))
             sys.stdout.flush()
@@ -52,6 +52,12 @@ class FluidmechanicsProblem(problem_base):
         self.order_pres = fem_params['order_pres']
         self.quad_degree = fem_params['quad_degree']
         
+        # compiler flags for the form kernels (if any)
+        self.jit_params = utilities.jit_params_from_fem_params(fem_params)
+        # form compiler (FFCx) parameters for the tangent stiffness kernel, which dominates the assembly cost (e.g. {'table_rtol' : 1e-6})
+        try: self.form_compiler_params_jac = fem_params['form_compiler_params_jac']
+        except: self.form_compiler_params_jac = {}
+        
         # collect domain data
         self.dx_, self.rho = [], []
         for n in range(self.num_domains):
@@ -66,16 +72,10 @@ class FluidmechanicsProblem(problem_base):
         self.p11 = ufl.as_ufl(0) # can't think of a fluid case with non-zero 11-block in system matrix...
     
         # type of discontinuous function spaces
-        if str(self.io.mesh.ufl_cell()) == 'tetrahedron' or str(self.io.mesh.ufl_cell()) == 'triangle3D':
-            dg_type = "DG"
-            if (self.order_vel > 1 or self.order_pres > 1) and self.quad_degree < 3:
-                raise ValueError("Use at least a quadrature degree of 3 or more for higher-order meshes!")
-        elif str(self.io.mesh.ufl_cell()) == 'hexahedron' or str(self.io.mesh.ufl_cell()) == 'quadrilateral3D':
-            dg_type = "DQ"
-            if (self.order_vel > 1 or self.order_pres > 1) and self.quad_degree < 5:
-                raise ValueError("Use at least a quadrature degree of 5 or more for higher-order meshes!")
-        else:
-            raise NameError("Unknown cell/element type!")
+        try: dg_type, quad_degree_min_ho, _ = utilities.dg_cell_types[str(self.io.mesh.ufl_cell())]
+        except: raise NameError("Unknown cell/element type!")
+        if (self.order_vel > 1 or self.order_pres > 1) and self.quad_degree < quad_degree_min_ho:
+            raise ValueError("Use at least a quadrature degree of "+str(quad_degree_min_ho)+" or more for higher-order meshes!")
 
         # check if we want to use model order reduction and if yes, initialize MOR class
         try: self.have_rom = io_params['use_model_order_red']
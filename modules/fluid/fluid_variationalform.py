@@ -20,6 +20,9 @@ class variationalform:
         self.dp = dp
         
         self.n = n
+        
+        # virtual rate of deformation - same for all internal virtual power terms, hence built only once
+        self.var_gamma = 0.5*(ufl.grad(self.var_v).T + ufl.grad(self.var_v))
     
     ### Kinetic virtual power
     
@@ -37,8 +40,7 @@ class variationalform:
     def deltaP_int(self, sig, ddomain):
         
         # TeX: \int\limits_{\Omega}\boldsymbol{\sigma} : \delta \boldsymbol{\gamma}\,\mathrm{d}v
-        var_gamma = 0.5*(ufl.grad(self.var_v).T + ufl.grad(self.var_v))
-        return ufl.inner(sig, var_gamma)*ddomain
+        return ufl.inner(sig, self.var_gamma)*ddomain
 
     def deltaP_int_pres(self, v, ddomain):
         # TeX: \int\limits_{\Omega}\mathrm{div}\boldsymbol{v}\,\delta p\,\mathrm{d}v
@@ -58,7 +60,7 @@ class variationalform:
     
     def f_viscous(self, sig):
         
-        return ufl.div(dev(sig))
+        return ufl.div(ufl.dev(sig))
 
     ### External virtual power
     
@@ -6,16 +6,35 @@
 # This source code is licensed under the BSD-style license found in the
 # LICENSE file in the root directory of this source tree.
 
-import sys
+import sys, os
 import numpy as np
 from petsc4py import PETSc
 from dolfinx import fem, io
 import ufl
 
-from projection import project
+try: from scipy.spatial import cKDTree # optional: fast coordinate matching
+except ImportError: cKDTree = None
+
+try: import pandas as pd # optional: fast parsing of text data files
+except ImportError: pd = None
+
+from projection import project, projector
 from mpiroutines import allgather_vec
 
 
+# read a whitespace-separated text data file to a 2D array - with pandas' C parser if available
+def loadtxt(datafile):
+    if pd is not None:
+        return pd.read_csv(datafile, header=None, sep=r'\s+', comment='#', dtype=np.float64).to_numpy()
+    else:
+        return np.loadtxt(datafile, ndmin=2)
+
+
+# mask of points (rows of pts) inside the box [lo, hi]
+def in_bbox(pts, lo, hi):
+    return np.all((pts >= lo) & (pts <= hi), axis=1)
+
+
 class IO:
     
     def __init__(self, io_params, comm):
@@ -33,6 +52,19 @@ class IO:
         try: self.write_restart_every = io_params['write_restart_every']
         except: self.write_restart_every = -1
         
+        # if results should be readable during the simulation: re-open the result files every this many output steps
+        try: self.flush_results_every = io_params['flush_results_every']
+        except: self.flush_results_every = -1
+        
+        # solid mechanics results: 'XDMF' (one HDF5 dataset per field and step, XML index re-written each step), or
+        # 'VTX' (ADIOS2 .bp files, steps are appended to the same variables, needs dolfinx with ADIOS2)
+        try: self.results_format = io_params['results_format']
+        except: self.results_format = 'XDMF'
+        
+        # 'MPIIO': one binary file per vector (also used as snapshot input for model order reduction), 'MPIIO_onefile' or 'HDF5': one file per checkpoint step
+        try: self.checkpoint_type = io_params['checkpoint_type']
+        except: self.checkpoint_type = 'MPIIO'
+        
         try: self.meshfile_type = io_params['meshfile_type']
         except: self.meshfile_type = 'ASCII'
 
@@ -42,6 +74,8 @@ class IO:
         try: self.gridname_boundary = io_params['gridname_boundary']
         except: self.gridname_boundary = 'Grid'
         
+        self.projectors = {} # projectors of the output fields (set up at first output)
+        
         self.comm = comm
 
 
@@ -49,6 +83,9 @@ class IO:
 
         if self.meshfile_type=='ASCII':
             encoding = io.XDMFFile.Encoding.ASCII
+            if self.comm.size > 1 and self.comm.rank == 0:
+                print("Warning: ASCII mesh files are not read in parallel, consider converting your mesh to HDF5 encoding (e.g. with meshio) and setting meshfile_type to 'HDF5'!")
+                sys.stdout.flush()
         elif self.meshfile_type=='HDF5':
             encoding = io.XDMFFile.Encoding.HDF5
         else:
@@ -70,40 +107,46 @@ class IO:
         
         if self.mesh.topology.dim == 3:
             
+            # boundary file is opened only once for all boundary tags
             try:
-                self.mesh.topology.create_connectivity(2, self.mesh.topology.dim)
                 with io.XDMFFile(self.comm, self.mesh_boundary, 'r', encoding=encoding) as infile:
-                    self.mt_b1 = infile.read_meshtags(self.mesh, name=self.gridname_boundary)
-            except:
-                pass
-            
-            try:
-                self.mesh.topology.create_connectivity(1, self.mesh.topology.dim)
-                with io.XDMFFile(self.comm, self.mesh_boundary, 'r', encoding=encoding) as infile:
-                    self.mt_b2 = infile.read_meshtags(self.mesh, name=self.gridname_boundary+'_b2')
-            except:
-                pass
-
-            try:
-                self.mesh.topology.create_connectivity(0, self.mesh.topology.dim)
-                with io.XDMFFile(self.comm, self.mesh_boundary, 'r', encoding=encoding) as infile:
-                    self.mt_b3 = infile.read_meshtags(self.mesh, name=self.gridname_boundary+'_b3')
+                    
+                    try:
+                        self.mesh.topology.create_connectivity(2, self.mesh.topology.dim)
+                        self.mt_b1 = infile.read_meshtags(self.mesh, name=self.gridname_boundary)
+                    except:
+                        pass
+                    
+                    try:
+                        self.mesh.topology.create_connectivity(1, self.mesh.topology.dim)
+                        self.mt_b2 = infile.read_meshtags(self.mesh, name=self.gridname_boundary+'_b2')
+                    except:
+                        pass
+
+                    try:
+                        self.mesh.topology.create_connectivity(0, self.mesh.topology.dim)
+                        self.mt_b3 = infile.read_meshtags(self.mesh, name=self.gridname_boundary+'_b3')
+                    except:
+                        pass
             except:
                 pass
 
         elif self.mesh.topology.dim == 2:
             
             try:
-                self.mesh.topology.create_connectivity(1, self.mesh.topology.dim)
-                with io.XDMFFile(self.comm, self.mesh_boundary, 'r', encoding=encoding) as infile:
-                    self.mt_b1 = infile.read_meshtags(self.mesh, name=self.gridname_boundary)
-            except:
-                pass
-            
-            try:
-                self.mesh.topology.create_connectivity(0, self.mesh.topology.dim)
                 with io.XDMFFile(self.comm, self.mesh_boundary, 'r', encoding=encoding) as infile:
-                    self.mt_b2 = infile.read_meshtags(self.mesh, name=self.gridname_boundary+'_b2')
+                    
+                    try:
+                        self.mesh.topology.create_connectivity(1, self.mesh.topology.dim)
+                        self.mt_b1 = infile.read_meshtags(self.mesh, name=self.gridname_boundary)
+                    except:
+                        pass
+                    
+                    try:
+                        self.mesh.topology.create_connectivity(0, self.mesh.topology.dim)
+                        self.mt_b2 = infile.read_meshtags(self.mesh, name=self.gridname_boundary+'_b2')
+                    except:
+                        pass
             except:
                 pass
 
@@ -118,16 +161,141 @@ class IO:
         self.h0 = ufl.CellDiameter(self.mesh)
 
 
+    # results written to an XDMF file are only guaranteed to be complete on disk once the file is closed, so close
+    # the result files and continue writing to them in append mode
+    def flush_output(self, pb, N):
+        
+        if self.flush_results_every > 0 and N % self.flush_results_every == 0:
+            
+            for res in self.resultsfiles:
+                self.resultsfiles[res].close()
+                self.resultsfiles[res] = io.XDMFFile(self.comm, self.output_path+'/results_'+pb.simname+'_'+res+'.xdmf', 'a')
+
+
+    # vecs is a dict of functions and their checkpoint names
+    # It seems that a vector written by n processors is loaded wrongly by m != n processors! So, we have to restart with the same number of cores,
+    # and for safety reasons, include the number of cores in the file name
+    def write_checkpoint_vecs(self, vecs, pb, N):
+        
+        if self.checkpoint_type == 'MPIIO':
+            for f in vecs:
+                viewer = PETSc.Viewer().createMPIIO(self.output_path+'/checkpoint_'+pb.simname+'_'+vecs[f]+'_'+str(N)+'_'+str(self.comm.size)+'proc.dat', 'w', self.comm)
+                f.vector.view(viewer)
+                viewer.destroy()
+        elif self.checkpoint_type == 'MPIIO_onefile': # all vectors in sequence in one binary file, their names in an index file
+            viewer = PETSc.Viewer().createMPIIO(self.output_path+'/checkpoint_'+pb.simname+'_'+str(N)+'_'+str(self.comm.size)+'proc.dat', 'w', self.comm)
+            for f in vecs:
+                f.vector.view(viewer)
+            viewer.destroy()
+            if self.comm.rank == 0:
+                with open(self.output_path+'/checkpoint_'+pb.simname+'_'+str(N)+'_'+str(self.comm.size)+'proc.txt', 'w') as fi:
+                    for f in vecs: fi.write(vecs[f]+'\n')
+        elif self.checkpoint_type == 'HDF5': # one file holding all vectors as datasets, so only one file is opened per step
+            viewer = PETSc.Viewer().createHDF5(self.output_path+'/checkpoint_'+pb.simname+'_'+str(N)+'_'+str(self.comm.size)+'proc.h5', 'w', self.comm)
+            for f in vecs:
+                f.vector.setName(vecs[f])
+                f.vector.view(viewer)
+            viewer.destroy()
+        else:
+            raise NameError('Choose either MPIIO, MPIIO_onefile, or HDF5 as checkpoint_type!')
+
+
+    def read_checkpoint_vecs(self, vecs, pb, N_rest):
+        
+        if self.checkpoint_type == 'MPIIO':
+            for f in vecs:
+                viewer = PETSc.Viewer().createMPIIO(self.output_path+'/checkpoint_'+pb.simname+'_'+vecs[f]+'_'+str(N_rest)+'_'+str(self.comm.size)+'proc.dat', 'r', self.comm)
+                f.vector.load(viewer)
+                f.vector.ghostUpdate(addv=PETSc.InsertMode.INSERT, mode=PETSc.ScatterMode.FORWARD)
+                viewer.destroy()
+        elif self.checkpoint_type == 'MPIIO_onefile':
+            with open(self.output_path+'/checkpoint_'+pb.simname+'_'+str(N_rest)+'_'+str(self.comm.size)+'proc.txt', 'r') as fi:
+                names = fi.read().split()
+            viewer = PETSc.Viewer().createMPIIO(self.output_path+'/checkpoint_'+pb.simname+'_'+str(N_rest)+'_'+str(self.comm.size)+'proc.dat', 'r', self.comm)
+            # vectors have to be read in the order written, each into all functions requesting it (or into a dummy vector if none does)
+            for name in names:
+                funcs = [f for f in vecs if vecs[f] == name]
+                if funcs:
+                    funcs[0].vector.load(viewer)
+                    for f in funcs[1:]: funcs[0].vector.copy(f.vector)
+                    for f in funcs: f.vector.ghostUpdate(addv=PETSc.InsertMode.INSERT, mode=PETSc.ScatterMode.FORWARD)
+                else:
+                    PETSc.Vec().create(self.comm).load(viewer)
+            viewer.destroy()
+        elif self.checkpoint_type == 'HDF5':
+            viewer = PETSc.Viewer().createHDF5(self.output_path+'/checkpoint_'+pb.simname+'_'+str(N_rest)+'_'+str(self.comm.size)+'proc.h5', 'r', self.comm)
+            for f in vecs:
+                f.vector.setName(vecs[f])
+                f.vector.load(viewer)
+                f.vector.ghostUpdate(addv=PETSc.InsertMode.INSERT, mode=PETSc.ScatterMode.FORWARD)
+            viewer.destroy()
+        else:
+            raise NameError('Choose either MPIIO, MPIIO_onefile, or HDF5 as checkpoint_type!')
+
+
+
+# expression builders for the solid outputs - lists are per domain
+def cauchystress_funcs(pb):
+    return [pb.ma[n].sigma(pb.u,pb.p,ivar=pb.internalvars,rvar=pb.ratevars) for n in range(pb.num_domains)]
+
+def trmandelstress_funcs(pb):
+    return [ufl.tr(pb.ma[n].M(pb.u,pb.p,ivar=pb.internalvars,rvar=pb.ratevars)) for n in range(pb.num_domains)]
+
+def trmandelstress_e_funcs(pb):
+    return [ufl.tr(pb.ma[n].M_e(pb.u,pb.p,pb.ki.C(pb.u),ivar=pb.internalvars,rvar=pb.ratevars)) if pb.mat_growth[n] else ufl.as_ufl(0) for n in range(pb.num_domains)]
+
+def vonmises_cauchystress_funcs(pb):
+    return [pb.ma[n].sigma_vonmises(pb.u,pb.p,ivar=pb.internalvars,rvar=pb.ratevars) for n in range(pb.num_domains)]
+
+def pk1stress_funcs(pb):
+    return [pb.ma[n].P(pb.u,pb.p,ivar=pb.internalvars,rvar=pb.ratevars) for n in range(pb.num_domains)]
+
+def pk2stress_funcs(pb):
+    return [pb.ma[n].S(pb.u,pb.p,ivar=pb.internalvars,rvar=pb.ratevars) for n in range(pb.num_domains)]
+
+def fiberstretch_e_funcs(pb):
+    return [pb.ma[n].fibstretch_e(pb.ki.C(pb.u),pb.theta,pb.fib_func[0]) if pb.mat_growth[n] else ufl.as_ufl(0) for n in range(pb.num_domains)]
+
+def phi_remod_funcs(pb):
+    return [pb.ma[n].phi_remod(pb.theta) if pb.mat_remodel[n] else ufl.as_ufl(0) for n in range(pb.num_domains)]
+
+# solid outputs: expression builder, function space to project to (None if already a function), name of the projected function, constant over time
+solid_outputs = {'displacement'          : (lambda pb: pb.u, None, None, False),
+                 'velocity'              : (lambda pb: pb.vel, 'V_u', 'Velocity', False), # passed in v is not a function but form, so we have to project
+                 'acceleration'          : (lambda pb: pb.acc, 'V_u', 'Acceleration', False), # passed in a is not a function but form, so we have to project
+                 'pressure'              : (lambda pb: pb.p, None, None, False),
+                 'cauchystress'          : (cauchystress_funcs, 'Vd_tensor', 'CauchyStress', False),
+                 'cauchystress_nodal'    : (cauchystress_funcs, 'V_tensor', 'CauchyStress_nodal', False),
+                 'trmandelstress'        : (trmandelstress_funcs, 'Vd_scalar', 'trMandelStress', False),
+                 'trmandelstress_e'      : (trmandelstress_e_funcs, 'Vd_scalar', 'trMandelStress_e', False),
+                 'vonmises_cauchystress' : (vonmises_cauchystress_funcs, 'Vd_scalar', 'vonMises_CauchyStress', False),
+                 'pk1stress'             : (pk1stress_funcs, 'Vd_tensor', 'PK1Stress', False),
+                 'pk2stress'             : (pk2stress_funcs, 'Vd_tensor', 'PK2Stress', False),
+                 'jacobian'              : (lambda pb: pb.ki.J(pb.u), 'Vd_scalar', 'Jacobian', False),
+                 'glstrain'              : (lambda pb: pb.ki.E(pb.u), 'Vd_tensor', 'GreenLagrangeStrain', False),
+                 'eastrain'              : (lambda pb: pb.ki.e(pb.u), 'Vd_tensor', 'EulerAlmansiStrain', False),
+                 'fiberstretch'          : (lambda pb: pb.ki.fibstretch(pb.u,pb.fib_func[0]), 'Vd_scalar', 'FiberStretch', False),
+                 'fiberstretch_e'        : (fiberstretch_e_funcs, 'Vd_scalar', 'FiberStretch_e', False),
+                 'theta'                 : (lambda pb: pb.theta, None, None, False),
+                 'phi_remod'             : (phi_remod_funcs, 'Vd_scalar', 'phiRemodel', False),
+                 'tau_a'                 : (lambda pb: pb.tau_a, None, None, False),
+                 'fiber1'                : (lambda pb: pb.fib_func[0], 'Vd_vector', 'Fiber1', True), # fibers do not change over time
+                 'fiber2'                : (lambda pb: pb.fib_func[1], 'Vd_vector', 'Fiber2', True)}
+
 
 class IO_solid(IO):
 
     # read in fibers defined at nodes (nodal fiber and coordiante files have to be present)
     def readin_fibers(self, fibarray, V_fib, dx_):
 
+        # first entry of fiber_data holds the input type and the fiber files
+        fkey = next(iter(self.fiber_data))
+        fvals = self.fiber_data[fkey]
+
         # V_fib_input is function space the fiber vector is defined on (only CG1 or DG0 supported, add further depending on your input...)
-        if list(self.fiber_data.keys())[0] == 'nodal':
+        if fkey == 'nodal':
             V_fib_input = fem.VectorFunctionSpace(self.mesh, ("CG", 1))
-        elif list(self.fiber_data.keys())[0] == 'elemental':
+        elif fkey == 'elemental':
             V_fib_input = fem.VectorFunctionSpace(self.mesh, ("DG", 0))
         else:
             raise AttributeError("Specify 'nodal' or 'elemental' for the fiber data input!")
@@ -138,15 +306,19 @@ class IO_solid(IO):
         fib_func = []
         fib_func_input = []
 
-        si = 0
-        for s in fibarray:
+        for si, s in enumerate(fibarray):
             
             fib_func_input.append(fem.Function(V_fib_input, name='Fiber'+str(si+1)+'_input'))
             
-            self.readfunction(fib_func_input[si], V_fib_input, list(self.fiber_data.values())[0][si], normalize=True, tol=readin_tol)
-
-            # project to output fiber function space
-            ff = project(fib_func_input[si], V_fib, dx_, bcs=[], nm='fib_'+s+'')
+            self.readfunction(fib_func_input[si], V_fib_input, fvals[si], normalize=True, tol=readin_tol)
+
+            # to output fiber function space - interpolation (pointwise, no global system) reproduces the L2 projection if the input
+            # space is contained in V_fib, or for CG1 to DG0 on simplices (cell average of a linear function = its midpoint value)
+            if fkey == 'elemental' or V_fib.ufl_element().degree() > 0 or self.mesh.ufl_cell().cellname() in ['triangle','tetrahedron']:
+                ff = fem.Function(V_fib, name='fib_'+s+'')
+                ff.interpolate(fib_func_input[si])
+            else:
+                ff = project(fib_func_input[si], V_fib, dx_, bcs=[], nm='fib_'+s+'')
             
             # assure that projected field still has unit length (not always necessarily the case)
             fib_func.append(ff / ufl.sqrt(ufl.dot(ff,ff)))
@@ -156,8 +328,6 @@ class IO_solid(IO):
             #outfile.write_mesh(self.mesh)
             #outfile.write_function(fib_func_input[si])
 
-            si+=1
-
         return fib_func
 
 
@@ -166,42 +336,83 @@ class IO_solid(IO):
         # block size of vector
         bs = f.vector.getBlockSize()
         
-        # load data and coordinates
-        data = np.loadtxt(datafile,usecols=(np.arange(0,bs)),ndmin=2)
-        coords = np.loadtxt(datafile,usecols=(-3,-2,-1)) # last three always are the coordinates
+        # load data and coordinates - binary NumPy files (.npy) with the same layout can be used, too
+        if datafile.endswith('.npy'):
+            npyfile = datafile
+        else:
+            # a text file is converted only once (by rank 0) to a binary copy next to it, which is then only memory-mapped by all
+            # processes, so that just the rows that are actually accessed are read to memory
+            npyfile = datafile+'.npy'
+            if self.comm.rank == 0:
+                if not os.path.isfile(npyfile) or os.path.getmtime(npyfile) < os.path.getmtime(datafile):
+                    try:
+                        with open(npyfile+'.tmp', 'wb') as fh: np.save(fh, loadtxt(datafile))
+                        os.replace(npyfile+'.tmp', npyfile)
+                    except OSError: # e.g. no write permission in the input directory
+                        pass
+            self.comm.Barrier()
         
+        if os.path.isfile(npyfile) and os.path.getmtime(npyfile) >= os.path.getmtime(datafile):
+            raw = np.load(npyfile, mmap_mode='r')
+        else:
+            raw = loadtxt(datafile)
+        
+        # only the owned nodes are set, the ghosts are updated from their owners in the end
+        size_local = V.dofmap.index_map.size_local
+
         # new node coordinates (dofs might be re-ordered in parallel)
         # in case of DG fields, these are the Gauss point coordinates
-        co = V.tabulate_dof_coordinates()
+        co = V.tabulate_dof_coordinates()[:size_local]
+        
+        # bounding box of owned dof coordinates (enlarged by the tolerance) - data rows outside cannot match
+        if len(co): bbox = (co.min(axis=0)-tol, co.max(axis=0)+tol)
+        else:       bbox = (np.full(3, np.inf), np.full(3, -np.inf))
+        
+        # in parallel, each process only reads its block of rows and sends them to the processes whose bounding box contains
+        # their coordinates, in serial, the rows outside the bounding box are dropped
+        if self.comm.size > 1:
+            bboxes = self.comm.allgather(bbox)
+            r0, r1 = len(raw)*self.comm.rank//self.comm.size, len(raw)*(self.comm.rank+1)//self.comm.size
+            block = np.asarray(raw[r0:r1])
+            raw = np.concatenate(self.comm.alltoall([block[in_bbox(block[:,-3:], lo, hi)] for lo, hi in bboxes]))
+        else:
+            raw = raw[in_bbox(raw[:,-3:], *bbox)]
+        
+        data = raw[:,:bs]
+        coords = raw[:,-3:] # last three always are the coordinates
 
-        # index map
+        # index map - owned nodes are numbered contiguously in the global numbering
         #im = V.dofmap.index_map.global_indices() # function seems to have gone!
-        im = np.asarray(V.dofmap.index_map.local_to_global(np.arange(V.dofmap.index_map.size_local + V.dofmap.index_map.num_ghosts, dtype=np.int32)), dtype=PETSc.IntType)
+        im = np.arange(*V.dofmap.index_map.local_range, dtype=PETSc.IntType)
 
         tolerance = int(-np.log10(tol))
 
         # since in parallel, the ordering of the dof ids might change, so we have to find the
-        # mapping between original and new id via the coordinates
-        ci = 0
-        for i in im:
-            
-            ind = np.where((np.round(coords,tolerance) == np.round(co[ci],tolerance)).all(axis=1))[0]
-            
-            # only write if we've found the index
-            if len(ind):
-                
-                if normalize:
-                    norm_sq = 0.
-                    for j in range(bs):
-                        norm_sq += data[ind[0],j]**2.
-                    norm = np.sqrt(norm_sq)
-                else:
-                    norm = 1.
-                
-                for j in range(bs):
-                    f.vector[bs*i+j] = data[ind[0],j] / norm
-            
-            ci+=1
+        # mapping between original and new id via the coordinates - index of the data row for each dof (-1 if not found)
+        if cKDTree is not None:
+            # nearest-neighbor search of all dof coordinates at once, only accepting points within the tolerance
+            dist, ind = cKDTree(coords).query(co, distance_upper_bound=tol)
+            ind_data = np.where(np.isfinite(dist), ind, -1)
+        else:
+            # coordinates rounded to the tolerance are compared exactly, as integers on the 10^-tolerance grid, via a hash table
+            # of the input coordinates (first occurrence of each point)
+            qcoords = np.rint(coords*10.**tolerance).astype(np.int64)
+            qco = np.rint(co*10.**tolerance).astype(np.int64)
+            lookup = {}
+            for k, pt in enumerate(map(tuple, qcoords)): lookup.setdefault(pt, k)
+            ind_data = np.array([lookup.get(pt, -1) for pt in map(tuple, qco)], dtype=int)
+
+        # only write if we've found the index
+        found = ind_data >= 0
+        
+        vals = np.array(data[ind_data[found]], dtype=PETSc.ScalarType)
+        
+        if normalize:
+            vals /= np.linalg.norm(vals, axis=1, keepdims=True)
+
+        # insert all values with one call (global dof indices bs*i+j of nodes i)
+        ind_vec = (bs*im[found,np.newaxis] + np.arange(bs, dtype=PETSc.IntType)).ravel()
+        f.vector.setValues(ind_vec, vals.ravel(), addv=PETSc.InsertMode.INSERT)
 
         f.vector.assemble()
         
@@ -216,10 +427,12 @@ class IO_solid(IO):
             if self.write_results_every > 0:
             
                 self.resultsfiles = {}
-                for res in self.results_to_write:
-                    outfile = io.XDMFFile(self.comm, self.output_path+'/results_'+pb.simname+'_'+res+'.xdmf', 'w')
-                    outfile.write_mesh(self.mesh)
-                    self.resultsfiles[res] = outfile
+                # VTX writers are bound to their function, so they are created at first output
+                if self.results_format == 'XDMF':
+                    for res in self.results_to_write:
+                        outfile = io.XDMFFile(self.comm, self.output_path+'/results_'+pb.simname+'_'+res+'.xdmf', 'w')
+                        outfile.write_mesh(self.mesh)
+                        self.resultsfiles[res] = outfile
                 
             return
         
@@ -228,100 +441,42 @@ class IO_solid(IO):
             # write results every write_results_every steps
             if self.write_results_every > 0 and N % self.write_results_every == 0:
                 
+                exprs = {} # expressions of outputs to be set up, by builder (outputs may share them)
+                
                 # save solution to XDMF format
                 for res in self.results_to_write:
                     
-                    if res=='displacement':
-                        self.resultsfiles[res].write_function(pb.u, t)
-                    elif res=='velocity': # passed in v is not a function but form, so we have to project
-                        v_proj = project(pb.vel, pb.V_u, pb.dx_, nm="Velocity")
-                        self.resultsfiles[res].write_function(v_proj, t)
-                    elif res=='acceleration': # passed in a is not a function but form, so we have to project
-                        a_proj = project(pb.acc, pb.V_u, pb.dx_, nm="Acceleration")
-                        self.resultsfiles[res].write_function(a_proj, t)
-                    elif res=='pressure':
-                        self.resultsfiles[res].write_function(pb.p, t)
-                    elif res=='cauchystress':
-                        stressfuncs=[]
-                        for n in range(pb.num_domains):
-                            stressfuncs.append(pb.ma[n].sigma(pb.u,pb.p,ivar=pb.internalvars,rvar=pb.ratevars))
-                        cauchystress = project(stressfuncs, pb.Vd_tensor, pb.dx_, nm="CauchyStress")
-                        self.resultsfiles[res].write_function(cauchystress, t)
-                    elif res=='cauchystress_nodal':
-                        stressfuncs=[]
-                        for n in range(pb.num_domains):
-                            stressfuncs.append(pb.ma[n].sigma(pb.u,pb.p,ivar=pb.internalvars,rvar=pb.ratevars))
-                        cauchystress_nodal = project(stressfuncs, pb.V_tensor, pb.dx_, nm="CauchyStress_nodal")
-                        self.resultsfiles[res].write_function(cauchystress_nodal, t)
-                    elif res=='trmandelstress':
-                        stressfuncs=[]
-                        for n in range(pb.num_domains):
-                            stressfuncs.append(tr(pb.ma[n].M(pb.u,pb.p,ivar=pb.internalvars,rvar=pb.ratevars)))
-                        trmandelstress = project(stressfuncs, pb.Vd_scalar, pb.dx_, nm="trMandelStress")
-                        self.resultsfiles[res].write_function(trmandelstress, t)
-                    elif res=='trmandelstress_e':
-                        stressfuncs=[]
-                        for n in range(pb.num_domains):
-                            if pb.mat_growth[n]: stressfuncs.append(tr(pb.ma[n].M_e(pb.u,pb.p,pb.ki.C(pb.u),ivar=pb.internalvars,rvar=pb.ratevars)))
-                            else: stressfuncs.append(as_ufl(0))
-                        trmandelstress_e = project(stressfuncs, pb.Vd_scalar, pb.dx_, nm="trMandelStress_e")
-                        self.resultsfiles[res].write_function(trmandelstress_e, t)
-                    elif res=='vonmises_cauchystress':
-                        stressfuncs=[]
-                        for n in range(pb.num_domains):
-                            stressfuncs.append(pb.ma[n].sigma_vonmises(pb.u,pb.p,ivar=pb.internalvars,rvar=pb.ratevars))
-                        vonmises_cauchystress = project(stressfuncs, pb.Vd_scalar, pb.dx_, nm="vonMises_CauchyStress")
-                        self.resultsfiles[res].write_function(vonmises_cauchystress, t)
-                    elif res=='pk1stress':
-                        stressfuncs=[]
-                        for n in range(pb.num_domains):
-                            stressfuncs.append(pb.ma[n].P(pb.u,pb.p,ivar=pb.internalvars,rvar=pb.ratevars))
-                        pk1stress = project(stressfuncs, pb.Vd_tensor, pb.dx_, nm="PK1Stress")
-                        self.resultsfiles[res].write_function(pk1stress, t)
-                    elif res=='pk2stress':
-                        stressfuncs=[]
-                        for n in range(pb.num_domains):
-                            stressfuncs.append(pb.ma[n].S(pb.u,pb.p,ivar=pb.internalvars,rvar=pb.ratevars))
-                        pk2stress = project(stressfuncs, pb.Vd_tensor, pb.dx_, nm="PK2Stress")
-                        self.resultsfiles[res].write_function(pk2stress, t)
-                    elif res=='jacobian':
-                        jacobian = project(pb.ki.J(pb.u), pb.Vd_scalar, pb.dx_, nm="Jacobian")
-                        self.resultsfiles[res].write_function(jacobian, t)
-                    elif res=='glstrain':
-                        glstrain = project(pb.ki.E(pb.u), pb.Vd_tensor, pb.dx_, nm="GreenLagrangeStrain")
-                        self.resultsfiles[res].write_function(glstrain, t)
-                    elif res=='eastrain':
-                        eastrain = project(pb.ki.e(pb.u), pb.Vd_tensor, pb.dx_, nm="EulerAlmansiStrain")
-                        self.resultsfiles[res].write_function(eastrain, t)
-                    elif res=='fiberstretch':
-                        fiberstretch = project(pb.ki.fibstretch(pb.u,pb.fib_func[0]), pb.Vd_scalar, pb.dx_, nm="FiberStretch")
-                        self.resultsfiles[res].write_function(fiberstretch, t)
-                    elif res=='fiberstretch_e':
-                        stretchfuncs=[]
-                        for n in range(pb.num_domains):
-                            if pb.mat_growth[n]: stretchfuncs.append(pb.ma[n].fibstretch_e(pb.ki.C(pb.u),pb.theta,pb.fib_func[0]))
-                            else: stretchfuncs.append(as_ufl(0))
-                        fiberstretch_e = project(stretchfuncs, pb.Vd_scalar, pb.dx_, nm="FiberStretch_e")
-                        self.resultsfiles[res].write_function(fiberstretch_e, t)
-                    elif res=='theta':
-                        self.resultsfiles[res].write_function(pb.theta, t)
-                    elif res=='phi_remod':
-                        phifuncs=[]
-                        for n in range(pb.num_domains):
-                            if pb.mat_remodel[n]: phifuncs.append(pb.ma[n].phi_remod(pb.theta))
-                            else: phifuncs.append(as_ufl(0))
-                        phiremod = project(phifuncs, pb.Vd_scalar, pb.dx_, nm="phiRemodel")
-                        self.resultsfiles[res].write_function(phiremod, t)
-                    elif res=='tau_a':
-                        self.resultsfiles[res].write_function(pb.tau_a, t)
-                    elif res=='fiber1':
-                        fiber1 = project(pb.fib_func[0], pb.Vd_vector, pb.dx_, nm="Fiber1")
-                        self.resultsfiles[res].write_function(fiber1, t)
-                    elif res=='fiber2':
-                        fiber2 = project(pb.fib_func[1], pb.Vd_vector, pb.dx_, nm="Fiber2")
-                        self.resultsfiles[res].write_function(fiber2, t)
-                    else:
-                        raise NameError("Unknown output to write for solid mechanics!")
+                    try: builder, space, nm, fixed = solid_outputs[res]
+                    except KeyError: raise NameError("Unknown output to write for solid mechanics!")
+                    
+                    if space is None:
+                        self.write_result(pb, res, builder(pb), t)
+                        continue
+                    
+                    # projections are set up once (persistent function, mass matrix), and fields constant over time are only projected once
+                    if res not in self.projectors:
+                        if builder not in exprs: exprs[builder] = builder(pb)
+                        self.projectors[res] = projector(exprs[builder], getattr(pb, space), pb.dx_, nm=nm)
+                        self.projectors[res]()
+                    elif not fixed:
+                        self.projectors[res]()
+                    
+                    self.write_result(pb, res, self.projectors[res].function, t)
+
+                if self.results_format == 'XDMF': self.flush_output(pb, N)
+
+
+    # write one result field of the step - the output functions have to be persistent for VTX
+    def write_result(self, pb, res, func, t):
+        
+        if self.results_format == 'XDMF':
+            self.resultsfiles[res].write_function(func, t)
+        elif self.results_format == 'VTX':
+            if res not in self.resultsfiles:
+                self.resultsfiles[res] = io.VTXWriter(self.comm, self.output_path+'/results_'+pb.simname+'_'+res+'.bp', [func])
+            self.resultsfiles[res].write(t)
+        else:
+            raise NameError('Choose either XDMF or VTX as results_format!')
 
 
     def write_restart(self, pb, N):
@@ -364,14 +519,7 @@ class IO_solid(IO):
                 if pb.have_frank_starling:
                     vecs_to_read[pb.amp_old_set] = 'amp_old_set'
 
-        for key in vecs_to_read:
-
-            # It seems that a vector written by n processors is loaded wrongly by m != n processors! So, we have to restart with the same number of cores,
-            # and for safety reasons, include the number of cores in the dat file name
-            viewer = PETSc.Viewer().createMPIIO(self.output_path+'/checkpoint_'+pb.simname+'_'+vecs_to_read[key]+'_'+str(N_rest)+'_'+str(self.comm.size)+'proc.dat', 'r', self.comm)
-            key.vector.load(viewer)
-            
-            key.vector.ghostUpdate(addv=PETSc.InsertMode.INSERT, mode=PETSc.ScatterMode.FORWARD)
+        self.read_checkpoint_vecs(vecs_to_read, pb, N_rest)
 
 
     def writecheckpoint(self, pb, N):
@@ -402,13 +550,19 @@ class IO_solid(IO):
                 if pb.have_active_stress:
                     vecs_to_write[pb.amp_old_set] = 'amp_old_set'
 
-        for key in vecs_to_write:
-            
-            # It seems that a vector written by n processors is loaded wrongly by m != n processors! So, we have to restart with the same number of cores,
-            # and for safety reasons, include the number of cores in the dat file name
-            viewer = PETSc.Viewer().createMPIIO(self.output_path+'/checkpoint_'+pb.simname+'_'+vecs_to_write[key]+'_'+str(N)+'_'+str(self.comm.size)+'proc.dat', 'w', self.comm)
-            key.vector.view(viewer)
+        self.write_checkpoint_vecs(vecs_to_write, pb, N)
+
+
 
+def cauchystress_fluid_funcs(pb):
+    return [pb.ma[n].sigma(pb.v,pb.p) for n in range(pb.num_domains)]
+
+# fluid outputs: expression builder, function space to project to (None if already a function), name of the projected function
+fluid_outputs = {'velocity'              : (lambda pb: pb.v, None, None),
+                 'acceleration'          : (lambda pb: pb.acc, 'V_v', 'Acceleration'), # passed in a is not a function but form, so we have to project
+                 'pressure'              : (lambda pb: pb.p, None, None),
+                 'cauchystress'          : (cauchystress_fluid_funcs, 'Vd_tensor', 'CauchyStress'),
+                 'reynolds'              : (lambda pb: pb.Re, 'Vd_scalar', 'Reynolds')}
 
 
 class IO_fluid(IO):
@@ -435,24 +589,21 @@ class IO_fluid(IO):
                 # save solution to XDMF format
                 for res in self.results_to_write:
                     
-                    if res=='velocity':
-                        self.resultsfiles[res].write_function(pb.v, t)
-                    elif res=='acceleration': # passed in a is not a function but form, so we have to project
-                        a_proj = project(pb.acc, pb.V_v, pb.dx_, nm="Acceleration")
-                        self.resultsfiles[res].write_function(a_proj, t)
-                    elif res=='pressure':
-                        self.resultsfiles[res].write_function(pb.p, t)
-                    elif res=='cauchystress':
-                        stressfuncs=[]
-                        for n in range(pb.num_domains):
-                            stressfuncs.append(pb.ma[n].sigma(pb.v,pb.p))
-                        cauchystress = project(stressfuncs, pb.Vd_tensor, pb.dx_, nm="CauchyStress")
-                        self.resultsfiles[res].write_function(cauchystress, t)
-                    elif res=='reynolds':
-                        reynolds = project(re, pb.Vd_scalar, pb.dx_, nm="Reynolds")
-                        self.resultsfiles[res].write_function(reynolds, t)
-                    else:
-                        raise NameError("Unknown output to write for fluid mechanics!")
+                    try: builder, space, nm = fluid_outputs[res]
+                    except KeyError: raise NameError("Unknown output to write for fluid mechanics!")
+                    
+                    if space is None:
+                        self.resultsfiles[res].write_function(builder(pb), t)
+                        continue
+                    
+                    # projections are set up once (persistent function, mass matrix), as for the solid outputs
+                    if res not in self.projectors:
+                        self.projectors[res] = projector(builder(pb), getattr(pb, space), pb.dx_, nm=nm)
+                    self.projectors[res]()
+                    
+                    self.resultsfiles[res].write_function(self.projectors[res].function, t)
+
+                self.flush_output(pb, N)
 
 
     def write_restart(self, pb, N):
@@ -462,34 +613,15 @@ class IO_fluid(IO):
             self.writecheckpoint(pb, N)
 
 
-    def readcheckpoint(self, pb):
+    def readcheckpoint(self, pb, N_rest):
 
-        vecs_to_read = {'v' : pb.v}
-        vecs_to_read = {'p' : pb.p}
-        vecs_to_read = {'v_old' : pb.v_old}
-        vecs_to_read = {'a_old' : pb.a_old}
-        vecs_to_read = {'p_old' : pb.p_old}
+        vecs_to_read = {pb.v : 'v', pb.p : 'p', pb.v_old : 'v_old', pb.a_old : 'a_old', pb.p_old : 'p_old'}
         
-        for key in vecs_to_read:
-
-            # It seems that a vector written by n processors is loaded wrongly by m != n processors! So, we have to restart with the same number of cores,
-            # and for safety reasons, include the number of cores in the dat file name
-            viewer = PETSc.Viewer().createMPIIO(self.output_path+'/checkpoint_'+pb.simname+'_'+key+'_'+str(self.restart_step)+'_'+str(self.comm.size)+'proc.dat', 'r', self.comm)
-            vecs_to_read[key].vector.load(viewer)
-            
-            vecs_to_read[key].vector.ghostUpdate(addv=PETSc.InsertMode.INSERT, mode=PETSc.ScatterMode.FORWARD)
+        self.read_checkpoint_vecs(vecs_to_read, pb, N_rest)
 
 
     def writecheckpoint(self, pb, N):
 
-        vecs_to_write = {'v' : pb.v}
-        vecs_to_write = {'p' : pb.p}
-        vecs_to_write = {'v_old' : pb.v_old}
-        vecs_to_write = {'a_old' : pb.a_old}
-        vecs_to_write = {'p_old' : pb.p_old}
+        vecs_to_write = {pb.v : 'v', pb.p : 'p', pb.v_old : 'v_old', pb.a_old : 'a_old', pb.p_old : 'p_old'}
         
-        for key in vecs_to_write:
-
-            # It seems that a vector written by n processors is loaded wrongly by m != n processors! So, we have to restart with the same number of cores,
-            # and for safety reasons, include the number of cores in the dat file name
-            viewer = PETSc.Viewer().createMPIIO(self.output_path+'/checkpoint_'+pb.simname+'_'+key+'_'+str(N)+'_'+str(self.comm.size)+'proc.dat', 'w', self.comm)
+        self.write_checkpoint_vecs(vecs_to_write, pb, N)
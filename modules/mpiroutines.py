@@ -35,8 +35,7 @@ def allgather_vec(var, comm):
     
     var_tmp, var_all = np.zeros(var.getSize()), np.zeros(var.getSize())
         
-    for i in range(vs,ve):
-        var_tmp[i] = var[i]
+    var_tmp[vs:ve] = var.getArray(readonly=True)
             
     var_arr = comm.allgather(var_tmp)
 
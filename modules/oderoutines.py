@@ -10,6 +10,12 @@ import sys, time
 import numpy as np
 import sympy as sp
 
+try: import symengine as se # optional, for fast differentiation and (LLVM-)compiled lambdification of the expressions
+except ImportError: se = None
+
+try: import numba # optional, for JIT-compiling the lambdified expressions
+except ImportError: numba = None
+
 from mpiroutines import allgather_vec, allgather_vec_entry
 
 
@@ -17,7 +23,11 @@ class ode:
     
     def __init__(self, init=True, comm=None):
         self.init = init # for output
+        self.outfiles = {} # result files kept open over the simulation (only on rank 0), line-buffered, so that each step is on disk right away
+        self.gathervec, self.gatherstate = None, None # last gathered state vector
         self.varmap, self.auxmap = {}, {} # maps for primary and auxiliary variables
+        self.pars_, self.pars = {}, np.array([]) # symbolic model parameters and their values (see symbolic_parameter)
+        self.csr_written = {} # sparsity pattern last inserted into each (PETSc) stiffness matrix
         if comm is not None: self.comm = comm # MPI communicator
        
     
@@ -25,49 +35,132 @@ class ode:
     def evaluate(self, x, t, df=None, f=None, dK=None, K=None, c=[], y=[], a=None, fnc=[]):
 
         if isinstance(x, np.ndarray): x_sq = x
-        else: x_sq = allgather_vec(x, self.comm)
+        else: x_sq = self.gather_state(x)
+
+        # re-use results of a previous call with identical arguments (e.g. repeated evaluations within one nonlinear iteration)
+        evalkey = (x_sq.tobytes(), tuple(c), t, tuple(fnc))
+        if evalkey != self.evalkey: self.evalkey, self.evalcache = evalkey, {}
 
         # ODE lhs (time derivative) residual part df
         if df is not None:
-            
-            for i in range(self.numdof):
-                df[i] = self.df__[i](x_sq, c, t, fnc)
+            self.set_vector_values(df, self.evaluate_cached('df', self.df__, x_sq, c, t, fnc).ravel())
             
         # ODE rhs residual part f 
         if f is not None:
-            
-            for i in range(self.numdof):
-                f[i] = self.f__[i](x_sq, c, t, fnc)
+            self.set_vector_values(f, self.evaluate_cached('f', self.f__, x_sq, c, t, fnc).ravel())
 
         # ODE lhs (time derivative) stiffness part dK (ddf/dx)
         if dK is not None:
-            
-            for i in range(self.numdof):
-                for j in range(self.numdof):
-                    dK[i,j] = self.dK__[i][j](x_sq, c, t, fnc)
+            self.set_stiffness_values(dK, self.dK_csr, self.evaluate_cached('dK', self.dK__, x_sq, c, t, fnc).ravel())
 
         # ODE rhs stiffness part K (df/dx)
         if K is not None:
-            
-            for i in range(self.numdof):
-                for j in range(self.numdof):
-                    K[i,j] = self.K__[i][j](x_sq, c, t, fnc)
+            self.set_stiffness_values(K, self.K_csr, self.evaluate_cached('K', self.K__, x_sq, c, t, fnc).ravel())
 
         # auxiliary variable vector a (for post-processing or periodic state check)
         if a is not None:
-            
-            for i in range(self.numdof):
-                a[i] = self.a__[i](x_sq, c, t, fnc)
+            a[:self.numdof] = self.evaluate_cached('a', self.a__, x_sq, c, t, fnc).ravel()
+
+
+    # gather parallel PETSc state vector - re-uses the previously gathered values if it is the same vector and it has not been
+    # modified since (PETSc increases the object state with every modification)
+    def gather_state(self, x):
+        
+        state = x.stateGet()
+        
+        if x is not self.gathervec or state != self.gatherstate:
+            self.x_sq = allgather_vec(x, self.comm)
+            self.gathervec, self.gatherstate = x, state
+        
+        return self.x_sq
+
+
+    # call lambdified function, or return its value cached for the current arguments
+    def evaluate_cached(self, name, func, x, c, t, fnc):
+        
+        if name not in self.evalcache:
+            self.evalcache[name] = func(x, c, t, fnc)
+        
+        return self.evalcache[name]
+
+
+    # insert values into a (PETSc or NumPy) vector - for PETSc, each process only sets its own range, so nothing has
+    # to be communicated upon assembly
+    def set_vector_values(self, v, vals):
+        
+        if isinstance(v, np.ndarray):
+            v[:self.numdof] = vals
+        else:
+            vs, ve = v.getOwnershipRange()
+            v[vs:ve] = vals[vs:ve]
+
+
+    # insert the nonzero stiffness values (in CSR order) into a (PETSc or NumPy) matrix - for PETSc, only the locally owned rows
+    # entries outside the pattern are not overwritten, so a NumPy matrix is zeroed first, and a PETSc matrix is cleared before
+    # the values of a new pattern (e.g. after the stiffness has been re-set) are inserted
+    def set_stiffness_values(self, K, csr, vals):
+        
+        indptr, indices = csr
+        
+        if isinstance(K, np.ndarray):
+            K[:self.numdof,:self.numdof] = 0.
+            K[np.repeat(np.arange(self.numdof), np.diff(indptr)), indices] = vals
+        else:
+            if self.csr_written.get(K.handle) is not csr:
+                if K.isAssembled(): K.zeroEntries()
+                self.csr_written[K.handle] = csr
+            # one insertion of all owned rows (setValuesCSR takes the row pointers of the local rows, starting at the first owned row)
+            rs, re = K.getOwnershipRange()
+            K.setValuesCSR(indptr[rs:re+1]-indptr[rs], indices[indptr[rs]:indptr[re]], vals[indptr[rs]:indptr[re]])
 
 
     # symbolic stiffness matrix contributions ddf_/dx, df_/dx
     def set_stiffness(self):
         
+        self.dK_, self.K_ = None, None
+        
+        # with SymEngine, the stiffness matrices are kept as SymEngine matrices (converted back only if needed for lambdification)
+        if se is not None:
+            try:
+                dK_ = se.Matrix(self.df_).jacobian(se.Matrix(self.x_))
+                K_  = se.Matrix(self.f_).jacobian(se.Matrix(self.x_))
+                # SymEngine leaves derivatives it cannot evaluate (e.g. of Min/Max) unevaluated
+                if not dK_.atoms(se.Derivative) and not K_.atoms(se.Derivative):
+                    self.dK_, self.K_ = dK_, K_
+            except Exception: # expression not supported by SymEngine
+                pass
+        
+        if self.dK_ is None:
+            self.dK_ = sp.Matrix(self.df_).jacobian(self.x_)
+            self.K_  = sp.Matrix(self.f_).jacobian(self.x_)
+        
+        # most entries are identically zero, so only the nonzero ones are lambdified and evaluated (new objects, so that
+        # set_stiffness_values recognizes a changed pattern)
+        self.dK_csr, self.K_csr = self.sparsity_pattern(self.dK_), self.sparsity_pattern(self.K_)
+
+
+    # sparsity pattern (CSR row pointers and column indices) of a symbolic matrix
+    def sparsity_pattern(self, M):
+        
+        indptr, indices = [0], []
+        
         for i in range(self.numdof):
             for j in range(self.numdof):
+                if M[i,j] != 0: indices.append(j)
+            indptr.append(len(indices))
         
-                self.dK_[i][j] = sp.diff(self.df_[i],self.x_[j])
-                self.K_[i][j]  = sp.diff(self.f_[i],self.x_[j])
+        return np.array(indptr, dtype=int), np.array(indices, dtype=int)
+
+
+    # column vector of the nonzero entries (in CSR order) of a symbolic matrix
+    def nonzero_entries(self, M, csr):
+        
+        indptr, indices = csr
+        
+        entries = [M[i,j] for i in range(self.numdof) for j in indices[indptr[i]:indptr[i+1]]]
+        
+        if isinstance(M, sp.MatrixBase): return sp.Matrix(len(entries), 1, entries)
+        else:                            return se.Matrix(len(entries), 1, entries)
 
 
     # make Lambda functions out of symbolic Sympy expressions
@@ -79,10 +172,10 @@ class ode:
         
         ts = time.time()
 
-        for i in range(self.numdof):
-            self.df__[i] = sp.lambdify([self.x_, self.c_, self.t_, self.fnc_], self.df_[i], 'numpy')
-            self.f__[i] = sp.lambdify([self.x_, self.c_, self.t_, self.fnc_], self.f_[i], 'numpy')
-            self.a__[i] = sp.lambdify([self.x_, self.c_, self.t_, self.fnc_], self.a_[i], 'numpy')     
+        # lambdify whole vectors at once, so that each evaluation is one (vectorized) call instead of one call per dof
+        self.df__ = self.lambdify_expression(sp.Matrix(self.df_))
+        self.f__ = self.lambdify_expression(sp.Matrix(self.f_))
+        self.a__ = self.lambdify_expression(sp.Matrix(self.a_))
         
         te = time.time() - ts
 
@@ -92,18 +185,98 @@ class ode:
 
         ts = time.time()
         
-        for i in range(self.numdof):
-            for j in range(self.numdof):
-                if self.dK_[i][j] is not sp.S.Zero: self.dK__[i][j] = sp.lambdify([self.x_, self.c_, self.t_, self.fnc_], self.dK_[i][j], 'numpy')
-                else:                               self.dK__[i][j] = lambda a, b, c, d : 0
-                if self.K_[i][j] is not sp.S.Zero:  self.K__[i][j] = sp.lambdify([self.x_, self.c_, self.t_, self.fnc_], self.K_[i][j], 'numpy')
-                else:                               self.K__[i][j] = lambda a, b, c, d : 0
+        self.dK__ = self.lambdify_expression(self.nonzero_entries(self.dK_, self.dK_csr))
+        self.K__ = self.lambdify_expression(self.nonzero_entries(self.K_, self.K_csr))
 
         te = time.time() - ts
 
         if self.comm.rank == 0:
             print("Finished lambdify for stiffness expressions, %.4f s" % (te))
             sys.stdout.flush()
+        
+        # (re-)lambdified expressions invalidate any cached evaluations
+        self.evalkey, self.evalcache = None, {}
+        
+        # variable names and indices for output, materialized once from the (now final) maps
+        self.varnames, self.varindices = tuple(self.varmap.keys()), np.fromiter(self.varmap.values(), dtype=np.intp, count=len(self.varmap))
+        self.auxnames, self.auxindices = tuple(self.auxmap.keys()), np.fromiter(self.auxmap.values(), dtype=np.intp, count=len(self.auxmap))
+
+
+    # declare a model parameter as symbolic: it enters the expressions as a symbol, and its value is only passed upon evaluation,
+    # so changing it later (e.g. when inducing a perturbation) does not require to re-set and re-lambdify the expressions
+    def symbolic_parameter(self, name, val):
+        
+        self.pars_[name] = sp.Symbol(name)
+        self.pars = np.append(self.pars, float(val))
+        
+        return self.pars_[name]
+
+
+    # value of a symbolic parameter
+    def get_parameter(self, name):
+        return self.pars[list(self.pars_.keys()).index(name)]
+
+
+    # change the value of a symbolic parameter
+    def set_parameter(self, name, val):
+        
+        self.pars[list(self.pars_.keys()).index(name)] = val
+        
+        # cached evaluations are not valid anymore
+        self.evalkey, self.evalcache = None, {}
+
+
+    # make a function of (x, c, t, fnc) out of a (vector- or matrix-valued) symbolic expression (the current values of the symbolic
+    # parameters are appended to the arguments upon each call): uses SymEngine's Lambdify (LLVM-compiled if supported) or, second
+    # choice, Numba-compiled code lambdified with scalar (math module) arguments and return values - if neither is installed or able
+    # to handle the expression, the plain math-module function is used, and SymPy's NumPy-lambdified function as last resort
+    def lambdify_expression(self, expr):
+        
+        args = list(self.x_) + list(self.c_) + [self.t_] + list(self.fnc_) + list(self.pars_.values())
+        shape = expr.shape
+        
+        # arguments for a trial call
+        x0, c0, t0, fnc0 = np.ones(self.numdof), np.ones(len(self.c_)), 0., np.ones(len(self.fnc_))
+
+        if se is not None:
+            for backend in ['llvm', 'lambda']:
+                try:
+                    func_se = se.Lambdify(args, expr, cse=True, backend=backend)
+                    # results are written into the same output array on every call
+                    out = np.empty(shape)
+                    func = lambda x, c, t, fnc : func_se(np.concatenate((x, c, [t], fnc, self.pars)), out=out)
+                    func(x0, c0, t0, fnc0)
+                    return func
+                except Exception:
+                    pass
+
+        # fallbacks need a SymPy expression
+        if not isinstance(expr, sp.MatrixBase): expr = sp.Matrix(expr)
+
+        # only for vector-valued expressions: compiling returned tuples of large matrices takes excessive time and memory; conditionals
+        # inside the returned tuple cannot be compiled by Numba (and typing these large functions can be very slow, too)
+        if numba is not None and shape[1] == 1 and not expr.has(sp.Piecewise, sp.Heaviside, sp.Min, sp.Max):
+            try:
+                func_jit = numba.njit(error_model='numpy')(sp.lambdify(args, tuple(expr), 'math', cse=True))
+                func = lambda x, c, t, fnc : np.reshape(func_jit(*x, *c, t, *fnc, *self.pars), shape)
+                # trigger compilation
+                func(x0, c0, t0, fnc0)
+                return func
+            except Exception:
+                pass
+
+        # evaluation with scalar arguments is considerably faster on Python floats (math module) than through NumPy
+        if shape[1] == 1:
+            try:
+                func_math = sp.lambdify(args, tuple(expr), 'math', cse=True)
+                func = lambda x, c, t, fnc : np.reshape(func_math(*x, *c, t, *fnc, *self.pars), shape)
+                func(x0, c0, t0, fnc0)
+                return func
+            except Exception: # expression not printable for the math module (e.g. Heaviside)
+                pass
+        
+        func_np = sp.lambdify([self.x_, self.c_, self.t_, self.fnc_, list(self.pars_.values())], expr, 'numpy', cse=True)
+        return lambda x, c, t, fnc : func_np(x, c, t, fnc, self.pars)
             
 
     # set prescribed variable values
@@ -118,20 +291,24 @@ class ode:
 
         # modification of stiffness matrix - all off-columns associated to index_prescribed = 0
         # diagonal entry associated to index_prescribed = 1
-        K[index_prescribed,index_prescribed] = 0.
-        for j in range(self.numdof):
-            if j!=index_prescribed: K[index_prescribed,j] = 0.
+        if isinstance(K, np.ndarray):
+            K[index_prescribed,:] = 0.
+            K[index_prescribed,index_prescribed] = 1.
+        else: # collective, so every process calls it, but only the owner passes the row
+            K.zeroRows([index_prescribed] if index_prescribed in range(xs,xe) else [], diag=1.)
 
 
     # time step update
     def update(self, var, df, f, var_old, df_old, f_old, aux, aux_old):
 
-        if isinstance(var, np.ndarray): vs, ve = 0, len(var)
-        else: vs, ve = var.getOwnershipRange()
-
-        var_old[vs:ve] = var[vs:ve]
-        df_old[vs:ve]  = df[vs:ve]
-        f_old[vs:ve]   = f[vs:ve]
+        if isinstance(var, np.ndarray):
+            var_old[:] = var
+            df_old[:]  = df
+            f_old[:]   = f
+        else: # PETSc vector copies (VecCopy)
+            var.copy(var_old)
+            df.copy(df_old)
+            f.copy(f_old)
 
         # aux vector is always a numpy array
         aux_old[:] = aux[:]
@@ -140,21 +317,25 @@ class ode:
     # midpoint-averaging of state variables (for post-processing)
     def midpoint_avg(self, var, var_old, var_mid, theta):
         
-        if isinstance(var, np.ndarray): vs, ve = 0, len(var)
-        else: vs, ve = var.getOwnershipRange()
-
-        var_mid[vs:ve] = theta*var[vs:ve] + (1.-theta)*var_old[vs:ve]
+        if isinstance(var, np.ndarray):
+            var_mid[:] = theta*var + (1.-theta)*var_old
+        else: # var_mid = theta*var + (1-theta)*var_old with PETSc vector operations
+            var.copy(var_mid)
+            var_mid.axpby(1.-theta, theta, var_old)
 
 
     # set up the dof, coupling quantity, rhs, and stiffness arrays
     def set_solve_arrays(self):
 
-        self.x_, self.a_, self.a__ = [0]*self.numdof, [0]*self.numdof, [0]*self.numdof
+        self.x_, self.a_ = [0]*self.numdof, [0]*self.numdof
         self.c_, self.fnc_ = [], []
         
-        self.df_, self.f_, self.df__, self.f__ = [0]*self.numdof, [0]*self.numdof, [0]*self.numdof, [0]*self.numdof
-        self.dK_,  self.K_  = [[0]*self.numdof for _ in range(self.numdof)], [[0]*self.numdof for _ in range(self.numdof)]
-        self.dK__, self.K__ = [[0]*self.numdof for _ in range(self.numdof)], [[0]*self.numdof for _ in range(self.numdof)]
+        self.df_, self.f_ = [0]*self.numdof, [0]*self.numdof
+        self.dK_,  self.K_  = sp.zeros(self.numdof, self.numdof), sp.zeros(self.numdof, self.numdof)
+        
+        # lambdified (vector- and matrix-valued) functions of the expressions above
+        self.df__, self.f__, self.a__ = None, None, None
+        self.dK__, self.K__ = None, None
 
 
     # output routine for ODE models
@@ -171,23 +352,35 @@ class ode:
 
         if self.comm.rank == 0:
 
-            for i in range(len(self.varmap)):
+            for name, val in zip(self.varnames, var_sq[self.varindices]):
                 
-                filename = path+'/results_'+nm+'_'+list(self.varmap.keys())[i]+'.txt'
-                f = open(filename, mode)
+                filename = path+'/results_'+nm+'_'+name+'.txt'
+                if filename not in self.outfiles: self.outfiles[filename] = open(filename, mode, buffering=1)
                 
-                f.write('%.16E %.16E\n' % (t,var_sq[list(self.varmap.values())[i]]))
-                
-                f.close()
+                self.outfiles[filename].write('%.16E %.16E\n' % (t,val))
 
-            for i in range(len(self.auxmap)):
-                
-                filename = path+'/results_'+nm+'_'+list(self.auxmap.keys())[i]+'.txt'
-                f = open(filename, mode)
+            for name, val in zip(self.auxnames, aux[self.auxindices]):
                 
-                f.write('%.16E %.16E\n' % (t,aux[list(self.auxmap.values())[i]]))
+                filename = path+'/results_'+nm+'_'+name+'.txt'
+                if filename not in self.outfiles: self.outfiles[filename] = open(filename, mode, buffering=1)
                 
-                f.close()
+                self.outfiles[filename].write('%.16E %.16E\n' % (t,val))
+
+
+    # flush buffered output to the result files
+    def flush_output(self):
+        
+        for f in self.outfiles.values():
+            f.flush()
+
+
+    # close all result files (at the end of a simulation)
+    def close_output(self):
+        
+        for f in self.outfiles.values():
+            f.close()
+        
+        self.outfiles = {}
 
 
     # write restart routine for ODE models
@@ -197,21 +390,18 @@ class ode:
         else: var_sq = allgather_vec(var, self.comm)
 
         if self.comm.rank == 0:
+            
+            # results written so far should be on disk consistent with the restart data
+            self.flush_output()
         
             filename = path+'/checkpoint_'+nm+'_'+str(N)+'.txt'
-            f = open(filename, 'wt')
-            
-            for i in range(len(var_sq)):
-                
-                f.write('%.16E\n' % (var_sq[i]))
-                
-            f.close()
+            np.savetxt(filename, var_sq, fmt='%.16E')
 
 
     # read restart routine for ODE models
     def read_restart(self, path, nm, rstep, var):
 
-        restart_data = np.loadtxt(path+'/checkpoint_'+nm+'_'+str(rstep)+'.txt')
+        restart_data = np.loadtxt(path+'/checkpoint_'+nm+'_'+str(rstep)+'.txt', ndmin=1)
 
         var[:] = restart_data[:]
 
@@ -230,10 +420,10 @@ class ode:
             filename2 = path+'/initial_data_'+nm+'_Tend.txt' # conditions at end of cycle
             f2 = open(filename2, 'wt')
             
-            for i in range(len(self.varmap)):
+            for name, val_old, val in zip(self.varnames, varTc_old_sq[self.varindices], varTc_sq[self.varindices]):
                 
-                f1.write('%s %.16E\n' % (list(self.varmap.keys())[i]+'_0',varTc_old_sq[list(self.varmap.values())[i]]))
-                f2.write('%s %.16E\n' % (list(self.varmap.keys())[i]+'_0',varTc_sq[list(self.varmap.values())[i]]))
+                f1.write('%s %.16E\n' % (name+'_0',val_old))
+                f2.write('%s %.16E\n' % (name+'_0',val))
                 
             f1.close()
             f2.close()
@@ -74,7 +74,7 @@ set xrange [__X1S__:__X1E__]
 set yrange [__Y1S__:__Y1E__]
 #__HAVEY2__set y2range [__Y2S__:__Y2E__]
 
-set terminal epslatex standalone dashlength 0.5
+set terminal cairolatex pdf standalone dashlength 0.5 size 5in,3.5in
 set output '__OUTDIR__/__OUTNAME__.tex'
 
 set xlabel '$__X1VALUE__\;[\mathrm{__X1UNIT__}]$' offset 0,0.25
@@ -9,9 +9,31 @@
 import time
 import sys, os, subprocess, time
 import math
+import importlib
+import asyncio
+import concurrent.futures
 from pathlib import Path
 import numpy as np
 
+try: import pandas as pd # optional: faster parsing of the results files
+except ImportError: pd = None
+
+try: import numba # optional: compiled volume integration
+except ImportError: numba = None
+
+try: from numpy import trapezoid
+except ImportError: from numpy import trapz as trapezoid # NumPy < 2.0
+
+
+# 0D models: module and function that append the groups to plot, and whether the model is a (closed-loop) circulation
+models_0D = {'syspul'           : ('cardiovascular0D_syspul', 'postprocess_groups_syspul', True),
+             'syspulcap'        : ('cardiovascular0D_syspulcap', 'postprocess_groups_syspulcap', True),
+             'syspulcapcor'     : ('cardiovascular0D_syspulcap', 'postprocess_groups_syspulcapcor', True),
+             'syspulcaprespir'  : ('cardiovascular0D_syspulcaprespir', 'postprocess_groups_syspulcaprespir', True),
+             '4elwindkesselLsZ' : (None, None, False), # TODO: Should we implement this?
+             '4elwindkesselLpZ' : (None, None, False), # TODO: Should we implement this?
+             '2elwindkessel'    : ('cardiovascular0D_2elwindkessel', 'postprocess_groups', False)}
+
 
 def main():
     
@@ -51,187 +73,143 @@ def main():
     postprocess0D(path, sname, nstep_cycl, T_cycl, t_ed, t_es, model, coronarymodel, indpertaftercyl, calc_func_params=calc_func_params, V0=V0, multiscalegandr=multiscalegandr, lastgandrcycl=lastgandrcycl)
 
 
-def postprocess0D(path, sname, nstep_cycl, T_cycl, t_ed, t_es, model, coronarymodel, indpertaftercyl=0, calc_func_params=False, V0=[113.25,150.,50.,50., 0.], multiscalegandr=False, lastgandrcycl=1, export_png=True, generate_plots=True):
+def postprocess0D(path, sname, nstep_cycl, T_cycl, t_ed, t_es, model, coronarymodel, indpertaftercyl=0, calc_func_params=False, V0=[113.25,150.,50.,50., 0.], multiscalegandr=False, lastgandrcycl=1, export_png=True, generate_plots=True, cache_results=False):
 
     fpath = Path(__file__).parent.absolute()
     
     # return the groups we want to plot
     groups = []
     
-    if model == 'syspul':
-        
-        import cardiovascular0D_syspul
-        cardiovascular0D_syspul.postprocess_groups_syspul(groups,coronarymodel,indpertaftercyl,multiscalegandr)
-        iscirculation = True
-        calculate_function_params = calc_func_params
-
-    elif model == 'syspulcap':
-        
-        import cardiovascular0D_syspulcap
-        cardiovascular0D_syspulcap.postprocess_groups_syspulcap(groups,coronarymodel,indpertaftercyl,multiscalegandr)
-        iscirculation = True
-        calculate_function_params = calc_func_params
-        
-    elif model == 'syspulcapcor':
-        
-        import cardiovascular0D_syspulcap
-        cardiovascular0D_syspulcap.postprocess_groups_syspulcapcor(groups,coronarymodel,indpertaftercyl,multiscalegandr)
-        iscirculation = True
-        calculate_function_params = calc_func_params
-        
-    elif model == 'syspulcaprespir':
-        
-        import cardiovascular0D_syspulcaprespir
-        cardiovascular0D_syspulcaprespir.postprocess_groups_syspulcaprespir(groups,coronarymodel,indpertaftercyl,multiscalegandr)
-        iscirculation = True
-        calculate_function_params = calc_func_params
-    
-    elif model == '4elwindkesselLsZ':
-    
-        # TODO: Should we implement this?
-        iscirculation = False
-        pass
-    
-    elif model == '4elwindkesselLpZ':
+    try: modname, funcname, iscirculation = models_0D[model]
+    except KeyError: raise NameError("Unknown 0D model!")
     
-        # TODO: Should we implement this?
-        iscirculation = False
-        pass
+    if modname is not None:
+        groups_func = getattr(importlib.import_module(modname), funcname)
+        if iscirculation:
+            groups_func(groups,coronarymodel,indpertaftercyl,multiscalegandr)
+        else:
+            groups_func(groups,indpertaftercyl)
     
-    elif model == '2elwindkessel':
-    
-        import cardiovascular0D_2elwindkessel
-        cardiovascular0D_2elwindkessel.postprocess_groups(groups,indpertaftercyl)
-        iscirculation = False
-    
-    else:
-
-        raise NameError("Unknown 0D model!")
+    calculate_function_params = calc_func_params
 
 
     # make a directory for the plots
-    subprocess.call(['mkdir', '-p', ''+path+'/plot0d_'+sname+'/'])
+    plotdir = path+'/plot0d_'+sname+'/'
+    os.makedirs(plotdir, exist_ok=True)
+
+    # results file names and paths - all built from these prefixes
+    resname = 'results_'+sname
+    resbase = path+'/'+resname
+    resbase_gandr = path+'/results_'+sname.replace('small1','small'+str(lastgandrcycl))
+
+    # names of all files in the results directory, so that checking presence of a file needs no file system access
+    resultfiles = {f.name for f in os.scandir(path) if f.is_file()}
+    
+    # results arrays by file name - each file is parsed only once and then sliced as needed
+    # cache_results: keep binary copies of the parsed files in the plot directory, for repeated postprocessing of the same results
+    results_cache = {}
+    def results(filename):
+        if filename not in results_cache: results_cache[filename] = read_results(filename, cachedir=plotdir if cache_results else None)
+        return results_cache[filename]
 
     if iscirculation:
 
         # get the data and check its length
-        tmp = np.loadtxt(''+path+'/results_'+sname+'_p_ar_pul.txt', usecols=0) # could be another file - all should have the same length!
+        tmp = results(resbase+'_p_ar_pul.txt')[:,0] # could be another file - all should have the same length!
         numdata = len(tmp)
         
         # in case our coupling quantity was not volume, but flux or pressure, we should calculate the volume out of the flux data
         for i, ch in enumerate(['v_l','v_r','at_l','at_r', 'aort_sys']):
             # test if volume file exists
-            test_V = os.system('test -e '+path+'/results_'+sname+'_V_'+ch+'.txt')
-            if test_V > 0:
+            if resname+'_V_'+ch+'.txt' not in resultfiles:
                 # safety check - flux file should exist in case of missing volume file!
-                test_Q = os.system('test -e '+path+'/results_'+sname+'_Q_'+ch+'.txt')
-                if test_Q == 0:
-                    fluxes = np.loadtxt(''+path+'/results_'+sname+'_Q_'+ch+'.txt', usecols=1)
+                if resname+'_Q_'+ch+'.txt' in resultfiles:
+                    fluxes = results(resbase+'_Q_'+ch+'.txt')[:,1]
                     # integrate volume (mid-point rule): Q_{mid} = -(V_{n+1} - V_{n})/dt --> V_{n+1} = -Q_{mid}*dt + V_{n}
                     # --> V_{mid} = 0.5 * V_{n+1} + 0.5 * V_{n}
-                    filename_vol = path+'/results_'+sname+'_V_'+ch+'.txt'
-                    file_vol = open(filename_vol, 'wt')
-                    vol_n = V0[i]*1.0e3 # mm^3, initial volume (from V0 list, which is in ml)
-                    file_vol.write('%.16E %.16E\n' % (tmp[0], vol_n))
-                    for n in range(len(fluxes)-1):
-                        dt = tmp[n+1] - tmp[n]
-                        vol_np = -fluxes[n+1]*dt + vol_n
-                        vol_mid = 0.5*vol_np + 0.5*vol_n
-                        file_vol.write('%.16E %.16E\n' % (tmp[n+1], vol_mid))
-                        vol_n = vol_np
-                    file_vol.close()
+                    filename_vol = resbase+'_V_'+ch+'.txt'
+                    vol_0 = V0[i]*1.0e3 # mm^3, initial volume (from V0 list, which is in ml)
+                    tflux = tmp[:len(fluxes)]
+                    vol_mid = integrate_volume(tflux, fluxes, vol_0)
+                    results_cache[filename_vol] = np.column_stack((tflux, vol_mid))
+                    np.savetxt(filename_vol, results_cache[filename_vol], fmt='%.16E')
                 else:
                     if ch!='aort_sys': raise AttributeError("No flux file avaialble for chamber %s!" % (ch))
 
         # check number of veins
         sysveins, pulveins = 0, 0
         for i in range(10):
-            if os.system('test -e '+path+'/results_'+sname+'_q_ven'+str(i+1)+'_sys.txt')==0: sysveins += 1
-            if os.system('test -e '+path+'/results_'+sname+'_q_ven'+str(i+1)+'_pul.txt')==0: pulveins += 1
+            if resname+'_q_ven'+str(i+1)+'_sys.txt' in resultfiles: sysveins += 1
+            if resname+'_q_ven'+str(i+1)+'_pul.txt' in resultfiles: pulveins += 1
 
 
         # in 3D fluid dynamics, we may have "distributed" 0D in-/outflow pressures, so here we check presence of these
         # and then average them for visualization
         # check presence of default chamber pressure variable
         for ch in ['v_l','v_r','at_l','at_r', 'aort_sys']:
-            err = os.system('test -e '+path+'/results_'+sname+'_p_'+ch+'.txt')
-            if ch=='aort_sys': err = os.system('test -e '+path+'/results_'+sname+'_p_ar_sys.txt') # extra check due to naming conventions...
-            if err==0: # nothing to do if present
+            present = resname+'_p_'+ch+'.txt' in resultfiles
+            if ch=='aort_sys': present = resname+'_p_ar_sys.txt' in resultfiles # extra check due to naming conventions...
+            if present: # nothing to do if present
                 pass
             else:
                 numpi, numpo = 0, 0
                 # now check chamber inflow/outflow distributed pressures
-                pall = np.zeros(numdata)
                 for i in range(10):
-                    if os.system('test -e '+path+'/results_'+sname+'_p_'+ch+'_i'+str(i+1)+'.txt')==0: numpi += 1
-                    if os.system('test -e '+path+'/results_'+sname+'_p_'+ch+'_o'+str(i+1)+'.txt')==0: numpo += 1
-                for i in range(numpi):
-                    pi = np.loadtxt(path+'/results_'+sname+'_p_'+ch+'_i'+str(i+1)+'.txt', usecols=1)
-                    for j in range(len(pall)):
-                        pall[j] += pi[j]/(numpi+numpo)
-                for i in range(numpo):
-                    po = np.loadtxt(path+'/results_'+sname+'_p_'+ch+'_o'+str(i+1)+'.txt', usecols=1)
-                    for j in range(len(pall)):
-                        pall[j] += po[j]/(numpi+numpo)
+                    if resname+'_p_'+ch+'_i'+str(i+1)+'.txt' in resultfiles: numpi += 1
+                    if resname+'_p_'+ch+'_o'+str(i+1)+'.txt' in resultfiles: numpo += 1
+                # stack all in- and outflow pressures and average them
+                pall = np.zeros(numdata)
+                if numpi+numpo > 0:
+                    pdist = np.vstack([results(resbase+'_p_'+ch+'_i'+str(i+1)+'.txt')[:,1] for i in range(numpi)] + \
+                                      [results(resbase+'_p_'+ch+'_o'+str(i+1)+'.txt')[:,1] for i in range(numpo)])
+                    pall += (pdist/(numpi+numpo)).sum(axis=0)
 
                 # write averaged pressure file
-                file_pavg = path+'/results_'+sname+'_p_'+ch+'.txt'
-                fpa = open(file_pavg, 'wt')
-                for i in range(len(pall)):
-                    fpa.write('%.16E %.16E\n' % (tmp[i], pall[i]))
-                fpa.close()
-                # rename file to ar_sys - due to naming conventions...
-                if ch=='aort_sys': os.system('mv '+path+'/results_'+sname+'_p_'+ch+'.txt '+path+'/results_'+sname+'_p_ar_sys.txt')
+                file_pavg = resbase+'_p_'+ch+'.txt'
+                if ch=='aort_sys': file_pavg = resbase+'_p_ar_sys.txt' # file named ar_sys - due to naming conventions...
+                results_cache[file_pavg] = np.column_stack((tmp, pall))
+                np.savetxt(file_pavg, results_cache[file_pavg], fmt='%.16E')
 
 
         # for plotting of pressure-volume loops
         for ch in ['v_l','v_r','at_l','at_r']:
-            subprocess.call(['cp', path+'/results_'+sname+'_p_'+ch+'.txt', path+'/results_'+sname+'_p_'+ch+'_tmp.txt'])
-            subprocess.call(['cp', path+'/results_'+sname+'_V_'+ch+'.txt', path+'/results_'+sname+'_V_'+ch+'_tmp.txt'])
-            # drop first (time) columns
-            subprocess.call(['sed', '-r', '-i', 's/(\s+)?\S+//1', path+'/results_'+sname+'_p_'+ch+'_tmp.txt'])
-            subprocess.call(['sed', '-r', '-i', 's/(\s+)?\S+//1', path+'/results_'+sname+'_V_'+ch+'_tmp.txt'])
-            # paste files together
-            os.system('paste '+path+'/results_'+sname+'_V_'+ch+'_tmp.txt '+path+'/results_'+sname+'_p_'+ch+'_tmp.txt > '+path+'/results_'+sname+'_pV_'+ch+'.txt')
-            # isolate last cycle                
-            os.system('tail -n '+str(nstep_cycl)+' '+path+'/results_'+sname+'_pV_'+ch+'.txt > '+path+'/results_'+sname+'_pV_'+ch+'_last.txt')
+            pvbase = resbase+'_pV_'+ch
+            # volume and pressure columns (without time) side by side
+            pv = np.column_stack((results(resbase+'_V_'+ch+'.txt')[:,1], results(resbase+'_p_'+ch+'.txt')[:,1]))
+            results_cache[pvbase+'.txt'] = pv
+            np.savetxt(pvbase+'.txt', pv, fmt='%.16E')
+            # isolate last cycle
+            results_cache[pvbase+'_last.txt'] = pv[-nstep_cycl:]
+            np.savetxt(pvbase+'_last.txt', pv[-nstep_cycl:], fmt='%.16E')
             if multiscalegandr and indpertaftercyl > 0:
-                subprocess.call(['cp', path+'/results_'+sname.replace('small1','small'+str(lastgandrcycl))+'_p_'+ch+'.txt', path+'/results_'+sname.replace('small1','small'+str(lastgandrcycl))+'_p_'+ch+'_tmp.txt'])
-                subprocess.call(['cp', path+'/results_'+sname.replace('small1','small'+str(lastgandrcycl))+'_V_'+ch+'.txt', path+'/results_'+sname.replace('small1','small'+str(lastgandrcycl))+'_V_'+ch+'_tmp.txt'])
-                # drop first (time) columns
-                subprocess.call(['sed', '-r', '-i', 's/(\s+)?\S+//1', path+'/results_'+sname.replace('small1','small'+str(lastgandrcycl))+'_p_'+ch+'_tmp.txt'])
-                subprocess.call(['sed', '-r', '-i', 's/(\s+)?\S+//1', path+'/results_'+sname.replace('small1','small'+str(lastgandrcycl))+'_V_'+ch+'_tmp.txt'])
-                # paste files together
-                os.system('paste '+path+'/results_'+sname.replace('small1','small'+str(lastgandrcycl))+'_V_'+ch+'_tmp.txt '+path+'/results_'+sname.replace('small1','small'+str(lastgandrcycl))+'_p_'+ch+'_tmp.txt > '+path+'/results_'+sname.replace('small1','small'+str(lastgandrcycl))+'_pV_'+ch+'.txt')
-                # isolate last cycle                
-                os.system('tail -n '+str(nstep_cycl)+' '+path+'/results_'+sname.replace('small1','small'+str(lastgandrcycl))+'_pV_'+ch+'.txt > '+path+'/results_'+sname+'_pV_'+ch+'_gandr.txt')
+                pvbase_gandr = resbase_gandr+'_pV_'+ch
+                pv_gandr = np.column_stack((results(resbase_gandr+'_V_'+ch+'.txt')[:,1], results(resbase_gandr+'_p_'+ch+'.txt')[:,1]))
+                results_cache[pvbase_gandr+'.txt'] = pv_gandr
+                np.savetxt(pvbase_gandr+'.txt', pv_gandr, fmt='%.16E')
+                # isolate last cycle
+                results_cache[pvbase+'_gandr.txt'] = pv_gandr[-nstep_cycl:]
+                np.savetxt(pvbase+'_gandr.txt', pv_gandr[-nstep_cycl:], fmt='%.16E')
             # isolate healthy/baseline cycle
             if indpertaftercyl > 0:
-                os.system('sed -n "'+str((indpertaftercyl-1)*nstep_cycl+1)+','+str(indpertaftercyl*nstep_cycl)+'p" '+path+'/results_'+sname+'_pV_'+ch+'.txt > '+path+'/results_'+sname+'_pV_'+ch+'_baseline.txt')
-            # clean-up
-            subprocess.call(['rm', path+'/results_'+sname+'_p_'+ch+'_tmp.txt'])
-            subprocess.call(['rm', path+'/results_'+sname+'_V_'+ch+'_tmp.txt'])
+                results_cache[pvbase+'_baseline.txt'] = pv[(indpertaftercyl-1)*nstep_cycl:indpertaftercyl*nstep_cycl]
+                np.savetxt(pvbase+'_baseline.txt', pv[(indpertaftercyl-1)*nstep_cycl:indpertaftercyl*nstep_cycl], fmt='%.16E')
             
             
         # for plotting of compartment volumes: gather all volumes and add them in order to check if volume conservation is fulfilled!
         # Be worried if the total sum in V_all.txt changes over time (more than to a certain tolerance)!
         volall = np.zeros(numdata)
-        for c in range(len(list(groups[5].values())[0])-1): # compartment volumes should be stored in group index 5
-            # load volume data
-            vols = np.loadtxt(path+'/results_'+sname+'_'+list(groups[5].values())[0][c]+'.txt', usecols=1)
-            # add together
-            for i in range(len(volall)):
-                volall[i] += vols[i]
+        compartvols = next(iter(groups[5].values())) # compartment volumes should be stored in group index 5
+        for cv in compartvols[:-1]:
+            # load volume data and add together
+            volall += results(resbase+'_'+cv+'.txt')[:,1]
 
         # write time and vol value to file
-        file_vollall = path+'/results_'+sname+'_V_all.txt'
-        fva = open(file_vollall, 'wt')
-        for i in range(len(volall)):
-            fva.write('%.16E %.16E\n' % (tmp[i], volall[i]))
-        fva.close()
+        file_vollall = resbase+'_V_all.txt'
+        results_cache[file_vollall] = np.column_stack((tmp, volall))
+        np.savetxt(file_vollall, results_cache[file_vollall], fmt='%.16E')
         
         # compute integral data
-        file_integral = path+'/results_'+sname+'_data_integral.txt'
+        file_integral = resbase+'_data_integral.txt'
         fi = open(file_integral, 'wt')
         
         fi.write('T_cycl ' +str(T_cycl) + '\n')
@@ -249,40 +227,29 @@ def postprocess0D(path, sname, nstep_cycl, T_cycl, t_ed, t_es, model, coronarymo
             for ch in ['v_l','v_r']:
                 
                 # stroke work
-                pv = np.loadtxt(path+'/results_'+sname+'_pV_'+ch+'_last.txt') # this is already last (periodic) cycle pv data!
-                val = 0.0
-                for k in range(len(pv)-1):
-                    # we need the negative sign since we go counter-clockwise around the loop!
-                    val -= 0.5*(pv[k+1,1]+pv[k,1]) * (pv[k+1,0] - pv[k,0])
-                sw.append(val)
+                pv = results(resbase+'_pV_'+ch+'_last.txt') # this is already last (periodic) cycle pv data!
+                # we need the negative sign since we go counter-clockwise around the loop!
+                sw.append(-trapezoid(pv[:,1], pv[:,0]))
                 
                 # stroke volume, cardiac output, end-diastolic and end-systolic volume, ejection fraction
-                vol = np.loadtxt(path+'/results_'+sname+'_V_'+ch+'.txt', skiprows=numdata-nstep_cycl, usecols=1)
+                vol = results(resbase+'_V_'+ch+'.txt')[-nstep_cycl:,1]
                 sv.append(max(vol)-min(vol))
                 co.append((max(vol)-min(vol))/T_cycl)
                 edv.append(max(vol))
                 esv.append(min(vol))
                 ef.append((max(vol)-min(vol))/max(vol))
 
-                pres = np.loadtxt(path+'/results_'+sname+'_p_'+ch+'.txt', skiprows=numdata-nstep_cycl)
+                pres = results(resbase+'_p_'+ch+'.txt')[-nstep_cycl:]
 
                 # end-diastolic pressure
-                edp_index = -1
-                for k in range(len(pres)):
-                    if round(pres[k,0],2) == round(t_ed+(n_cycl-1)*T_cycl+t_off,2):
-                        edp_index = k
-                        break
+                edp_index = time_index(pres[:,0], t_ed+(n_cycl-1)*T_cycl+t_off, T_cycl/nstep_cycl)
                 if edp_index >= 0:
                     edp.append(pres[edp_index,1])
                 else:
                     edp.append(np.nan)
 
                 # end-systolic pressure
-                esp_index = -1
-                for k in range(len(pres)):
-                    if round(pres[k,0],2) == round(t_es+(n_cycl-1)*T_cycl+t_off,2):
-                        esp_index = k
-                        break
+                esp_index = time_index(pres[:,0], t_es+(n_cycl-1)*T_cycl+t_off, T_cycl/nstep_cycl)
                 if esp_index >= 0:
                     esp.append(pres[esp_index,1])
                 else:
@@ -290,30 +257,23 @@ def postprocess0D(path, sname, nstep_cycl, T_cycl, t_ed, t_es, model, coronarymo
                 
                 # net values (in case of regurgitation of valves, for example), computed by integrating in- and out-fluxes
                 if ch=='v_l':
-                    fluxout = np.loadtxt(path+'/results_'+sname+'_q_vout_l.txt', skiprows=numdata-nstep_cycl)
-                    fluxin = np.loadtxt(path+'/results_'+sname+'_q_vin_l.txt', skiprows=numdata-nstep_cycl)
+                    fluxout = results(resbase+'_q_vout_l.txt')[-nstep_cycl:]
+                    fluxin = results(resbase+'_q_vin_l.txt')[-nstep_cycl:]
                 if ch=='v_r':
-                    fluxout = np.loadtxt(path+'/results_'+sname+'_q_vout_r.txt', skiprows=numdata-nstep_cycl)
-                    fluxin = np.loadtxt(path+'/results_'+sname+'_q_vin_r.txt', skiprows=numdata-nstep_cycl)
+                    fluxout = results(resbase+'_q_vout_r.txt')[-nstep_cycl:]
+                    fluxin = results(resbase+'_q_vin_r.txt')[-nstep_cycl:]
 
                 # true (net) stroke volume
-                val = 0.0
-                for i in range(len(fluxout)-1):
-                    # mid-point rule
-                    val += 0.5*(fluxout[i+1,1]+fluxout[i,1]) * (fluxout[i+1,0]-fluxout[i,0])  
+                val = trapezoid(fluxout[:,1], fluxout[:,0]) # mid-point rule
                 sv_net.append(val)
                 co_net.append(val/T_cycl)
                 
                 # true (net) ejection fraction
                 ef_net.append(sv_net[-1]/edv[-1])
                 
-                # regurgitant volume
-                val = 0.0
-                for i in range(len(fluxin)-1):
-                    # mid-point rule
-                    if fluxin[i+1,1] < 0.:
-                        val += 0.5*(fluxin[i+1,1]+fluxin[i,1]) * (fluxin[i+1,0]-fluxin[i,0]) 
-                v_reg.append(abs(val))
+                # regurgitant volume - mid-point rule over the intervals ending with backflow
+                seg = 0.5*(fluxin[1:,1]+fluxin[:-1,1]) * np.diff(fluxin[:,0])
+                v_reg.append(abs(seg[fluxin[1:,1] < 0.].sum()))
                 
                 # regurgitant fraction
                 f_reg.append(v_reg[-1]/sv[-1])
@@ -323,13 +283,9 @@ def postprocess0D(path, sname, nstep_cycl, T_cycl, t_ed, t_es, model, coronarymo
             marp = []
             for pc in ['ar_sys','ar_pul']:
                 
-                pr = np.loadtxt(path+'/results_'+sname+'_p_'+pc+'.txt', skiprows=numdata-nstep_cycl)
+                pr = results(resbase+'_p_'+pc+'.txt')[-nstep_cycl:]
                 
-                val = 0.0
-                for k in range(len(pr)-1):
-                    val += 0.5*(pr[k+1,1]+pr[k,1]) * (pr[k+1,0] - pr[k,0])
-                val /= (pr[-1,0]-pr[0,0])
-                marp.append(val)
+                marp.append(trapezoid(pr[:,1], pr[:,0]) / (pr[-1,0]-pr[0,0]))
             
             # we assume here that units kg - mm - s are used --> pressures are kPa, forces are mN, volumes are mm^3
             # for convenience, we convert work to mJ, volumes to ml and cardiac output to l/min
@@ -364,25 +320,36 @@ def postprocess0D(path, sname, nstep_cycl, T_cycl, t_ed, t_es, model, coronarymo
             fi.close()
 
     if generate_plots:
-            
+        
+        # files have been added above
+        resultfiles = {f.name for f in os.scandir(path) if f.is_file()}
+        
+        # gnuplot scripts and output prefixes of the groups to render - all filled in from the same template
+        plots = []
+        template = (fpath/'flow0d_gnuplot_template.p').read_text()
+        
         for g in range(len(groups)):
             
-            numitems = len(list(groups[g].values())[0])
+            # group name and its quantities, titles and line types
+            gk = next(iter(groups[g]))
+            names, titles, lines = list(groups[g].values())[:3]
+            
+            # prefix of the plot output files
+            pgk = plotdir+gk
+            
+            numitems = len(names)
             
             # safety (and sanity...) check
             if numitems > 18:
                 print("More than 18 items to plot in one graph! Adjust plotfile template or consider if this is sane...")
                 sys.exit()
             
-            subprocess.call(['cp', str(fpath)+'/flow0d_gnuplot_template.p', path+'/plot_'+list(groups[g].keys())[0]+'.p'])
-            subprocess.call(['sed', '-i', 's#__OUTDIR__#'+path+'/plot0d_'+sname+'/#', path+'/plot_'+list(groups[g].keys())[0]+'.p'])
-            subprocess.call(['sed', '-i', 's#__FILEDIR__#'+path+'#', path+'/plot_'+list(groups[g].keys())[0]+'.p'])
-            
-            subprocess.call(['sed', '-i', 's/__OUTNAME__/'+list(groups[g].keys())[0]+'/', path+'/plot_'+list(groups[g].keys())[0]+'.p'])
+            # template substitutions - collected here and applied all at once before plotting
+            subs = {'__OUTDIR__' : plotdir, '__FILEDIR__' : path, '__OUTNAME__' : gk}
             
             factor_kPa_mmHg = 7.500615
             
-            if 'pres_time' in list(groups[g].keys())[0]:
+            if 'pres_time' in gk:
                 x1value, x2value     = 't', ''
                 x1unit, x2unit       = 's', ''
                 y1value, y2value     = 'p', 'p'
@@ -391,10 +358,10 @@ def postprocess0D(path, sname, nstep_cycl, T_cycl, t_ed, t_es, model, coronarymo
                 x2rescale, y2rescale = 1.0, factor_kPa_mmHg
                 xextend, yextend     = 1.0, 1.1
                 maxrows, maxcols, sl, swd = 1, 5, 20, 50
-                if (model == 'syspulcap' or model == 'syspulcapcor' or model == 'syspulcaprespir') and 'pres_time_sys_l' in list(groups[g].keys())[0]:
+                if (model == 'syspulcap' or model == 'syspulcapcor' or model == 'syspulcaprespir') and 'pres_time_sys_l' in gk:
                     xextend, yextend     = 1.0, 1.2
                     maxrows, maxcols, sl, swd = 2, 5, 19, 50
-            if 'flux_time' in list(groups[g].keys())[0]:
+            if 'flux_time' in gk:
                 x1value, x2value     = 't', ''
                 x1unit, x2unit       = 's', ''
                 y1value, y2value     = 'q', ''
@@ -403,14 +370,14 @@ def postprocess0D(path, sname, nstep_cycl, T_cycl, t_ed, t_es, model, coronarymo
                 x2rescale, y2rescale = 1.0, 1.0
                 xextend, yextend     = 1.0, 1.1
                 maxrows, maxcols, sl, swd = 1, 5, 20, 50
-                if (model == 'syspulcap' or model == 'syspulcapcor' or model == 'syspulcaprespir') and 'flux_time_sys_l' in list(groups[g].keys())[0]:
+                if (model == 'syspulcap' or model == 'syspulcapcor' or model == 'syspulcaprespir') and 'flux_time_sys_l' in gk:
                     xextend, yextend     = 1.0, 1.3
                     maxrows, maxcols, sl, swd = 3, 5, 20, 50
-                if 'flux_time_pul_r' in list(groups[g].keys())[0] and pulveins > 2:
+                if 'flux_time_pul_r' in gk and pulveins > 2:
                     maxrows, maxcols, sl, swd = 1, 7, 16, 34
-                if 'flux_time_cor' in list(groups[g].keys())[0]:
+                if 'flux_time_cor' in gk:
                     maxrows, maxcols, sl, swd = 1, 6, 13, 41
-            if 'vol_time' in list(groups[g].keys())[0]:
+            if 'vol_time' in gk:
                 x1value, x2value     = 't', ''
                 x1unit, x2unit       = 's', ''
                 y1value, y2value     = 'V', ''
@@ -419,27 +386,27 @@ def postprocess0D(path, sname, nstep_cycl, T_cycl, t_ed, t_es, model, coronarymo
                 x2rescale, y2rescale = 1.0, 1.0
                 xextend, yextend     = 1.0, 1.1
                 maxrows, maxcols, sl, swd = 1, 5, 20, 50
-            if 'pres_vol_v' in list(groups[g].keys())[0]:
-                x1value, x2value     = 'V_{\\\mathrm{v}}', ''
+            if 'pres_vol_v' in gk:
+                x1value, x2value     = 'V_{\\mathrm{v}}', ''
                 x1unit, x2unit       = 'ml', ''
-                y1value, y2value     = 'p_{\\\mathrm{v}}', 'p_{\\\mathrm{v}}'
+                y1value, y2value     = 'p_{\\mathrm{v}}', 'p_{\\mathrm{v}}'
                 y1unit, y2unit       = 'kPa', 'mmHg'
                 xscale, yscale       = 1.0e-3, 1.0
                 x2rescale, y2rescale = 1.0, factor_kPa_mmHg
                 xextend, yextend     = 1.1, 1.1
                 maxrows, maxcols, sl, swd = 1, 5, 20, 50
                 if multiscalegandr: sl, swd = 19, 33
-            if 'pres_vol_at' in list(groups[g].keys())[0]:
-                x1value, x2value     = 'V_{\\\mathrm{at}}', ''
+            if 'pres_vol_at' in gk:
+                x1value, x2value     = 'V_{\\mathrm{at}}', ''
                 x1unit, x2unit       = 'ml', ''
-                y1value, y2value     = 'p_{\\\mathrm{at}}', 'p_{\\\mathrm{at}}'
+                y1value, y2value     = 'p_{\\mathrm{at}}', 'p_{\\mathrm{at}}'
                 y1unit, y2unit       = 'kPa', 'mmHg'
                 xscale, yscale       = 1.0e-3, 1.0
                 x2rescale, y2rescale = 1.0, factor_kPa_mmHg
                 xextend, yextend     = 1.1, 1.1
                 maxrows, maxcols, sl, swd = 1, 5, 20, 50
                 if multiscalegandr: sl, swd = 19, 33
-            if 'vol_time_compart' in list(groups[g].keys())[0]:
+            if 'vol_time_compart' in gk:
                 x1value, x2value     = 't', ''
                 x1unit, x2unit       = 's', ''
                 y1value, y2value     = 'V', ''
@@ -453,28 +420,28 @@ def postprocess0D(path, sname, nstep_cycl, T_cycl, t_ed, t_es, model, coronarymo
                     maxrows, maxcols, sl, swd = 3, 5, 10, 50
                 if coronarymodel is not None:
                     maxrows, maxcols, sl, swd = 2, 5, 20, 40
-            if 'ppO2_time' in list(groups[g].keys())[0]:
+            if 'ppO2_time' in gk:
                 x1value, x2value     = 't', ''
                 x1unit, x2unit       = 's', ''
-                y1value, y2value     = 'p_{\\\mathrm{O}_2}', 'p_{\\\mathrm{O}_2}'
+                y1value, y2value     = 'p_{\\mathrm{O}_2}', 'p_{\\mathrm{O}_2}'
                 y1unit, y2unit       = 'kPa', 'mmHg'
                 xscale, yscale       = 1.0, 1.0
                 x2rescale, y2rescale = 1.0, factor_kPa_mmHg
                 xextend, yextend     = 1.0, 1.2
                 maxrows, maxcols, sl, swd = 1, 5, 20, 50
-                if 'sys_l' in list(groups[g].keys())[0]:
+                if 'sys_l' in gk:
                     xextend, yextend     = 1.0, 1.3
                     maxrows, maxcols, sl, swd = 3, 5, 10, 50
-            if 'ppCO2_time' in list(groups[g].keys())[0]:
+            if 'ppCO2_time' in gk:
                 x1value, x2value     = 't', ''
                 x1unit, x2unit       = 's', ''
-                y1value, y2value     = 'p_{\\\mathrm{CO}_2}', 'p_{\\\mathrm{CO}_2}'
+                y1value, y2value     = 'p_{\\mathrm{CO}_2}', 'p_{\\mathrm{CO}_2}'
                 y1unit, y2unit       = 'kPa', 'mmHg'
                 xscale, yscale       = 1.0, 1.0
                 x2rescale, y2rescale = 1.0, factor_kPa_mmHg
                 xextend, yextend     = 1.0, 1.2
                 maxrows, maxcols, sl, swd = 1, 5, 20, 50
-                if 'sys_l' in list(groups[g].keys())[0]:
+                if 'sys_l' in gk:
                     xextend, yextend     = 1.0, 1.3
                     maxrows, maxcols, sl, swd = 3, 5, 10, 50
             
@@ -482,44 +449,50 @@ def postprocess0D(path, sname, nstep_cycl, T_cycl, t_ed, t_es, model, coronarymo
             x_s_all, x_e_all = [], []
             y_s_all, y_e_all = [], []
             
+            # invariant over the items of the group
+            periodic, timeplot = 'PERIODIC' in gk, 'time' in gk
+            
             for q in range(numitems):
                 
                 # continue if file does not exist
-                if os.system('test -e '+path+'/results_'+sname+'_'+list(groups[g].values())[0][q]+'.txt') > 0:
+                qname = resname+'_'+names[q]
+                if qname+'.txt' not in resultfiles:
                     continue
                 
-                # get the data and check its length
-                tmp = np.loadtxt(path+'/results_'+sname+'_'+list(groups[g].values())[0][q]+'.txt') # could be another file - all should have the same length!
-                numdata = len(tmp)
+                # get the data
+                tmp = results(path+'/'+qname+'.txt') # could be another file - all should have the same length!
                 
                 # set quantity, title, and plotting line
-                subprocess.call(['sed', '-i', 's/__QTY'+str(q+1)+'__/results_'+sname+'_'+list(groups[g].values())[0][q]+'/', path+'/plot_'+list(groups[g].keys())[0]+'.p'])
-                subprocess.call(['sed', '-i', 's/__TIT'+str(q+1)+'__/'+list(groups[g].values())[1][q]+'/', path+'/plot_'+list(groups[g].keys())[0]+'.p'])
-                subprocess.call(['sed', '-i', 's/__LIN'+str(q+1)+'__/'+str(list(groups[g].values())[2][q])+'/', path+'/plot_'+list(groups[g].keys())[0]+'.p'])
+                subs['__QTY'+str(q+1)+'__'] = qname
+                subs['__TIT'+str(q+1)+'__'] = titles[q]
+                subs['__LIN'+str(q+1)+'__'] = str(lines[q])
                 
                 # adjust the plotting command to include all the files to plot in one graph
-                if q!=0: subprocess.call(['sed', '-i', 's/#__'+str(q+1)+'__//g', path+'/plot_'+list(groups[g].keys())[0]+'.p'])
+                if q!=0: subs['#__'+str(q+1)+'__'] = ''
                 
-                if 'PERIODIC' in list(groups[g].keys())[0]: skip = numdata-nstep_cycl
+                if periodic: skip = len(tmp)-nstep_cycl
                 else: skip = 0
                 
                 # get the x,y range on which to plot
-                data.append(np.loadtxt(path+'/results_'+sname+'_'+list(groups[g].values())[0][q]+'.txt', skiprows=skip))
+                dat = tmp[skip:]
+                data.append(dat)
+                x_min, x_max = dat[:,0].min(), dat[:,0].max()
+                y_min, y_max = dat[:,1].min(), dat[:,1].max()
 
                 # if time is our x-axis
-                if 'time' in list(groups[g].keys())[0]:
-                    x_s_all.append(min(data[q][:,0]))
+                if timeplot:
+                    x_s_all.append(x_min)
                 else: # start plots from x=0 even if data is larger than zero
-                    if min(data[q][:,0]) > 0.0: x_s_all.append(0.0)
-                    else: x_s_all.append(min(data[q][:,0]))
+                    if x_min > 0.0: x_s_all.append(0.0)
+                    else: x_s_all.append(x_min)
                 
-                x_e_all.append(max(data[q][:,0]))
+                x_e_all.append(x_max)
                 
                 # start plots from y=0 even if data is larger than zero
-                if min(data[q][:,1]) > 0.0: y_s_all.append(0.0)
-                else: y_s_all.append(min(data[q][:,1]))
+                if y_min > 0.0: y_s_all.append(0.0)
+                else: y_s_all.append(y_min)
                 
-                y_e_all.append(max(data[q][:,1]))
+                y_e_all.append(y_max)
             
             # get the min and the max of all x's and y's
             x_s, x_e = xscale*min(x_s_all), xscale*max(x_e_all)
@@ -531,68 +504,177 @@ def postprocess0D(path, sname, nstep_cycl, T_cycl, t_ed, t_es, model, coronarymo
                 continue
 
             # if we want to use a x2 or y2 axis
-            if x2value != '': subprocess.call(['sed', '-i', 's/#__HAVEX2__//', path+'/plot_'+list(groups[g].keys())[0]+'.p'])
-            if y2value != '': subprocess.call(['sed', '-i', 's/#__HAVEY2__//', path+'/plot_'+list(groups[g].keys())[0]+'.p'])
+            if x2value != '': subs['#__HAVEX2__'] = ''
+            if y2value != '': subs['#__HAVEY2__'] = ''
             
             # axis segments - x
-            subprocess.call(['sed', '-i', 's/__X1S__/'+str(x_s)+'/', path+'/plot_'+list(groups[g].keys())[0]+'.p'])
-            subprocess.call(['sed', '-i', 's/__X1E__/'+str(x_e*xextend)+'/', path+'/plot_'+list(groups[g].keys())[0]+'.p'])
-            subprocess.call(['sed', '-i', 's/__X2S__/'+str(x2rescale*x_s)+'/', path+'/plot_'+list(groups[g].keys())[0]+'.p'])
-            subprocess.call(['sed', '-i', 's/__X2E__/'+str(x2rescale*x_e*xextend)+'/', path+'/plot_'+list(groups[g].keys())[0]+'.p'])
+            subs['__X1S__'] = str(x_s)
+            subs['__X1E__'] = str(x_e*xextend)
+            subs['__X2S__'] = str(x2rescale*x_s)
+            subs['__X2E__'] = str(x2rescale*x_e*xextend)
             # axis segments - y
-            subprocess.call(['sed', '-i', 's/__Y1S__/'+str(y_s)+'/', path+'/plot_'+list(groups[g].keys())[0]+'.p'])
-            subprocess.call(['sed', '-i', 's/__Y1E__/'+str(y_e*yextend)+'/', path+'/plot_'+list(groups[g].keys())[0]+'.p'])
-            subprocess.call(['sed', '-i', 's/__Y2S__/'+str(y2rescale*y_s)+'/', path+'/plot_'+list(groups[g].keys())[0]+'.p'])
-            subprocess.call(['sed', '-i', 's/__Y2E__/'+str(y2rescale*y_e*yextend)+'/', path+'/plot_'+list(groups[g].keys())[0]+'.p'])
+            subs['__Y1S__'] = str(y_s)
+            subs['__Y1E__'] = str(y_e*yextend)
+            subs['__Y2S__'] = str(y2rescale*y_s)
+            subs['__Y2E__'] = str(y2rescale*y_e*yextend)
             # units
-            subprocess.call(['sed', '-i', 's#__X1UNIT__#'+x1unit+'#', path+'/plot_'+list(groups[g].keys())[0]+'.p'])
-            subprocess.call(['sed', '-i', 's#__Y1UNIT__#'+y1unit+'#', path+'/plot_'+list(groups[g].keys())[0]+'.p'])
-            if x2unit != '': subprocess.call(['sed', '-i', 's#__X2UNIT__#'+x2unit+'#', path+'/plot_'+list(groups[g].keys())[0]+'.p'])
-            if y2unit != '': subprocess.call(['sed', '-i', 's#__Y2UNIT__#'+y2unit+'#', path+'/plot_'+list(groups[g].keys())[0]+'.p'])
+            subs['__X1UNIT__'] = x1unit
+            subs['__Y1UNIT__'] = y1unit
+            if x2unit != '': subs['__X2UNIT__'] = x2unit
+            if y2unit != '': subs['__Y2UNIT__'] = y2unit
             # values
-            subprocess.call(['sed', '-i', 's#__X1VALUE__#'+x1value+'#', path+'/plot_'+list(groups[g].keys())[0]+'.p'])
-            subprocess.call(['sed', '-i', 's#__Y1VALUE__#'+y1value+'#', path+'/plot_'+list(groups[g].keys())[0]+'.p'])
-            if x2value != '': subprocess.call(['sed', '-i', 's#__X2VALUE__#'+x2value+'#', path+'/plot_'+list(groups[g].keys())[0]+'.p'])
-            if y2value != '': subprocess.call(['sed', '-i', 's#__Y2VALUE__#'+y2value+'#', path+'/plot_'+list(groups[g].keys())[0]+'.p'])
+            subs['__X1VALUE__'] = x1value
+            subs['__Y1VALUE__'] = y1value
+            if x2value != '': subs['__X2VALUE__'] = x2value
+            if y2value != '': subs['__Y2VALUE__'] = y2value
             # scales
-            subprocess.call(['sed', '-i', 's/__XSCALE__/'+str(xscale)+'/g', path+'/plot_'+list(groups[g].keys())[0]+'.p'])
-            subprocess.call(['sed', '-i', 's/__YSCALE__/'+str(yscale)+'/g', path+'/plot_'+list(groups[g].keys())[0]+'.p'])
+            subs['__XSCALE__'] = str(xscale)
+            subs['__YSCALE__'] = str(yscale)
             # rows, columns and sample length for legend
-            subprocess.call(['sed', '-i', 's/__MAXROWS__/'+str(maxrows)+'/g', path+'/plot_'+list(groups[g].keys())[0]+'.p'])
-            subprocess.call(['sed', '-i', 's/__MAXCOLS__/'+str(maxcols)+'/g', path+'/plot_'+list(groups[g].keys())[0]+'.p'])
-            subprocess.call(['sed', '-i', 's/__SAMPLEN__/'+str(sl)+'/g', path+'/plot_'+list(groups[g].keys())[0]+'.p'])
-            subprocess.call(['sed', '-i', 's/__SAMPWID__/'+str(swd)+'/g', path+'/plot_'+list(groups[g].keys())[0]+'.p'])
-
-            # do the plotting
-            subprocess.call(['gnuplot', path+'/plot_'+list(groups[g].keys())[0]+'.p'])
-            # convert to PDF
-            subprocess.call(['ps2pdf', '-dEPSCrop', path+'/plot0d_'+sname+'/'+list(groups[g].keys())[0]+'-inc.eps', path+'/plot0d_'+sname+'/'+list(groups[g].keys())[0]+'-inc.pdf'])
-            subprocess.call(['pdflatex', '-interaction=batchmode', '-output-directory='+path+'/plot0d_'+sname+'/', path+'/plot0d_'+sname+'/'+list(groups[g].keys())[0]+'.tex'])
-
-            if export_png:
-                subprocess.call(['pdftoppm', path+'/plot0d_'+sname+'/'+list(groups[g].keys())[0]+'.pdf', path+'/plot0d_'+sname+'/'+list(groups[g].keys())[0], '-png', '-rx', '300', '-ry', '300'])
-                subprocess.call(['mv', path+'/plot0d_'+sname+'/'+list(groups[g].keys())[0]+'-1.png', path+'/plot0d_'+sname+'/'+list(groups[g].keys())[0]+'.png']) # output has -1, so rename
-                # delete PDFs
-                subprocess.call(['rm', path+'/plot0d_'+sname+'/'+list(groups[g].keys())[0]+'.pdf'])
-                
-            # clean up
-            subprocess.call(['rm', path+'/plot0d_'+sname+'/'+list(groups[g].keys())[0]+'.aux', path+'/plot0d_'+sname+'/'+list(groups[g].keys())[0]+'.log'])
-            # guess we do not need these files anymore since we have the final PDF...
-            subprocess.call(['rm', path+'/plot0d_'+sname+'/'+list(groups[g].keys())[0]+'.tex'])
-            subprocess.call(['rm', path+'/plot0d_'+sname+'/'+list(groups[g].keys())[0]+'-inc.pdf'])
-            subprocess.call(['rm', path+'/plot0d_'+sname+'/'+list(groups[g].keys())[0]+'-inc.eps'])
-            # delete gnuplot file
-            subprocess.call(['rm', path+'/plot_'+list(groups[g].keys())[0]+'.p'])
+            subs['__MAXROWS__'] = str(maxrows)
+            subs['__MAXCOLS__'] = str(maxcols)
+            subs['__SAMPLEN__'] = str(sl)
+            subs['__SAMPWID__'] = str(swd)
+            
+            # plot is rendered below, together with the others - the gnuplot script is passed on in memory
+            plots.append((fill_template(template, subs), pgk))
+
+        # do the plotting - all groups in one gnuplot process, where each group's block closes its output and resets all
+        # settings for the next one
+        remove_files([pgk+'-inc.pdf' for script, pgk in plots])
+        if run_gnuplot(''.join([script+'\nunset output\nreset\n' for script, pgk in plots]), plotdir+'plots.p') != 0:
+            # gnuplot stops at the first error, which would drop all following groups - so redo them one process per group,
+            # where a failure only affects its own group
+            remove_files([pgk+'-inc.pdf' for script, pgk in plots])
+            for script, pgk in plots:
+                run_gnuplot(script+'\n', plotdir+'plots.p')
+
+        # only typeset the groups gnuplot has drawn
+        missing = [pgk for script, pgk in plots if not os.path.isfile(pgk+'-inc.pdf')]
+        if bool(missing):
+            print("gnuplot produced no plot for group(s) "+', '.join([os.path.basename(pgk) for pgk in missing])+"!")
+            sys.stdout.flush()
+        plots = [(script, pgk) for script, pgk in plots if pgk not in missing]
+
+        # the groups' plots are independent, so their (subprocess-bound) typesetting runs concurrently
+        renderer = render_plots([pgk for script, pgk in plots], plotdir, export_png)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError: # no event loop running (the usual case)
+            asyncio.run(renderer)
+        else: # called from within a running event loop (e.g. Jupyter), where asyncio.run is not allowed - so use a worker thread
+            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+                executor.submit(asyncio.run, renderer).result()
+
+
+# run a gnuplot script (from a file, so that gnuplot reports errors with line numbers) and return gnuplot's exit code
+def run_gnuplot(script, scriptfile):
+    with open(scriptfile, 'w') as f:
+        f.write(script)
+    ret = subprocess.run(['gnuplot', scriptfile]).returncode
+    remove_files([scriptfile])
+    return ret
+
+
+# typeset all plots drawn by gnuplot, at most one per CPU at a time
+async def render_plots(pgks, plotdir, export_png):
+    slots = asyncio.Semaphore(os.cpu_count() or 1)
+    await asyncio.gather(*[render_plot(pgk, plotdir, export_png, slots) for pgk in pgks])
+
+
+# typeset a plot drawn by gnuplot to PDF (and convert to PNG), and remove the intermediate files
+async def render_plot(pgk, plotdir, export_png, slots):
+
+    async with slots:
+        # typeset the labels - the graphics PDF comes from gnuplot's cairolatex terminal directly
+        await run_tool('pdflatex', '-interaction=batchmode', '-output-directory='+plotdir, pgk+'.tex')
+
+        # the PNG is converted from the typeset PDF (and not drawn by gnuplot's pngcairo terminal), since the titles
+        # and axis labels are LaTeX and would not be rendered otherwise
+        if export_png:
+            await run_tool('pdftocairo', '-png', '-r', '150', '-singlefile', pgk+'.pdf', pgk) # single page, so no -1 suffix to rename
+            # delete PDFs
+            remove_files([pgk+'.pdf'])
+        
+    # clean up - guess we do not need the LaTeX and graphics files anymore since we have the final PDF...
+    remove_files([pgk+ext for ext in ['.aux', '.log', '.tex', '-inc.pdf']])
+
+
+# run an external tool and wait for it to finish
+async def run_tool(*cmd):
+    proc = await asyncio.create_subprocess_exec(*cmd)
+    return await proc.wait()
+
+
+# delete files (that may not exist if a tool failed)
+def remove_files(files):
+    for f in files:
+        try: os.remove(f)
+        except FileNotFoundError: pass
+
+
+# index of the time step in (sorted) times that is closest to t, -1 if none is within half a time step dt
+def time_index(times, t, dt):
+    k = np.searchsorted(times, t)
+    if k == len(times) or (k > 0 and abs(times[k-1]-t) < abs(times[k]-t)): k -= 1
+    if k >= 0 and abs(times[k]-t) < 0.5*dt: return k
+    else: return -1
+
+
+# mid-point volumes from the fluxes: V_{n+1} = -Q_{n+1}*dt + V_{n}, V_{mid} = 0.5 * V_{n+1} + 0.5 * V_{n}
+def integrate_volume(t, fluxes, vol_0):
+    # V_n for all steps at once (cumulative sum in the same order as the recursion)
+    vol = np.cumsum(np.concatenate(([vol_0], -fluxes[1:]*np.diff(t))))
+    return np.concatenate(([vol_0], 0.5*vol[1:] + 0.5*vol[:-1]))
+
+if numba is not None:
+    # same recursion as a compiled loop, without the temporaries
+    @numba.njit(cache=True)
+    def integrate_volume(t, fluxes, vol_0):
+        vol_mid = np.empty(len(t))
+        vol_mid[0] = vol_0
+        vol_n = vol_0
+        for n in range(len(t)-1):
+            vol_np = -fluxes[n+1]*(t[n+1]-t[n]) + vol_n
+            vol_mid[n+1] = 0.5*vol_np + 0.5*vol_n
+            vol_n = vol_np
+        return vol_mid
+
+
+# replace the placeholders of a plot file template
+def fill_template(text, subs):
+    for key, val in subs.items():
+        text = text.replace(key, val)
+    return text
+
+
+# read a results file (whitespace-separated columns) - with pandas' C parser if available
+# if a cache directory is given, a binary copy (.npy) is written there on first read and used instead of the text as long as
+# it is up to date; it is memory-mapped, so slicing e.g. the last cycle only reads those rows from disk
+def read_results(filename, cachedir=None):
+    if cachedir is not None:
+        npyfile = cachedir+os.path.basename(filename)+'.npy'
+        if os.path.isfile(npyfile) and os.path.getmtime(npyfile) >= os.path.getmtime(filename):
+            return np.load(npyfile, mmap_mode='r')
+    if pd is not None:
+        arr = pd.read_csv(filename, sep=r'\s+', header=None, dtype=np.float64).to_numpy()
+    else:
+        arr = np.loadtxt(filename, dtype=np.float64, ndmin=2)
+    if cachedir is not None:
+        try:
+            with open(npyfile+'.tmp', 'wb') as fh: np.save(fh, arr)
+            os.replace(npyfile+'.tmp', npyfile)
+        except OSError: # e.g. no write permission in the cache directory
+            pass
+    return arr
 
 
+# command line booleans
+bools = {'True' : True, 'False' : False}
 
 def str_to_bool(s):
-    if s == 'True':
-         return True
-    elif s == 'False':
-         return False
-    else:
-         raise RuntimeError("str_to_bool failed!")
+    try: return bools[s]
+    except KeyError: raise RuntimeError("str_to_bool failed!")
 
 
 
@@ -229,6 +229,9 @@ class SignallingNetworkSolver():
                     #sys.stdout.flush()
                 #break
             
+        # close signet result files
+        self.pb.signet.close_output()
+
         if self.pb.comm.rank == 0: # only proc 0 should print this
             print('Program complete. Time for computation: %.4f s (= %.2f min)' % ( time.time()-start, (time.time()-start)/60. ))
             sys.stdout.flush()
@@ -11,6 +11,7 @@ import numpy as np
 from dolfinx import fem
 import ufl
 from petsc4py import PETSc
+from mpi4py import MPI
 
 import ioroutines
 import solid_kinematics_constitutive
@@ -19,7 +20,7 @@ import timeintegration
 import utilities
 import solver_nonlin
 import boundaryconditions
-from projection import project
+from projection import projector
 from solid_material import activestress_activation
 
 from base import problem_base
@@ -48,6 +49,9 @@ class SolidmechanicsProblem(problem_base):
         self.num_domains = len(constitutive_models)
         
         self.constitutive_models = utilities.mat_params_to_dolfinx_constant(constitutive_models, self.io.mesh)
+        
+        # material parameters of each domain (domain n has material 'MAT'+str(n+1))
+        self.mat_params = [self.constitutive_models['MAT'+str(n+1)] for n in range(self.num_domains)]
 
         self.order_disp = fem_params['order_disp']
         try: self.order_pres = fem_params['order_pres']
@@ -56,6 +60,12 @@ class SolidmechanicsProblem(problem_base):
         self.incompressible_2field = fem_params['incompressible_2field']
         
         self.fem_params = fem_params
+        
+        # compiler flags for the form kernels (if any)
+        self.jit_params = utilities.jit_params_from_fem_params(fem_params)
+        # form compiler (FFCx) parameters for the tangent stiffness kernel, which dominates the assembly cost (e.g. {'table_rtol' : 1e-6})
+        try: self.form_compiler_params_jac = fem_params['form_compiler_params_jac']
+        except: self.form_compiler_params_jac = {}
 
         # collect domain data
         self.dx_, self.rho0, self.rayleigh, self.eta_m, self.eta_k = [], [], [False]*self.num_domains, [], []
@@ -65,28 +75,25 @@ class SolidmechanicsProblem(problem_base):
             else:                        self.dx_.append(ufl.dx(metadata={'quadrature_degree': self.quad_degree}))
             # data for inertial and viscous forces: density and damping
             if self.timint != 'static':
-                self.rho0.append(self.constitutive_models['MAT'+str(n+1)+'']['inertia']['rho0'])
-                if 'rayleigh_damping' in self.constitutive_models['MAT'+str(n+1)+''].keys():
+                self.rho0.append(self.mat_params[n]['inertia']['rho0'])
+                rayleigh_damping = self.mat_params[n].get('rayleigh_damping')
+                if rayleigh_damping is not None:
                     self.rayleigh[n] = True
-                    self.eta_m.append(self.constitutive_models['MAT'+str(n+1)+'']['rayleigh_damping']['eta_m'])
-                    self.eta_k.append(self.constitutive_models['MAT'+str(n+1)+'']['rayleigh_damping']['eta_k'])
+                    self.eta_m.append(rayleigh_damping['eta_m'])
+                    self.eta_k.append(rayleigh_damping['eta_k'])
+                else:
+                    self.eta_m.append(0.), self.eta_k.append(0.)
 
         try: self.prestress_initial = fem_params['prestress_initial']
         except: self.prestress_initial = False
 
         # type of discontinuous function spaces
-        if str(self.io.mesh.ufl_cell()) == 'tetrahedron' or str(self.io.mesh.ufl_cell()) == 'triangle3D':
-            dg_type = "DG"
-            if (self.order_disp > 1 or self.order_pres > 1) and self.quad_degree < 3:
-                raise ValueError("Use at least a quadrature degree of 3 or more for higher-order meshes!")
-        elif str(self.io.mesh.ufl_cell()) == 'hexahedron' or str(self.io.mesh.ufl_cell()) == 'quadrilateral3D':
-            dg_type = "DQ"
-            if (self.order_disp > 1 or self.order_pres > 1) and self.quad_degree < 5:
-                raise ValueError("Use at least a quadrature degree of 5 or more for higher-order meshes!")
-            if self.quad_degree < 2:
-                raise ValueError("Use at least a quadrature degree >= 2 for a hexahedral mesh!")
-        else:
-            raise NameError("Unknown cell/element type!")
+        try: dg_type, quad_degree_min_ho, quad_degree_min = utilities.dg_cell_types[str(self.io.mesh.ufl_cell())]
+        except: raise NameError("Unknown cell/element type!")
+        if (self.order_disp > 1 or self.order_pres > 1) and self.quad_degree < quad_degree_min_ho:
+            raise ValueError("Use at least a quadrature degree of "+str(quad_degree_min_ho)+" or more for higher-order meshes!")
+        if self.quad_degree < quad_degree_min:
+            raise ValueError("Use at least a quadrature degree >= "+str(quad_degree_min)+" for a "+str(self.io.mesh.ufl_cell())+" mesh!")
         
         # check if we want to use model order reduction and if yes, initialize MOR class
         try: self.have_rom = io_params['use_model_order_red']
@@ -106,12 +113,11 @@ class SolidmechanicsProblem(problem_base):
         P_tensor = ufl.TensorElement("CG", self.io.mesh.ufl_cell(), self.order_disp)
         self.V_tensor = fem.FunctionSpace(self.io.mesh, P_tensor)
 
-        # Quadrature tensor, vector, and scalar elements
-        Q_tensor = ufl.TensorElement("Quadrature", self.io.mesh.ufl_cell(), degree=1, quad_scheme="default")
-        Q_vector = ufl.VectorElement("Quadrature", self.io.mesh.ufl_cell(), degree=1, quad_scheme="default")
-        Q_scalar = ufl.FiniteElement("Quadrature", self.io.mesh.ufl_cell(), degree=1, quad_scheme="default")
-
         # not yet working - we cannot interpolate into Quadrature elements with the current dolfinx version currently!
+        # (so the Quadrature tensor, vector, and scalar elements are not created for now)
+        #Q_tensor = ufl.TensorElement("Quadrature", self.io.mesh.ufl_cell(), degree=1, quad_scheme="default")
+        #Q_vector = ufl.VectorElement("Quadrature", self.io.mesh.ufl_cell(), degree=1, quad_scheme="default")
+        #Q_scalar = ufl.FiniteElement("Quadrature", self.io.mesh.ufl_cell(), degree=1, quad_scheme="default")
         #self.Vd_tensor = fem.FunctionSpace(self.io.mesh, Q_tensor)
         #self.Vd_vector = fem.FunctionSpace(self.io.mesh, Q_vector)
         #self.Vd_scalar = fem.FunctionSpace(self.io.mesh, Q_scalar)
@@ -139,8 +145,6 @@ class SolidmechanicsProblem(problem_base):
         self.tau_a_set = fem.Function(self.Vd_scalar)
         # initial (zero) functions for initial stiffness evaluation (e.g. for Rayleigh damping)
         self.u_ini, self.p_ini, self.theta_ini, self.tau_a_ini = fem.Function(self.V_u), fem.Function(self.V_p), fem.Function(self.Vd_scalar), fem.Function(self.Vd_scalar)
-        self.theta_ini.vector.set(1.0)
-        self.theta_ini.vector.ghostUpdate(addv=PETSc.InsertMode.INSERT, mode=PETSc.ScatterMode.FORWARD)
         # growth stretch
         self.theta = fem.Function(self.Vd_scalar, name="theta")
         self.theta_old = fem.Function(self.Vd_scalar)
@@ -148,15 +152,16 @@ class SolidmechanicsProblem(problem_base):
         # plastic deformation gradient
         self.F_plast = fem.Function(self.Vd_tensor)
         self.F_plast_old = fem.Function(self.Vd_tensor)
-        # initialize to one (theta = 1 means no growth)
-        self.theta.vector.set(1.0), self.theta_old.vector.set(1.0)
-        self.theta.vector.ghostUpdate(addv=PETSc.InsertMode.INSERT, mode=PETSc.ScatterMode.FORWARD), self.theta_old.vector.ghostUpdate(addv=PETSc.InsertMode.INSERT, mode=PETSc.ScatterMode.FORWARD)
         # active stress
         self.tau_a = fem.Function(self.Vd_scalar, name="tau_a")
         self.tau_a_old = fem.Function(self.Vd_scalar)
         self.amp_old, self.amp_old_set = fem.Function(self.Vd_scalar), fem.Function(self.Vd_scalar)
-        self.amp_old.vector.set(1.0), self.amp_old_set.vector.set(1.0)
-        self.amp_old.vector.ghostUpdate(addv=PETSc.InsertMode.INSERT, mode=PETSc.ScatterMode.FORWARD), self.amp_old_set.vector.ghostUpdate(addv=PETSc.InsertMode.INSERT, mode=PETSc.ScatterMode.FORWARD)
+        # initialize growth stretches and active stress amplitudes to one (theta = 1 means no growth) - all ghost updates
+        # are started before the first one is finished, so that the neighbour exchanges overlap
+        vecs_one = [self.theta_ini.vector, self.theta.vector, self.theta_old.vector, self.amp_old.vector, self.amp_old_set.vector]
+        for v in vecs_one: v.set(1.0)
+        for v in vecs_one: v.ghostUpdateBegin(addv=PETSc.InsertMode.INSERT, mode=PETSc.ScatterMode.FORWARD)
+        for v in vecs_one: v.ghostUpdateEnd(addv=PETSc.InsertMode.INSERT, mode=PETSc.ScatterMode.FORWARD)
         # for strainrate-dependent materials
         self.dEdt_old = fem.Function(self.Vd_tensor)
         # prestressing history defgrad and spring prestress
@@ -172,9 +177,9 @@ class SolidmechanicsProblem(problem_base):
         self.internalvars, self.internalvars_old = {}, {}
         self.ratevars, self.ratevars_old = {}, {}
         
-        # reference coordinates
+        # reference coordinates - for the (Lagrange) displacement space, these are just its dof coordinates (owned and ghosted)
         self.x_ref = fem.Function(self.V_u)
-        self.x_ref.interpolate(self.x_ref_expr)
+        self.x_ref.x.array[:] = self.V_u.tabulate_dof_coordinates().ravel()
         
         if self.incompressible_2field:
             self.ndof = self.u.vector.getSize() + self.p.vector.getSize()
@@ -193,43 +198,43 @@ class SolidmechanicsProblem(problem_base):
         self.actstress = []
         for n in range(self.num_domains):
             
-            if 'holzapfelogden_dev' in self.constitutive_models['MAT'+str(n+1)+''].keys() or 'guccione_dev' in self.constitutive_models['MAT'+str(n+1)+''].keys():
+            if 'holzapfelogden_dev' in self.mat_params[n] or 'guccione_dev' in self.mat_params[n]:
                 have_fiber1, have_fiber2 = True, True
             
-            if 'active_fiber' in self.constitutive_models['MAT'+str(n+1)+''].keys():
+            if 'active_fiber' in self.mat_params[n]:
                 have_fiber1 = True
                 self.mat_active_stress[n], self.have_active_stress = True, True
                 # if one mat has a prescribed active stress, all have to be!
-                if 'prescribed_curve' in self.constitutive_models['MAT'+str(n+1)+'']['active_fiber']:
+                if 'prescribed_curve' in self.mat_params[n]['active_fiber']:
                     self.active_stress_trig = 'prescribed'
-                if 'prescribed_multiscale' in self.constitutive_models['MAT'+str(n+1)+'']['active_fiber']:
+                if 'prescribed_multiscale' in self.mat_params[n]['active_fiber']:
                     self.active_stress_trig = 'prescribed_multiscale'
                 if self.active_stress_trig == 'ode':
-                    act_curve = self.ti.timecurves(self.constitutive_models['MAT'+str(n+1)+'']['active_fiber']['activation_curve'])
-                    self.actstress.append(activestress_activation(self.constitutive_models['MAT'+str(n+1)+'']['active_fiber'], act_curve))
+                    act_curve = self.ti.timecurves(self.mat_params[n]['active_fiber']['activation_curve'])
+                    self.actstress.append(activestress_activation(self.mat_params[n]['active_fiber'], act_curve))
                     if self.actstress[-1].frankstarling: self.have_frank_starling = True
                 if self.active_stress_trig == 'prescribed':
-                    self.ti.funcs_to_update.append({self.tau_a : self.ti.timecurves(self.constitutive_models['MAT'+str(n+1)+'']['active_fiber']['prescribed_curve'])})
+                    self.ti.funcs_to_update.append({self.tau_a : self.ti.timecurves(self.mat_params[n]['active_fiber']['prescribed_curve'])})
                 self.internalvars['tau_a'], self.internalvars_old['tau_a'] = self.tau_a, self.tau_a_old
 
-            if 'active_iso' in self.constitutive_models['MAT'+str(n+1)+''].keys():
+            if 'active_iso' in self.mat_params[n]:
                 self.mat_active_stress[n], self.have_active_stress = True, True
                 # if one mat has a prescribed active stress, all have to be!
-                if 'prescribed_curve' in self.constitutive_models['MAT'+str(n+1)+'']['active_iso']:
+                if 'prescribed_curve' in self.mat_params[n]['active_iso']:
                     self.active_stress_trig = 'prescribed'
-                if 'prescribed_multiscale' in self.constitutive_models['MAT'+str(n+1)+'']['active_iso']:
+                if 'prescribed_multiscale' in self.mat_params[n]['active_iso']:
                     self.active_stress_trig = 'prescribed_multiscale'
                 if self.active_stress_trig == 'ode':
-                    act_curve = self.ti.timecurves(self.constitutive_models['MAT'+str(n+1)+'']['active_iso']['activation_curve'])
-                    self.actstress.append(activestress_activation(self.constitutive_models['MAT'+str(n+1)+'']['active_iso'], act_curve))
+                    act_curve = self.ti.timecurves(self.mat_params[n]['active_iso']['activation_curve'])
+                    self.actstress.append(activestress_activation(self.mat_params[n]['active_iso'], act_curve))
                 if self.active_stress_trig == 'prescribed':
-                    self.ti.funcs_to_update.append({self.tau_a : self.ti.timecurves(self.constitutive_models['MAT'+str(n+1)+'']['active_iso']['prescribed_curve'])})
+                    self.ti.funcs_to_update.append({self.tau_a : self.ti.timecurves(self.mat_params[n]['active_iso']['prescribed_curve'])})
                 self.internalvars['tau_a'], self.internalvars_old['tau_a'] = self.tau_a, self.tau_a_old
 
-            if 'growth' in self.constitutive_models['MAT'+str(n+1)+''].keys():
+            if 'growth' in self.mat_params[n]:
                 self.mat_growth[n], self.have_growth = True, True
-                self.mat_growth_dir[n] = self.constitutive_models['MAT'+str(n+1)+'']['growth']['growth_dir']
-                self.mat_growth_trig[n] = self.constitutive_models['MAT'+str(n+1)+'']['growth']['growth_trig']
+                self.mat_growth_dir[n] = self.mat_params[n]['growth']['growth_dir']
+                self.mat_growth_trig[n] = self.mat_params[n]['growth']['growth_trig']
                 # need to have fiber fields for the following growth options
                 if self.mat_growth_dir[n] == 'fiber' or self.mat_growth_trig[n] == 'fibstretch':
                     have_fiber1 = True
@@ -240,25 +245,25 @@ class SolidmechanicsProblem(problem_base):
                 # the global Newton scheme - so flag localsolve to true
                 if self.mat_growth_trig[n] != 'prescribed' and self.mat_growth_trig[n] != 'prescribed_multiscale':
                     self.localsolve = True
-                    self.mat_growth_thres.append(self.constitutive_models['MAT'+str(n+1)+'']['growth']['growth_thres'])
+                    self.mat_growth_thres.append(self.mat_params[n]['growth']['growth_thres'])
                 else:
                     self.mat_growth_thres.append(ufl.as_ufl(0))
                 # for the case that we have a prescribed growth stretch over time, append curve to functions that need time updates
                 # if one mat has a prescribed growth model, all have to be!
                 if self.mat_growth_trig[n] == 'prescribed':
-                    self.ti.funcs_to_update.append({self.theta : self.ti.timecurves(self.constitutive_models['MAT'+str(n+1)+'']['growth']['prescribed_curve'])})
-                if 'remodeling_mat' in self.constitutive_models['MAT'+str(n+1)+'']['growth'].keys():
+                    self.ti.funcs_to_update.append({self.theta : self.ti.timecurves(self.mat_params[n]['growth']['prescribed_curve'])})
+                if 'remodeling_mat' in self.mat_params[n]['growth']:
                     self.mat_remodel[n] = True
                 self.internalvars['theta'], self.internalvars_old['theta'] = self.theta, self.theta_old
             else:
                 self.mat_growth_thres.append(ufl.as_ufl(0))
 
-            if 'plastic' in self.constitutive_models['MAT'+str(n+1)+''].keys():
+            if 'plastic' in self.mat_params[n]:
                 self.mat_plastic[n], self.have_plasticity = True, True
                 self.localsolve = True
                 self.internalvars['e_plast'], self.internalvars_old['e_plast'] = self.F_plast, self.F_plast_old
                 
-            if 'visco' in self.constitutive_models['MAT'+str(n+1)+''].keys():
+            if 'visco' in self.mat_params[n]:
                 self.mat_visco[n], self.have_visco_mat = True, True
                 
         # full linearization of our remodeling law can lead to excessive compiler times for FFCx... :-/
@@ -266,11 +271,15 @@ class SolidmechanicsProblem(problem_base):
         try: self.lin_remod_full = fem_params['lin_remodeling_full']
         except: self.lin_remod_full = True
 
-        # growth threshold (as function, since in multiscale approach, it can vary element-wise)
+        # growth threshold (as function, since in multiscale approach, it can vary element-wise) - constant per domain, so all
+        # dofs of a domain's cells are set directly (no projection needed)
         if self.have_growth and self.localsolve:
-            growth_thres_proj = project(self.mat_growth_thres, self.Vd_scalar, self.dx_)
-            self.growth_thres.vector.ghostUpdate(addv=PETSc.InsertMode.ADD, mode=PETSc.ScatterMode.REVERSE)
-            self.growth_thres.interpolate(growth_thres_proj)
+            cell_dofs = self.Vd_scalar.dofmap.list.array.reshape(-1, self.Vd_scalar.dofmap.dof_layout.num_dofs)
+            for n in range(self.num_domains):
+                thres = float(getattr(self.mat_growth_thres[n], 'value', self.mat_growth_thres[n]))
+                if self.io.mt_d is not None: self.growth_thres.x.array[cell_dofs[self.io.mt_d.find(n+1)]] = thres
+                else:                        self.growth_thres.x.array[:] = thres
+            self.growth_thres.x.scatter_forward()
 
         # read in fiber data
         if have_fiber1:
@@ -294,7 +303,38 @@ class SolidmechanicsProblem(problem_base):
         # initialize material/constitutive classes (one per domain)
         self.ma = []
         for n in range(self.num_domains):
-            self.ma.append(solid_kinematics_constitutive.constitutive(self.ki, self.constitutive_models['MAT'+str(n+1)+''], self.incompressible_2field, mat_growth=self.mat_growth[n], mat_remodel=self.mat_remodel[n], mat_plastic=self.mat_plastic[n]))
+            self.ma.append(solid_kinematics_constitutive.constitutive(self.ki, self.mat_params[n], self.incompressible_2field, mat_growth=self.mat_growth[n], mat_remodel=self.mat_remodel[n], mat_plastic=self.mat_plastic[n]))
+
+        # initial material stiffness of each domain with Rayleigh damping - evaluated at the fixed initial (zero) state, so it is
+        # built once here and shared by the current and old damping virtual work
+        self.Cmat_ini = []
+        for n in range(self.num_domains):
+            if self.rayleigh[n]: self.Cmat_ini.append(self.ma[n].S(self.u_ini, self.p_ini, ivar={"theta" : self.theta_ini, "tau_a" : self.tau_a_ini}, tang=True))
+            else:                self.Cmat_ini.append(None)
+
+        # with several domains, domain-wise data can be given as cell-wise (DG0) fields, so that the virtual works of all domains
+        # are integrated at once, giving one form kernel instead of one per domain (requires all cells to be tagged, since these
+        # integrals run over the whole mesh)
+        self.ma_all, self.mat_params_all, self.dx_all, self.rho0_all = None, None, None, None
+        if self.num_domains > 1 and self.io.mt_d is not None:
+            ncells = self.io.mesh.topology.index_map(self.io.mesh.topology.dim).size_local
+            tagged = np.isin(self.io.mt_d.values, np.arange(1, self.num_domains+1))
+            alltagged = min(self.comm.allgather(bool(np.isin(np.arange(ncells), self.io.mt_d.indices[tagged]).all())))
+            if alltagged:
+                V_dg0 = fem.FunctionSpace(self.io.mesh, (dg_type, 0))
+                self.dx_all = ufl.dx(subdomain_data=self.io.mt_d, metadata={'quadrature_degree': self.quad_degree})
+                # density and damping coefficients
+                if self.timint != 'static':
+                    self.rho0_all = utilities.domain_values_to_dg0_function(self.rho0, self.io.mt_d, V_dg0)
+                    self.eta_m_all = utilities.domain_values_to_dg0_function(self.eta_m, self.io.mt_d, V_dg0)
+                    self.eta_k_all = utilities.domain_values_to_dg0_function(self.eta_k, self.io.mt_d, V_dg0)
+                # if all domains share the same constitutive form and only differ in parameter values, one material whose
+                # parameters are cell-wise fields can be used for all of them
+                mat_params_all = utilities.mat_params_to_dg0_function(self.mat_params, self.io.mt_d, V_dg0)
+                if mat_params_all is not None:
+                    self.mat_params_all = mat_params_all
+                    self.ma_all = solid_kinematics_constitutive.constitutive(self.ki, mat_params_all, self.incompressible_2field, mat_growth=self.mat_growth[0], mat_remodel=self.mat_remodel[0], mat_plastic=self.mat_plastic[0])
+                    if self.rayleigh[0]: self.Cmat_ini_all = self.ma_all.S(self.u_ini, self.p_ini, ivar={"theta" : self.theta_ini, "tau_a" : self.tau_a_ini}, tang=True)
 
         # initialize solid variational form class
         self.vf = solid_variationalform.variationalform(self.var_u, self.du, self.var_p, self.dp, self.io.n0, self.x_ref)
@@ -315,6 +355,15 @@ class SolidmechanicsProblem(problem_base):
             self.bc.dirichlet_bcs(self.V_u)
 
         self.set_variational_forms_and_jacobians()
+        
+        # forms (and the linear system) for the postprocessing of growth rate and Laplace volume - compiled once here, and only
+        # re-assembled in each call
+        if self.have_growth:
+            self.growth_rate_form = fem.form(sum([(self.theta - self.theta_old) / (self.dt) * self.dx_[n] for n in range(self.num_domains)], ufl.as_ufl(0)))
+        if bool(self.volume_laplace):
+            self.set_volume_laplace_problem()
+        if self.have_active_stress and self.active_stress_trig == 'ode':
+            self.set_active_stress_ode_projectors()
 
 
     # the main function that defines the solid mechanics problem in terms of symbolic residual and jacobian forms
@@ -323,35 +372,77 @@ class SolidmechanicsProblem(problem_base):
         # set forms for acceleration and velocity
         self.acc, self.vel = self.ti.set_acc_vel(self.u, self.u_old, self.v_old, self.a_old)
 
-        # kinetic, internal, and pressure virtual work
-        self.deltaW_kin,  self.deltaW_kin_old  = ufl.as_ufl(0), ufl.as_ufl(0)
-        self.deltaW_int,  self.deltaW_int_old  = ufl.as_ufl(0), ufl.as_ufl(0)
-        self.deltaW_damp, self.deltaW_damp_old = ufl.as_ufl(0), ufl.as_ufl(0)
-        self.deltaW_p,    self.deltaW_p_old    = ufl.as_ufl(0), ufl.as_ufl(0)
+        # kinetic, internal, and pressure virtual work - the domain contributions are collected in lists and summed up once
+        W_kin,  W_kin_old  = [], []
+        W_int,  W_int_old  = [], []
+        W_damp, W_damp_old = [], []
+        W_p,    W_p_old    = [], []
+        
+        # materials (with parameters) and measures the internal and pressure virtual works and their linearizations are integrated
+        # with: one per domain, or one for all domains at once if they share the same constitutive form (material flags are the
+        # same for all domains then, so those of the first domain are used)
+        if self.ma_all is not None: mats, mat_params, dxs, ids = [self.ma_all], [self.mat_params_all], [self.dx_all], [0]
+        else:                       mats, mat_params, dxs, ids = self.ma, self.mat_params, self.dx_, list(range(self.num_domains))
+        
+        # stresses and material tangents - built once and reused in residuals and Jacobians, so that the forms share the same
+        # expressions
+        S_u, S_u_old, Cmat_u = [], [], []
+        for m in range(len(mats)):
+            S_u.append(mats[m].S(self.u, self.p, ivar=self.internalvars, rvar=self.ratevars))
+            S_u_old.append(mats[m].S(self.u_old, self.p_old, ivar=self.internalvars_old, rvar=self.ratevars_old))
+            Cmat_u.append(mats[m].S(self.u, self.p, ivar=self.internalvars, rvar=self.ratevars, tang=True))
+        
+        # kinematic quantities shared by all domains
+        F_u, F_u_old = self.ki.F(self.u), self.ki.F(self.u_old)
+        J_u, J_u_old, dJdC_u = self.ki.J(self.u), self.ki.J(self.u_old), self.ki.dJdC(self.u)
+        
+        # volumetric change entering the pressure virtual work: this has to be treated like the evaluation of a volumetric material,
+        # hence with the elastic part of J for growth materials
+        J_p, J_p_old = [], []
+        for m in range(len(mats)):
+            if not self.incompressible_2field:
+                break
+            if self.mat_growth[ids[m]]:
+                J_p.append(mats[m].J_e(self.u, self.theta)), J_p_old.append(mats[m].J_e(self.u_old, self.theta_old))
+            else:
+                J_p.append(J_u), J_p_old.append(J_u_old)
         
         for n in range(self.num_domains):
 
             if self.timint != 'static':
                 # kinetic virtual work
-                self.deltaW_kin     += self.vf.deltaW_kin(self.acc, self.rho0[n], self.dx_[n])
-                self.deltaW_kin_old += self.vf.deltaW_kin(self.a_old, self.rho0[n], self.dx_[n])
+                if self.rho0_all is None:
+                    W_kin.append(self.vf.deltaW_kin(self.acc, self.rho0[n], self.dx_[n]))
+                    W_kin_old.append(self.vf.deltaW_kin(self.a_old, self.rho0[n], self.dx_[n]))
 
                 # Rayleigh damping virtual work
-                if self.rayleigh[n]:
-                    self.deltaW_damp     += self.vf.deltaW_damp(self.eta_m[n], self.eta_k[n], self.rho0[n], self.ma[n].S(self.u_ini, self.p_ini, ivar={"theta" : self.theta_ini, "tau_a" : self.tau_a_ini}, tang=True), self.vel, self.dx_[n])
-                    self.deltaW_damp_old += self.vf.deltaW_damp(self.eta_m[n], self.eta_k[n], self.rho0[n], self.ma[n].S(self.u_ini, self.p_ini, ivar={"theta" : self.theta_ini, "tau_a" : self.tau_a_ini}, tang=True), self.v_old, self.dx_[n])
-
+                if self.rayleigh[n] and self.ma_all is None:
+                    W_damp.append(self.vf.deltaW_damp(self.eta_m[n], self.eta_k[n], self.rho0[n], self.Cmat_ini[n], self.vel, self.dx_[n]))
+                    W_damp_old.append(self.vf.deltaW_damp(self.eta_m[n], self.eta_k[n], self.rho0[n], self.Cmat_ini[n], self.v_old, self.dx_[n]))
+
+        # kinetic and damping virtual work of all domains in one integral
+        if self.rho0_all is not None:
+            W_kin     = [self.vf.deltaW_kin(self.acc, self.rho0_all, self.dx_all)]
+            W_kin_old = [self.vf.deltaW_kin(self.a_old, self.rho0_all, self.dx_all)]
+        if self.ma_all is not None and self.timint != 'static' and self.rayleigh[0]:
+            W_damp     = [self.vf.deltaW_damp(self.eta_m_all, self.eta_k_all, self.rho0_all, self.Cmat_ini_all, self.vel, self.dx_all)]
+            W_damp_old = [self.vf.deltaW_damp(self.eta_m_all, self.eta_k_all, self.rho0_all, self.Cmat_ini_all, self.v_old, self.dx_all)]
+        
+        for m in range(len(mats)):
+            
             # internal virtual work
-            self.deltaW_int     += self.vf.deltaW_int(self.ma[n].S(self.u, self.p, ivar=self.internalvars, rvar=self.ratevars), self.ki.F(self.u), self.dx_[n])
-            self.deltaW_int_old += self.vf.deltaW_int(self.ma[n].S(self.u_old, self.p_old, ivar=self.internalvars_old, rvar=self.ratevars_old), self.ki.F(self.u_old), self.dx_[n])
+            W_int.append(self.vf.deltaW_int(S_u[m], F_u, dxs[m]))
+            W_int_old.append(self.vf.deltaW_int(S_u_old[m], F_u_old, dxs[m]))
         
             # pressure virtual work (for incompressible formulation)
-            # this has to be treated like the evaluation of a volumetric material, hence with the elastic part of J
-            if self.mat_growth[n]: J, J_old = self.ma[n].J_e(self.u, self.theta), self.ma[n].J_e(self.u_old, self.theta_old)
-            else:                  J, J_old = self.ki.J(self.u), self.ki.J(self.u_old)
-            self.deltaW_p       += self.vf.deltaW_int_pres(J, self.dx_[n])
-            self.deltaW_p_old   += self.vf.deltaW_int_pres(J_old, self.dx_[n])
+            if self.incompressible_2field:
+                W_p.append(self.vf.deltaW_int_pres(J_p[m], dxs[m]))
+                W_p_old.append(self.vf.deltaW_int_pres(J_p_old[m], dxs[m]))
         
+        self.deltaW_kin,  self.deltaW_kin_old  = sum(W_kin, ufl.as_ufl(0)),  sum(W_kin_old, ufl.as_ufl(0))
+        self.deltaW_int,  self.deltaW_int_old  = sum(W_int, ufl.as_ufl(0)),  sum(W_int_old, ufl.as_ufl(0))
+        self.deltaW_damp, self.deltaW_damp_old = sum(W_damp, ufl.as_ufl(0)), sum(W_damp_old, ufl.as_ufl(0))
+        self.deltaW_p,    self.deltaW_p_old    = sum(W_p, ufl.as_ufl(0)),    sum(W_p_old, ufl.as_ufl(0))
         
         # external virtual work (from Neumann or Robin boundary conditions, body forces, ...)
         w_neumann, w_neumann_old, w_robin, w_robin_old, w_membrane, w_membrane_old = ufl.as_ufl(0), ufl.as_ufl(0), ufl.as_ufl(0), ufl.as_ufl(0), ufl.as_ufl(0), ufl.as_ufl(0)
@@ -365,20 +456,27 @@ class SolidmechanicsProblem(problem_base):
         # for (quasi-static) prestressing, we need to eliminate dashpots and replace true with reference Neumann loads in our external virtual work
         w_neumann_prestr, w_robin_prestr = ufl.as_ufl(0), ufl.as_ufl(0)
         if self.prestress_initial:
-            bc_dict_prestr = copy.deepcopy(self.bc_dict)
-            # get rid of dashpots
-            if 'robin' in bc_dict_prestr.keys():
-                for r in bc_dict_prestr['robin']:
-                    if r['type'] == 'dashpot': r['visc'] = 0.
-            # replace true Neumann loads by reference ones
-            if 'neumann' in bc_dict_prestr.keys():
-                for n in bc_dict_prestr['neumann']:
-                    if n['type'] == 'true': n['type'] = 'pk1'
-            bc_prestr = boundaryconditions.boundary_cond_solid(bc_dict_prestr, self.fem_params, self.io, self.ki, self.vf, self.ti)
-            if 'neumann' in bc_dict_prestr.keys():
-                w_neumann_prestr, _ = bc_prestr.neumann_bcs(self.V_u, self.Vd_scalar, self.u, self.u_old)
-            if 'robin' in bc_dict_prestr.keys():
-                w_robin_prestr, _ = bc_prestr.robin_bcs(self.u, self.vel, self.u_old, self.v_old, self.u_pre)
+            # only if there are dashpots or true Neumann loads, we need an own (modified) set of boundary conditions
+            have_dashpot = any(r['type'] == 'dashpot' for r in self.bc_dict.get('robin', []))
+            have_true_neumann = any(n['type'] == 'true' for n in self.bc_dict.get('neumann', []))
+            if have_dashpot or have_true_neumann:
+                bc_dict_prestr = copy.deepcopy(self.bc_dict)
+                # get rid of dashpots
+                if 'robin' in bc_dict_prestr.keys():
+                    for r in bc_dict_prestr['robin']:
+                        if r['type'] == 'dashpot': r['visc'] = 0.
+                # replace true Neumann loads by reference ones
+                if 'neumann' in bc_dict_prestr.keys():
+                    for n in bc_dict_prestr['neumann']:
+                        if n['type'] == 'true': n['type'] = 'pk1'
+                bc_prestr = boundaryconditions.boundary_cond_solid(bc_dict_prestr, self.fem_params, self.io, self.ki, self.vf, self.ti)
+                if 'neumann' in bc_dict_prestr.keys():
+                    w_neumann_prestr, _ = bc_prestr.neumann_bcs(self.V_u, self.Vd_scalar, self.u, self.u_old)
+                if 'robin' in bc_dict_prestr.keys():
+                    w_robin_prestr, _ = bc_prestr.robin_bcs(self.u, self.vel, self.u_old, self.v_old, self.u_pre)
+            else:
+                # the true external virtual work can be used as it is
+                w_neumann_prestr, w_robin_prestr = w_neumann, w_robin
             self.deltaW_prestr_ext = w_neumann_prestr + w_robin_prestr
 
         # TODO: Body forces!
@@ -447,29 +545,32 @@ class SolidmechanicsProblem(problem_base):
         # point level with deformation-dependent internal variables (i.e. growth or plasticity), we make use of a more explicit formulation
         # of the linearization which involves the fourth-order material tangent operator Ctang ("derivative" cannot take care of the
         # dependence of the internal variables on the deformation if this dependence is nonlinear and cannot be expressed analytically)
-        for n in range(self.num_domains):
+        Lin_int = []
+        for m in range(len(mats)):
             
-            # material tangent operator
-            Cmat = self.ma[n].S(self.u, self.p, ivar=self.internalvars, rvar=self.ratevars, tang=True)
+            n = ids[m]
+            
+            # tangent operator: sum of the material tangent and the contributions that are active for this domain's material
+            # (switched in Python, so inactive ones do not enter the form at all)
+            Ctang_terms = [Cmat_u[m]]
             
             # visco material tangent - TODO: Think of how ufl can handle this
             if self.mat_visco[n]:
-                eta = self.constitutive_models['MAT'+str(n+1)+'']['visco']['eta']
-                Cmat += self.ma[n].Cvisco(eta, self.dt)
+                eta = mat_params[m]['visco']['eta']
+                Ctang_terms.append(mats[m].Cvisco(eta, self.dt))
 
             if self.mat_growth[n] and self.mat_growth_trig[n] != 'prescribed' and self.mat_growth_trig[n] != 'prescribed_multiscale':
                 # growth tangent operator
-                Cgrowth = self.ma[n].Cgrowth(self.u, self.p, self.internalvars, self.ratevars, self.theta_old, self.dt, self.growth_thres)
+                Ctang_terms.append(mats[m].Cgrowth(self.u, self.p, self.internalvars, self.ratevars, self.theta_old, self.dt, self.growth_thres))
                 if self.mat_remodel[n] and self.lin_remod_full:
                     # remodeling tangent operator
-                    Cremod = self.ma[n].Cremod(self.u, self.p, self.internalvars, self.ratevars, self.theta_old, self.dt, self.growth_thres)
-                    Ctang = Cmat + Cgrowth + Cremod
-                else:
-                    Ctang = Cmat + Cgrowth
-            else:
-                Ctang = Cmat
+                    Ctang_terms.append(mats[m].Cremod(self.u, self.p, self.internalvars, self.ratevars, self.theta_old, self.dt, self.growth_thres))
             
-            self.jac_uu += self.timefac * self.vf.Lin_deltaW_int_du(self.ma[n].S(self.u, self.p, ivar=self.internalvars, rvar=self.ratevars), self.ki.F(self.u), self.u, Ctang, self.dx_[n])
+            Ctang = sum(Ctang_terms[1:], Ctang_terms[0])
+            
+            Lin_int.append(self.vf.Lin_deltaW_int_du(S_u[m], F_u, self.u, Ctang, dxs[m]))
+        
+        self.jac_uu += self.timefac * sum(Lin_int, ufl.as_ufl(0))
         
         # Rayleigh damping virtual work contribution to stiffness
         self.jac_uu += self.timefac * ufl.derivative(self.deltaW_damp, self.u, self.du)
@@ -480,49 +581,52 @@ class SolidmechanicsProblem(problem_base):
         # pressure contributions
         if self.incompressible_2field:
             
-            self.jac_up, self.jac_pu, self.a_p11, self.p11 = ufl.as_ufl(0), ufl.as_ufl(0), ufl.as_ufl(0), ufl.as_ufl(0)
+            Lin_int_p, Lin_pres_u, self.p11 = [], [], ufl.as_ufl(0)
             
-            for n in range(self.num_domains):
-                # this has to be treated like the evaluation of a volumetric material, hence with the elastic part of J
-                if self.mat_growth[n]:
-                    J    = self.ma[n].J_e(self.u, self.theta)
-                    Jmat = self.ma[n].dJedC(self.u, self.theta)
-                else:
-                    J    = self.ki.J(self.u)
-                    Jmat = self.ki.dJdC(self.u)
+            for m in range(len(mats)):
+                
+                n = ids[m]
+                
+                J = J_p[m]
+                if self.mat_growth[n]: Jmat = mats[m].dJedC(self.u, self.theta)
+                else:                  Jmat = dJdC_u
                 
-                Cmat_p = ufl.diff(self.ma[n].S(self.u, self.p, ivar=self.internalvars, rvar=self.ratevars), self.p)
+                Ctang_p_terms = [ufl.diff(S_u[m], self.p)]
                 
                 if self.mat_growth[n] and self.mat_growth_trig[n] != 'prescribed' and self.mat_growth_trig[n] != 'prescribed_multiscale':
-                    Cmat = self.ma[n].S(self.u, self.p, ivar=self.internalvars, rvar=self.ratevars, tang=True)
                     # growth tangent operators - keep in mind that we have theta = theta(C(u),p) in general!
                     # for stress-mediated growth, we get a contribution to the pressure material tangent operator
-                    Cgrowth_p = self.ma[n].Cgrowth_p(self.u, self.p, self.internalvars, self.ratevars, self.theta_old, self.dt, self.growth_thres)
+                    Ctang_p_terms.append(mats[m].Cgrowth_p(self.u, self.p, self.internalvars, self.ratevars, self.theta_old, self.dt, self.growth_thres))
                     if self.mat_remodel[n] and self.lin_remod_full:
                         # remodeling tangent operator
-                        Cremod_p = self.ma[n].Cremod_p(self.u, self.p, self.internalvars, self.ratevars, self.theta_old, self.dt, self.growth_thres)
-                        Ctang_p = Cmat_p + Cgrowth_p + Cremod_p
-                    else:
-                        Ctang_p = Cmat_p + Cgrowth_p
+                        Ctang_p_terms.append(mats[m].Cremod_p(self.u, self.p, self.internalvars, self.ratevars, self.theta_old, self.dt, self.growth_thres))
                     # for all types of deformation-dependent growth, we need to add the growth contributions to the Jacobian tangent operator
-                    Jgrowth = ufl.diff(J,self.theta) * self.ma[n].dtheta_dC(self.u, self.p, self.internalvars, self.ratevars, self.theta_old, self.dt, self.growth_thres)
+                    dJdtheta = ufl.diff(J,self.theta)
+                    Jgrowth = dJdtheta * mats[m].dtheta_dC(self.u, self.p, self.internalvars, self.ratevars, self.theta_old, self.dt, self.growth_thres)
                     Jtang = Jmat + Jgrowth
                     # ok... for stress-mediated growth, we actually get a non-zero right-bottom (11) block in our saddle-point system matrix,
                     # since Je = Je(C,theta(C,p)) ---> dJe/dp = dJe/dtheta * dtheta/dp
                     # TeX: D_{\Delta p}\!\int\limits_{\Omega_0} (J^{\mathrm{e}}-1)\delta p\,\mathrm{d}V = \int\limits_{\Omega_0} \frac{\partial J^{\mathrm{e}}}{\partial p}\Delta p \,\delta p\,\mathrm{d}V,
                     # with \frac{\partial J^{\mathrm{e}}}{\partial p} = \frac{\partial J^{\mathrm{e}}}{\partial \vartheta}\frac{\partial \vartheta}{\partial p}
-                    dthetadp = self.ma[n].dtheta_dp(self.u, self.p, self.internalvars, self.ratevars, self.theta_old, self.dt, self.growth_thres)
+                    dthetadp = mats[m].dtheta_dp(self.u, self.p, self.internalvars, self.ratevars, self.theta_old, self.dt, self.growth_thres)
                     if not isinstance(dthetadp, ufl.constantvalue.Zero):
-                        self.p11 += ufl.diff(J,self.theta) * dthetadp * self.dp * self.var_p * self.dx_[n]
+                        self.p11 += dJdtheta * dthetadp * self.dp * self.var_p * dxs[m]
                 else:
-                    Ctang_p = Cmat_p
                     Jtang = Jmat
                 
-                self.jac_up += self.timefac * self.vf.Lin_deltaW_int_dp(self.ki.F(self.u), Ctang_p, self.dx_[n])
-                self.jac_pu += self.timefac * self.vf.Lin_deltaW_int_pres_du(self.ki.F(self.u), Jtang, self.u, self.dx_[n])
+                Ctang_p = sum(Ctang_p_terms[1:], Ctang_p_terms[0])
                 
-                # for saddle-point block-diagonal preconditioner
-                self.a_p11 += ufl.inner(self.dp, self.var_p) * self.dx_[n]
+                Lin_int_p.append(self.vf.Lin_deltaW_int_dp(F_u, Ctang_p, dxs[m]))
+                Lin_pres_u.append(self.vf.Lin_deltaW_int_pres_du(F_u, Jtang, self.u, dxs[m]))
+            
+            self.jac_up = self.timefac * sum(Lin_int_p, ufl.as_ufl(0))
+            self.jac_pu = self.timefac * sum(Lin_pres_u, ufl.as_ufl(0))
+            
+            # for saddle-point block-diagonal preconditioner (same integrand in all domains)
+            if self.dx_all is not None:
+                self.a_p11 = ufl.inner(self.dp, self.var_p) * self.dx_all
+            else:
+                self.a_p11 = sum([ufl.inner(self.dp, self.var_p) * self.dx_[n] for n in range(self.num_domains)], ufl.as_ufl(0))
 
         if self.prestress_initial:
             # quasi-static weak forms (don't dare to use fancy growth laws or other inelastic stuff during prestressing...)
@@ -534,36 +638,46 @@ class SolidmechanicsProblem(problem_base):
                 self.jac_prestress_pu = ufl.derivative(self.weakform_prestress_p, self.u, self.du)
 
 
-        
-    # reference coordinates
-    def x_ref_expr(self, x):
-        return np.stack((x[0],x[1],x[2]))
-
-
     # active stress ODE evaluation
-    def evaluate_active_stress_ode(self, t):
-    
+    # the explicit active stress (and Frank-Starling amplification) update is an L2 projection onto Vd_scalar of expressions
+    # whose only time dependence is the activation value of each active material, which therefore enters as a constant -
+    # so the projection forms are compiled once, and for a DG0 space (diagonal mass matrix) no linear solve is needed
+    def set_active_stress_ode_projectors(self):
+        
+        self.ua_act, self.ua_act_old = [], []
+        for na in range(len(self.actstress)):
+            self.ua_act.append(fem.Constant(self.io.mesh, PETSc.ScalarType(0.)))
+            self.ua_act_old.append(fem.Constant(self.io.mesh, PETSc.ScalarType(0.)))
+        
+        lumped = (self.order_disp == 1)
+        
         # take care of Frank-Starling law (fiber stretch-dependent contractility)
         if self.have_frank_starling:
             
             amp_old_, na = [], 0
             for n in range(self.num_domains):
 
-                if self.mat_active_stress[n] and self.actstress[na].frankstarling:
+                if self.mat_active_stress[n]:
+                    
+                    if self.actstress[na].frankstarling:
 
-                    # old fiber stretch (needed for Frank-Starling law)
-                    if self.mat_growth[n]: lam_fib_old = self.ma[n].fibstretch_e(self.ki.C(self.u_old), self.theta_old, self.fib_func[0])
-                    else:                  lam_fib_old = self.ki.fibstretch(self.u_old, self.fib_func[0])
+                        # old fiber stretch (needed for Frank-Starling law)
+                        if self.mat_growth[n]: lam_fib_old = self.ma[n].fibstretch_e(self.ki.C(self.u_old), self.theta_old, self.fib_func[0])
+                        else:                  lam_fib_old = self.ki.fibstretch(self.u_old, self.fib_func[0])
+                        
+                        amp_old_.append(self.actstress[na].amp(self.ua_act_old[na], lam_fib_old, self.amp_old))
                     
-                    amp_old_.append(self.actstress[na].amp(t-self.dt, lam_fib_old, self.amp_old))
+                    else:
+                        
+                        amp_old_.append(ufl.as_ufl(0))
+                    
+                    na+=1
 
                 else:
                     
                     amp_old_.append(ufl.as_ufl(0))
 
-            amp_old_proj = project(amp_old_, self.Vd_scalar, self.dx_)
-            self.amp_old.vector.ghostUpdate(addv=PETSc.InsertMode.ADD, mode=PETSc.ScatterMode.REVERSE)
-            self.amp_old.interpolate(amp_old_proj)
+            self.amp_old_projector = projector(amp_old_, self.Vd_scalar, self.dx_, lumped=lumped)
         
         tau_a_, na = [], 0
         for n in range(self.num_domains):
@@ -577,16 +691,33 @@ class SolidmechanicsProblem(problem_base):
                 else:
                     lam_fib = ufl.as_ufl(1)
                 
-                tau_a_.append(self.actstress[na].tau_act(self.tau_a_old, t, self.dt, lam_fib, self.amp_old))
+                tau_a_.append(self.actstress[na].tau_act(self.tau_a_old, self.ua_act[na], self.dt, lam_fib, self.amp_old))
                 
                 na+=1
                 
             else:
                 
                 tau_a_.append(ufl.as_ufl(0))
+        
+        self.tau_a_projector = projector(tau_a_, self.Vd_scalar, self.dx_, lumped=lumped)
+
+
+    def evaluate_active_stress_ode(self, t):
+        
+        # update the activation values
+        for na in range(len(self.actstress)):
+            self.ua_act[na].value = self.actstress[na].ua(t)
+            self.ua_act_old[na].value = self.actstress[na].ua(t-self.dt)
+    
+        # take care of Frank-Starling law (fiber stretch-dependent contractility)
+        if self.have_frank_starling:
+            
+            amp_old_proj = self.amp_old_projector()
+            self.amp_old.vector.ghostUpdate(addv=PETSc.InsertMode.ADD, mode=PETSc.ScatterMode.REVERSE)
+            self.amp_old.interpolate(amp_old_proj)
                 
         # project and interpolate to quadrature function space
-        tau_a_proj = project(tau_a_, self.Vd_scalar, self.dx_)
+        tau_a_proj = self.tau_a_projector()
         self.tau_a.vector.ghostUpdate(addv=PETSc.InsertMode.ADD, mode=PETSc.ScatterMode.REVERSE)
         self.tau_a.interpolate(tau_a_proj)
 
@@ -594,13 +725,10 @@ class SolidmechanicsProblem(problem_base):
     # computes and prints the growth rate of the whole solid
     def compute_solid_growth_rate(self, N, t):
         
-        dtheta_all = ufl.as_ufl(0)
-        for n in range(self.num_domains):
-            dtheta_all += (self.theta - self.theta_old) / (self.dt) * self.dx_[n]
-
-        gr = fem.assemble_scalar(fem.form(dtheta_all))
-        gr = self.comm.allgather(gr)
-        self.growth_rate = sum(gr)
+        # sum-reduction of the local contributions (growth rate is needed on all ranks)
+        gr = np.array([fem.assemble_scalar(self.growth_rate_form)], dtype=np.float64)
+        self.comm.Allreduce(MPI.IN_PLACE, gr, op=MPI.SUM)
+        self.growth_rate = float(gr[0])
 
         if self.comm.rank == 0:
             print('Solid growth rate: %.4e' % (self.growth_rate))
@@ -623,36 +751,56 @@ class SolidmechanicsProblem(problem_base):
             self.evaluate_active_stress_ode(t_abs-t_off)
 
 
-    # compute volumes of a surface from a Laplace problem
-    def solve_volume_laplace(self, N, t):
+    # linear Laplace problem for the volume computation, with the current displacement prescribed on the surface volume_laplace[0]:
+    # the system matrix does not depend on the displacement, so it is assembled once, and only the right-hand side changes
+    def set_volume_laplace_problem(self):
 
         # Define variational problem
-        uf = TrialFunction(self.V_u)
-        vf = TestFunction(self.V_u)
+        uf = ufl.TrialFunction(self.V_u)
+        vf = ufl.TestFunction(self.V_u)
         
-        f = Function(self.V_u) # zero source term
+        f = fem.Function(self.V_u) # zero source term
         
-        a, L = ufl.as_ufl(0), ufl.as_ufl(0)
-        for n in range(self.num_domains):
-            a += ufl.inner(ufl.grad(uf), ufl.grad(vf))*self.dx_[n]
-            L += ufl.dot(f,vf)*self.dx_[n]
+        a = sum([ufl.inner(ufl.grad(uf), ufl.grad(vf))*self.dx_[n] for n in range(self.num_domains)], ufl.as_ufl(0))
+        L = sum([ufl.dot(f,vf)*self.dx_[n] for n in range(self.num_domains)], ufl.as_ufl(0))
 
-        uf = Function(self.V_u, name="uf")
+        self.uf_laplace = fem.Function(self.V_u, name="uf")
+        
+        dofs_laplace = fem.locate_dofs_topological(self.V_u, 2, self.io.mt_b1.indices[self.io.mt_b1.values == self.volume_laplace[0]])
+        self.dbcs_laplace = [fem.dirichletbc(self.u, dofs_laplace)]
+        
+        self.a_laplace, self.L_laplace = fem.form(a), fem.form(L)
         
-        dbcs_laplace=[]
-        dbcs_laplace.append( DirichletBC(self.u, locate_dofs_topological(self.V_u, 2, self.io.mt_b1.indices[self.io.mt_b1.values == self.volume_laplace[0]])) )
+        self.A_laplace = fem.petsc.assemble_matrix(self.a_laplace, bcs=self.dbcs_laplace)
+        self.A_laplace.assemble()
+        
+        self.b_laplace = fem.petsc.create_vector(self.L_laplace)
+        
+        self.ksp_laplace = PETSc.KSP().create(self.comm)
+        self.ksp_laplace.setOperators(self.A_laplace)
+        
+        vol_all = sum([ufl.det(ufl.Identity(len(self.uf_laplace)) + ufl.grad(self.uf_laplace)) * self.dx_[n] for n in range(self.num_domains)], ufl.as_ufl(0))
+        self.vol_laplace_form = fem.form(vol_all)
 
-        # solve linear Laplace problem
-        lp = LinearProblem(a, L, bcs=dbcs_laplace, u=uf)
-        lp.solve()
 
-        vol_all = ufl.as_ufl(0)
-        for n in range(self.num_domains):
-            vol_all += ufl.det(ufl.Identity(len(uf)) + ufl.grad(uf)) * self.dx_[n]
+    # compute volumes of a surface from a Laplace problem
+    def solve_volume_laplace(self, N, t):
 
-        vol = fem.assemble_scalar(fem.form(vol_all))
-        vol = self.comm.allgather(vol)
-        volume = sum(vol)
+        # solve linear Laplace problem
+        with self.b_laplace.localForm() as b_local: b_local.set(0.0)
+        fem.petsc.assemble_vector(self.b_laplace, self.L_laplace)
+        fem.apply_lifting(self.b_laplace, [self.a_laplace], [self.dbcs_laplace])
+        self.b_laplace.ghostUpdate(addv=PETSc.InsertMode.ADD, mode=PETSc.ScatterMode.REVERSE)
+        fem.set_bc(self.b_laplace, self.dbcs_laplace)
+        
+        self.ksp_laplace.solve(self.b_laplace, self.uf_laplace.vector)
+        self.uf_laplace.vector.ghostUpdate(addv=PETSc.InsertMode.INSERT, mode=PETSc.ScatterMode.FORWARD)
+
+        # sum-reduction of the local contributions to rank 0 (only needed there for writing)
+        vol = np.array([fem.assemble_scalar(self.vol_laplace_form)], dtype=np.float64)
+        if self.comm.rank == 0: self.comm.Reduce(MPI.IN_PLACE, vol, op=MPI.SUM, root=0)
+        else:                   self.comm.Reduce(vol, None, op=MPI.SUM, root=0)
+        volume = float(vol[0])
         
         if self.comm.rank == 0:
             if self.io.write_results_every > 0 and N % self.io.write_results_every == 0:
@@ -20,13 +20,8 @@ class constitutive:
         
         self.kin = kin
         
-        self.matmodels = []
-        for i in range(len(materials.keys())):
-            self.matmodels.append(list(materials.keys())[i])
-        
-        self.matparams = []
-        for i in range(len(materials.values())):
-            self.matparams.append(list(materials.values())[i])
+        self.matmodels = list(materials.keys())
+        self.matparams = list(materials.values())
         
         self.mat_growth = mat_growth
         self.mat_remodel = mat_remodel
@@ -41,16 +36,14 @@ class constitutive:
             
             if self.mat_remodel:
                 
-                self.matmodels_remod = []
-                for i in range(len(self.gandrparams['remodeling_mat'].keys())):
-                    self.matmodels_remod.append(list(self.gandrparams['remodeling_mat'].keys())[i])
-                
-                self.matparams_remod = []
-                for i in range(len(self.gandrparams['remodeling_mat'].values())):
-                    self.matparams_remod.append(list(self.gandrparams['remodeling_mat'].values())[i])
+                self.matmodels_remod = list(self.gandrparams['remodeling_mat'].keys())
+                self.matparams_remod = list(self.gandrparams['remodeling_mat'].values())
             
         # identity tensor
         self.I = ufl.Identity(3)
+        
+        # cache of (growth) tangent expressions, see tangent_memo
+        self.tangent_cache = {}
 
 
     # 2nd Piola-Kirchhoff stress core routine
@@ -380,7 +373,23 @@ class constitutive:
 
 
     
+    # the growth tangent contributions dtheta/dC, dtheta/dp and dS/dF_g each enter several operators (Cgrowth, Cgrowth_p, Cremod, Cremod_p,
+    # and the growth parts of the Jacobian), so they are only built once per set of arguments and then shared as one subexpression
+    def tangent_memo(self, name, fnc, *args):
+        
+        if name in self.tangent_cache and all(a is b for a, b in zip(self.tangent_cache[name][0], args)):
+            return self.tangent_cache[name][1]
+        
+        self.tangent_cache[name] = (args, fnc(*args))
+        
+        return self.tangent_cache[name][1]
+
+
     def dtheta_dC(self, u_, p_, ivar, rvar, theta_old_, dt, thres):
+        return self.tangent_memo('dtheta_dC', self.build_dtheta_dC, u_, p_, ivar, rvar, theta_old_, dt, thres)
+
+
+    def build_dtheta_dC(self, u_, p_, ivar, rvar, theta_old_, dt, thres):
         
         theta_ = ivar["theta"]
         
@@ -419,6 +428,10 @@ class constitutive:
     # \bar{\mathbb{I}}       = \boldsymbol{1}\,\underline{\otimes}\,\boldsymbol{1} = \delta_{il}\delta_{jk} \; \hat{\boldsymbol{e}}_{i} \otimes \hat{\boldsymbol{e}}_{j} \otimes \hat{\boldsymbol{e}}_{k} \otimes \hat{\boldsymbol{e}}_{l}
     # \bar{\bar{\mathbb{I}}} = \boldsymbol{1}\otimes\boldsymbol{1} = \delta_{ij}\delta_{kl} \; \hat{\boldsymbol{e}}_{i} \otimes \hat{\boldsymbol{e}}_{j} \otimes \hat{\boldsymbol{e}}_{k} \otimes \hat{\boldsymbol{e}}_{l}
     def dS_dFg(self, u_, p_, ivar, rvar, theta_old_, dt):
+        return self.tangent_memo('dS_dFg', self.build_dS_dFg, u_, p_, ivar, rvar, theta_old_, dt)
+
+
+    def build_dS_dFg(self, u_, p_, ivar, rvar, theta_old_, dt):
         
         theta_ = ivar["theta"]
 
@@ -467,6 +480,10 @@ class constitutive:
 
     # for a 2-field functional with u and p as variables, theta can depend on p in case of stress-mediated growth!
     def dtheta_dp(self, u_, p_, ivar, rvar, theta_old_, dt, thres):
+        return self.tangent_memo('dtheta_dp', self.build_dtheta_dp, u_, p_, ivar, rvar, theta_old_, dt, thres)
+
+
+    def build_dtheta_dp(self, u_, p_, ivar, rvar, theta_old_, dt, thres):
         
         theta_ = ivar["theta"]
         
@@ -481,7 +498,7 @@ class constitutive:
             
         elif self.growth_trig == 'fibstretch':
             
-            tangdp = as_ufl(0)
+            tangdp = ufl.as_ufl(0)
 
         else:
             raise NameError("Unkown growth_trig!")
@@ -294,7 +294,7 @@ class activestress_activation:
         
         self.act_curve = act_curve
         
-        if 'frankstarling' in self.params.keys(): self.frankstarling = self.params['frankstarling']
+        if 'frankstarling' in self.params: self.frankstarling = self.params['frankstarling']
         else: self.frankstarling = False
 
 
@@ -325,22 +325,24 @@ class activestress_activation:
 
     # Frank Starling amplification factor (Diss Hirschvogel eq. 2.106, 3.29)
     # \dot{a}(\lambda_{\mathrm{myo}}) = \dot{g}(\lambda_{\mathrm{myo}}) \,\mathbb{I}_{|u|_{-}>0}
-    def amp(self, t, lam, amp_old):
+    # ua: value of the activation function (float or constant)
+    def amp(self, ua, lam, amp_old):
         
-        uabs_minus = ufl.Max(-ufl.Min(self.ua(t),0),0)
+        uabs_minus = ufl.Max(-ufl.Min(ua,0),0)
 
         return ufl.conditional(ufl.gt(uabs_minus,0.), self.g(lam), amp_old)
 
 
     # Backward-Euler integration of active stress
-    def tau_act(self, tau_a_old, t, dt, lam=None, amp_old=None):
+    # ua: value of the activation function (float or constant)
+    def tau_act(self, tau_a_old, ua, dt, lam=None, amp_old=None):
         
-        uabs = abs(self.ua(t))
-        uabs_plus = ufl.Max(self.ua(t),0)
+        uabs = abs(ua)
+        uabs_plus = ufl.Max(ua,0)
         
         # Frank Starling amplification factor
         if self.frankstarling:
-            amp = self.amp(t, lam, amp_old)
+            amp = self.amp(ua, lam, amp_old)
         else:
             amp = 1.
             
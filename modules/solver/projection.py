@@ -6,11 +6,26 @@
 # This source code is licensed under the BSD-style license found in the
 # LICENSE file in the root directory of this source tree.
 
+from petsc4py import PETSc
 from dolfinx import fem
 import ufl
 
 def project(v, V, dx_, bcs=[], nm=None):
 
+    a, L = projection_forms(v, V, dx_)
+
+    # solve linear system for projection
+    function = fem.Function(V, name=nm)
+    
+    lp = fem.petsc.LinearProblem(a, L, bcs=bcs, u=function)
+    lp.solve()
+    
+    return function
+
+
+# mass matrix and right-hand side forms of the L2 projection of v onto V
+def projection_forms(v, V, dx_):
+
     w = ufl.TestFunction(V)
     Pv = ufl.TrialFunction(V)
 
@@ -32,10 +47,62 @@ def project(v, V, dx_, bcs=[], nm=None):
             a += ufl.inner(w, Pv) * dx_[n]
             L += ufl.inner(w, zerofnc) * dx_[n]
 
-    # solve linear system for projection
-    function = fem.Function(V, name=nm)
-    
-    lp = fem.petsc.LinearProblem(a, L, bcs=bcs, u=function)
-    lp.solve()
+    return a, L
+
+
+# repeated projection of the same expression (of functions that change over time) into a persistent function:
+# forms are compiled and the mass matrix is assembled (and its preconditioner set up) only once, each call then
+# only re-assembles the right-hand side and solves
+# lumped: use the row-sum lumped mass matrix, i.e. only scale the right-hand side by its (cached) inverse diagonal -
+# this is the exact L2 projection for spaces with a diagonal mass matrix (DG0), and no linear solve is needed
+class projector:
     
-    return function
+    def __init__(self, v, V, dx_, bcs=[], nm=None, lumped=False):
+
+        a, L = projection_forms(v, V, dx_)
+        
+        self.a, self.L = fem.form(a), fem.form(L)
+        self.bcs = bcs
+        self.lumped = lumped
+        
+        if self.lumped:
+            
+            assert(not bool(self.bcs))
+            
+            w = ufl.TestFunction(V)
+            m = ufl.as_ufl(0)
+            for n in range(len(dx_)):
+                m += w * dx_[n]
+            
+            self.Minv_diag = fem.petsc.assemble_vector(fem.form(m))
+            self.Minv_diag.ghostUpdate(addv=PETSc.InsertMode.ADD, mode=PETSc.ScatterMode.REVERSE)
+            self.Minv_diag.reciprocal()
+        
+        else:
+        
+            self.A = fem.petsc.assemble_matrix(self.a, bcs=self.bcs)
+            self.A.assemble()
+            
+            self.ksp = PETSc.KSP().create(V.mesh.comm)
+            self.ksp.setOperators(self.A)
+        
+        self.b = fem.petsc.create_vector(self.L)
+        
+        self.function = fem.Function(V, name=nm)
+
+
+    def __call__(self):
+        
+        with self.b.localForm() as b_local: b_local.set(0.0)
+        fem.petsc.assemble_vector(self.b, self.L)
+        if not self.lumped: fem.apply_lifting(self.b, [self.a], [self.bcs])
+        self.b.ghostUpdate(addv=PETSc.InsertMode.ADD, mode=PETSc.ScatterMode.REVERSE)
+        
+        if self.lumped:
+            self.function.vector.pointwiseMult(self.b, self.Minv_diag)
+        else:
+            fem.set_bc(self.b, self.bcs)
+            self.ksp.solve(self.b, self.function.vector)
+        self.function.vector.ghostUpdate(addv=PETSc.InsertMode.INSERT, mode=PETSc.ScatterMode.FORWARD)
+        
+        return self.function
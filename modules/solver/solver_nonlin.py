@@ -108,6 +108,32 @@ class solver_nonlinear:
                 self.weakform_p = self.pb.weakform_prestress_p
                 self.jac_up     = self.pb.jac_prestress_up
                 self.jac_pu     = self.pb.jac_prestress_pu
+        
+        if self.pb.incompressible_2field:
+            self.compile_forms(self.weakform_u, self.jac_uu, self.weakform_p, self.jac_up, self.jac_pu)
+        else:
+            self.compile_forms(self.weakform_u, self.jac_uu)
+
+
+    # compile the residual and Jacobian forms once - calling fem.form in every Newton iteration would redo the JIT (cache) lookup
+    # and the setup of the dolfinx forms each time
+    def compile_forms(self, weakform_u, jac_uu, weakform_p=None, jac_up=None, jac_pu=None):
+        
+        self.r_u_form  = fem.form(weakform_u, jit_params=self.pb.jit_params)
+        self.K_uu_form = fem.form(jac_uu, form_compiler_params=self.pb.form_compiler_params_jac, jit_params=self.pb.jit_params)
+        
+        if self.pb.incompressible_2field:
+            self.r_p_form  = fem.form(weakform_p, jit_params=self.pb.jit_params)
+            self.K_up_form = fem.form(jac_up, jit_params=self.pb.jit_params)
+            self.K_pu_form = fem.form(jac_pu, jit_params=self.pb.jit_params)
+            # for stress-mediated volumetric growth, K_pp is not zero!
+            if not isinstance(self.pb.p11, ufl.constantvalue.Zero):
+                self.K_pp_form = fem.form(self.pb.p11, jit_params=self.pb.jit_params)
+            else:
+                self.K_pp_form = None
+            # for saddle-point block-diagonal preconditioner
+            if self.solvetype=='iterative':
+                self.P_pp_form = fem.form(self.pb.a_p11, jit_params=self.pb.jit_params)
 
 
     def initialize_petsc_solver(self):
@@ -192,6 +218,17 @@ class solver_nonlinear:
     # solve for consistent initial acceleration a_old
     def solve_consistent_ini_acc(self, weakform_old, jac_a, a_old):
 
+        # residual at the initial state - if it is exactly zero (no initial loads, undeformed state...), the consistent
+        # initial acceleration is zero, and neither the mass matrix nor the linear solve is needed (a small but non-zero
+        # residual is no reason to skip: its scale is unrelated to the Newton tolerance, and a small mass gives a large acceleration)
+        r_a = fem.petsc.assemble_vector(fem.form(weakform_old))
+        r_a.ghostUpdate(addv=PETSc.InsertMode.ADD, mode=PETSc.ScatterMode.REVERSE)
+        
+        if r_a.norm() == 0.:
+            a_old.vector.set(0.0)
+            a_old.vector.ghostUpdate(addv=PETSc.InsertMode.INSERT, mode=PETSc.ScatterMode.FORWARD)
+            return
+
         # create solver
         ksp = PETSc.KSP().create(self.pb.comm)
         
@@ -210,9 +247,6 @@ class solver_nonlinear:
         M_a = fem.petsc.assemble_matrix(fem.form(jac_a), [])
         M_a.assemble()
         
-        r_a = fem.petsc.assemble_vector(fem.form(weakform_old))
-        r_a.ghostUpdate(addv=PETSc.InsertMode.ADD, mode=PETSc.ScatterMode.REVERSE)
-        
         ksp.setOperators(M_a)
         ksp.solve(-r_a, a_old.vector)
         
@@ -252,13 +286,13 @@ class solver_nonlinear:
                 for l in range(len(localdata['var'])): self.newton_local(localdata['var'][l],localdata['res'][l],localdata['inc'][l],localdata['fnc'][l])
 
             # assemble rhs vector
-            r_u = fem.petsc.assemble_vector(fem.form(self.weakform_u))
-            fem.apply_lifting(r_u, [fem.form(self.jac_uu)], [self.pb.bc.dbcs], x0=[u.vector], scale=-1.0)
+            r_u = fem.petsc.assemble_vector(self.r_u_form)
+            fem.apply_lifting(r_u, [self.K_uu_form], [self.pb.bc.dbcs], x0=[u.vector], scale=-1.0)
             r_u.ghostUpdate(addv=PETSc.InsertMode.ADD, mode=PETSc.ScatterMode.REVERSE)
             fem.set_bc(r_u, self.pb.bc.dbcs, x0=u.vector, scale=-1.0)
 
             # assemble system matrix
-            K_uu = fem.petsc.assemble_matrix(fem.form(self.jac_uu), self.pb.bc.dbcs)
+            K_uu = fem.petsc.assemble_matrix(self.K_uu_form, self.pb.bc.dbcs)
             K_uu.assemble()
             
             if self.PTC:
@@ -267,16 +301,16 @@ class solver_nonlinear:
 
             if self.pb.incompressible_2field:
                 
-                r_p = fem.petsc.assemble_vector(fem.form(self.weakform_p))
+                r_p = fem.petsc.assemble_vector(self.r_p_form)
                 r_p.ghostUpdate(addv=PETSc.InsertMode.ADD, mode=PETSc.ScatterMode.REVERSE)
-                K_up = fem.petsc.assemble_matrix(fem.form(self.jac_up), self.pb.bc.dbcs)
+                K_up = fem.petsc.assemble_matrix(self.K_up_form, self.pb.bc.dbcs)
                 K_up.assemble()
-                K_pu = fem.petsc.assemble_matrix(fem.form(self.jac_pu), self.pb.bc.dbcs)
+                K_pu = fem.petsc.assemble_matrix(self.K_pu_form, self.pb.bc.dbcs)
                 K_pu.assemble()
                 
                 # for stress-mediated volumetric growth, K_pp is not zero!
-                if not isinstance(self.pb.p11, ufl.constantvalue.Zero):
-                    K_pp = fem.petsc.assemble_matrix(fem.form(self.pb.p11), [])
+                if self.K_pp_form is not None:
+                    K_pp = fem.petsc.assemble_matrix(self.K_pp_form, [])
                     K_pp.assemble()
                 else:
                     K_pp = None
@@ -345,7 +379,7 @@ class solver_nonlinear:
 
                     tes = time.time()
 
-                    P_pp = fem.petsc.assemble_matrix(fem.form(self.pb.a_p11), [])
+                    P_pp = fem.petsc.assemble_matrix(self.P_pp_form, [])
                     P = PETSc.Mat().createNest([[K_uu, None], [None, P_pp]])
                     P.assemble()
 
@@ -550,6 +584,12 @@ class solver_nonlinear_constraint_monolithic(solver_nonlinear):
         
         
     def initialize_petsc_solver(self):
+        
+        # forms of the 3D problem (already contain the coupling contributions)
+        if self.pb.incompressible_2field:
+            self.compile_forms(self.pb.weakform_u, self.pb.jac_uu, self.pb.weakform_p, self.pb.jac_up, self.pb.jac_pu)
+        else:
+            self.compile_forms(self.pb.weakform_u, self.pb.jac_uu)
 
         # create solver
         self.ksp = PETSc.KSP().create(self.pb.comm)
@@ -711,13 +751,13 @@ class solver_nonlinear_constraint_monolithic(solver_nonlinear):
             if self.pbc.coupling_type == 'monolithic_lagrange' and self.ptype == 'solid_constraint':
                 self.pbc.set_pressure_fem(self.pbc.lm, self.pbc.coupfuncs)
 
-            r_u = fem.petsc.assemble_vector(fem.form(self.pb.weakform_u))
-            fem.apply_lifting(r_u, [fem.form(self.pb.jac_uu)], [self.pb.bc.dbcs], x0=[u.vector], scale=-1.0)
+            r_u = fem.petsc.assemble_vector(self.r_u_form)
+            fem.apply_lifting(r_u, [self.K_uu_form], [self.pb.bc.dbcs], x0=[u.vector], scale=-1.0)
             r_u.ghostUpdate(addv=PETSc.InsertMode.ADD, mode=PETSc.ScatterMode.REVERSE)
             fem.set_bc(r_u, self.pb.bc.dbcs, x0=u.vector, scale=-1.0)
             
             # 3D solid/fluid system matrix
-            K_uu = fem.petsc.assemble_matrix(fem.form(self.pb.jac_uu), self.pb.bc.dbcs)
+            K_uu = fem.petsc.assemble_matrix(self.K_uu_form, self.pb.bc.dbcs)
             K_uu.assemble()
 
             if self.PTC:
@@ -726,16 +766,16 @@ class solver_nonlinear_constraint_monolithic(solver_nonlinear):
 
             if self.pbc.pbs.incompressible_2field:
 
-                r_p = fem.petsc.assemble_vector(fem.form(self.pb.weakform_p))
+                r_p = fem.petsc.assemble_vector(self.r_p_form)
                 r_p.ghostUpdate(addv=PETSc.InsertMode.ADD, mode=PETSc.ScatterMode.REVERSE)
-                K_up = fem.petsc.assemble_matrix(fem.form(self.pb.jac_up), self.pb.bc.dbcs)
+                K_up = fem.petsc.assemble_matrix(self.K_up_form, self.pb.bc.dbcs)
                 K_up.assemble()
-                K_pu = fem.petsc.assemble_matrix(fem.form(self.pb.jac_pu), self.pb.bc.dbcs)
+                K_pu = fem.petsc.assemble_matrix(self.K_pu_form, self.pb.bc.dbcs)
                 K_pu.assemble()
                 
                 # for stress-mediated volumetric growth, K_pp is not zero!
-                if not isinstance(self.pb.p11, ufl.constantvalue.Zero):
-                    K_pp = fem.petsc.assemble_matrix(fem.form(self.pb.p11), [])
+                if self.K_pp_form is not None:
+                    K_pp = fem.petsc.assemble_matrix(self.K_pp_form, [])
                     K_pp.assemble()
                 else:
                     K_pp = None
@@ -856,13 +896,13 @@ class solver_nonlinear_constraint_monolithic(solver_nonlinear):
             # apply dbcs to matrix entries - basically since these are offdiagonal we want a zero there!
             for i in range(len(col_ids)):
                 
-                fem.apply_lifting(k_us_cols[i], [fem.form(self.pb.jac_uu)], [self.pb.bc.dbcs], x0=[u.vector], scale=0.0)
+                fem.apply_lifting(k_us_cols[i], [self.K_uu_form], [self.pb.bc.dbcs], x0=[u.vector], scale=0.0)
                 k_us_cols[i].ghostUpdate(addv=PETSc.InsertMode.ADD, mode=PETSc.ScatterMode.REVERSE)
                 fem.set_bc(k_us_cols[i], self.pb.bc.dbcs, x0=u.vector, scale=0.0)
             
             for i in range(len(row_ids)):
             
-                fem.apply_lifting(k_su_rows[i], [fem.form(self.pb.jac_uu)], [self.pb.bc.dbcs], x0=[u.vector], scale=0.0)
+                fem.apply_lifting(k_su_rows[i], [self.K_uu_form], [self.pb.bc.dbcs], x0=[u.vector], scale=0.0)
                 k_su_rows[i].ghostUpdate(addv=PETSc.InsertMode.ADD, mode=PETSc.ScatterMode.REVERSE)
                 fem.set_bc(k_su_rows[i], self.pb.bc.dbcs, x0=u.vector, scale=0.0)
             
@@ -973,12 +1013,12 @@ class solver_nonlinear_constraint_monolithic(solver_nonlinear):
 
                     # SIMPLE/block diagonal preconditioner
                     P_us = preconditioner.simple2x2(K_uu,K_us,K_su,self.K_ss)
-                    P_pp = fem.petsc.assemble_matrix(fem.form(self.pb.a_p11), [])
+                    P_pp = fem.petsc.assemble_matrix(self.P_pp_form, [])
                     P = PETSc.Mat().createNest([[P_us.getNestSubMatrix(0,0), None, P_us.getNestSubMatrix(0,1)], [P_us.getNestSubMatrix(1,0), P_pp, None], [None, None, P_us.getNestSubMatrix(1,1)]], isrows=None, iscols=None, comm=self.pbc.comm)
                     P.assemble()
                     
                     ## block diagonal preconditioner
-                    #P_pp = fem.petsc.assemble_matrix(fem.form(self.pb.a_p11), [])
+                    #P_pp = fem.petsc.assemble_matrix(self.P_pp_form, [])
                     #P = PETSc.Mat().createNest([[K_uu, None, None], [None, P_pp, None], [None, None, self.K_ss]], isrows=None, iscols=None, comm=self.pbc.comm)
                     #P.assemble()
                     
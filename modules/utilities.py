@@ -6,10 +6,17 @@
 # This source code is licensed under the BSD-style license found in the
 # LICENSE file in the root directory of this source tree.
 
-import sys, copy
+import sys, os, copy, hashlib
 from dolfinx import fem
 
 
+# type of discontinuous function spaces and minimum quadrature degrees (for higher-order meshes, and for any mesh - 0: no limit) per cell type
+dg_cell_types = {'tetrahedron'     : ('DG', 3, 0),
+                 'triangle3D'      : ('DG', 3, 0),
+                 'hexahedron'      : ('DQ', 5, 2),
+                 'quadrilateral3D' : ('DQ', 5, 2)}
+
+
 # print header at beginning of simulation
 def print_problem(ptype, comm, numdof=0):
 
@@ -103,3 +110,47 @@ def mat_params_to_dolfinx_constant(matparams, msh):
                                 matparams_new[k1][k2][k3][k4][k5] = fem.Constant(msh, matparams[k1][k2][k3][k4][k5])
                                 
     return matparams_new
+
+
+# cell-wise (DG0) field holding one value per domain (domain n has tag n+1), values can be floats or constants
+def domain_values_to_dg0_function(values, mt_d, V_dg0):
+    
+    fnc = fem.Function(V_dg0)
+    for n in range(len(values)):
+        fnc.x.array[V_dg0.dofmap.list.array[mt_d.find(n+1)]] = getattr(values[n], 'value', values[n])
+    fnc.x.scatter_forward()
+    
+    return fnc
+
+
+# merge the material parameters of several domains into one set of cell-wise (DG0) parameter fields - only possible if the
+# domains' materials differ in their float-valued parameters alone, otherwise returns None
+def mat_params_to_dg0_function(matparams, mt_d, V_dg0):
+    
+    def structure(mp):
+        if isinstance(mp, dict): return {k : structure(v) for k, v in mp.items()}
+        if isinstance(mp, fem.Constant): return 'const'
+        return mp
+    
+    if any(structure(mp) != structure(matparams[0]) for mp in matparams[1:]):
+        return None
+    
+    def merge(mps):
+        if isinstance(mps[0], dict): return {k : merge([mp[k] for mp in mps]) for k in mps[0].keys()}
+        if isinstance(mps[0], fem.Constant): return domain_values_to_dg0_function(mps, mt_d, V_dg0)
+        return mps[0]
+    
+    return merge(matparams)
+
+
+# JIT parameters for the FFCx-generated form kernels, with extra C compiler flags (e.g. ['-O3', '-march=native']) given in fem_params;
+# kernels compiled with non-default flags go to an own cache directory, since the flags are not part of the cache key
+def jit_params_from_fem_params(fem_params):
+    
+    try: compile_args = fem_params['jit_compile_args']
+    except: return {}
+    
+    cache_base = os.getenv('XDG_CACHE_HOME', os.path.join(os.path.expanduser('~'), '.cache'))
+    cache_tag = hashlib.md5(' '.join(compile_args).encode()).hexdigest()[:12]
+    
+    return {'cffi_extra_compile_args' : compile_args, 'cffi_libraries' : ['m'], 'cache_dir' : os.path.join(cache_base, 'fenics', 'ambit-'+cache_tag)}
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+
+# 0D model evaluation only (no FEM problem, so no dolfinx needed): residuals and stiffness (whose nonzero entries are inserted
+# into PETSc matrices) against the values of the former dense evaluation, re-evaluation of a state modified in place, NumPy
+# arrays, perturbation, prescribed variables, and that the results are on disk right after being written
+
+import sys, traceback
+import numpy as np
+from pathlib import Path
+from mpi4py import MPI
+from petsc4py import PETSc
+
+from cardiovascular0D_syspul import cardiovascular0Dsyspul
+
+import resultcheck
+
+
+def main():
+
+    basepath = str(Path(__file__).parent.absolute())
+    
+    comm = MPI.COMM_WORLD
+    
+    chamber_models = {'lv' : {'type' : '0D_elast', 'activation_curve' : 2}, 'rv' : {'type' : '0D_elast', 'activation_curve' : 2}, 'la' : {'type' : '0D_elast', 'activation_curve' : 1}, 'ra' : {'type' : '0D_elast', 'activation_curve' : 1}, 'ao' : {'type' : '0D_rigid'}}
+    valvelaws = {'av' : ['smooth_pres_momentum',0], 'mv' : ['pwlin_pres'], 'pv' : ['pwlin_pres'], 'tv' : ['pwlin_pres']}
+
+    model = cardiovascular0Dsyspul(param(), chamber_models, None, ['volume'], ['pressure'], valvelaws=valvelaws, comm=comm)
+    
+    numdof = model.numdof
+
+    # vectors and matrices, set up as in the 0D flow problem
+    dK = PETSc.Mat().createAIJ(size=(numdof,numdof), bsize=None, nnz=None, csr=None, comm=comm)
+    dK.setUp()
+    
+    K = PETSc.Mat().createAIJ(size=(numdof,numdof), bsize=None, nnz=None, csr=None, comm=comm)
+    K.setUp()
+    
+    s, df, f = K.createVecLeft(), K.createVecLeft(), K.createVecLeft()
+    w, dKw, Kw = K.createVecLeft(), K.createVecLeft(), K.createVecLeft()
+    
+    aux = np.zeros(numdof)
+    
+    vs, ve = s.getOwnershipRange()
+    
+    # the stiffness matrices are checked by their products with a weight vector
+    w[vs:ve] = np.arange(vs+1., ve+1.)
+    w.assemble()
+    
+    # two states around the initial conditions
+    s_ini = np.zeros(numdof)
+    model.initialize(s_ini, init())
+    s1 = s_ini + 0.01*np.arange(numdof)
+    s2 = s_ini + 0.1*np.sin(np.arange(numdof))
+    
+    # time and chamber activations
+    t, y = 0.3, [0.5,0.3,0.2,0.1]
+
+    # evaluate the model at a state (written in place into the same vector, as in the nonlinear solver)
+    def evaluate(s_):
+        s[vs:ve] = s_[vs:ve]
+        s.assemble()
+        model.evaluate(s, t, df=df, f=f, dK=dK, K=K, y=y, a=aux)
+        df.assemble(), f.assemble()
+        dK.assemble(), K.assemble()
+        dK.mult(w, dKw), K.mult(w, Kw)
+    
+    # PETSc vector of a NumPy array (for the results check)
+    def petscvec(arr):
+        v = K.createVecLeft()
+        v[vs:ve] = arr[vs:ve]
+        v.assemble()
+        return v
+    
+    checks = []
+
+    # --- results check
+    tol = 1.0e-6
+    
+    # correct results (of the dense evaluation)
+    df1_corr = np.array([4.6919292617999999E+04, 0.0000000000000000E+00, 4.0381461797051293E+03, 0.0000000000000000E+00, 0.0000000000000000E+00, 0.0000000000000000E+00,
+                         8.3726950101218797E+04, 3.8908333333333313E-04, 5.7052087649363349E+05, 0.0000000000000000E+00, 2.2591742291944443E+04, 0.0000000000000000E+00,
+                         3.3332191138432836E+03, 0.0000000000000000E+00, 6.7358535877800008E+04, 0.0000000000000000E+00, 8.7993440537999995E+04, 0.0000000000000000E+00])
+    f1_corr = np.array([-1.7000000000000001E-01, 2.0000000000000018E-03, 2.0000000000000000E-02, 9.2938295776260005E-01, 3.0000000000000002E-02, 3.3333833333337216E+03,
+                        2.0000000000000004E-02, -6.2755113060999989E+04, 1.9999999999999990E-02, -8.3742940571354251E+04, 1.0000000000000009E-02, 1.0200000000000001E-01,
+                        1.9999999999999990E-02, 4.3446011132625001E-01, 2.9999999999999999E-02, -1.0720371554200006E+05, 2.0000000000000018E-02, -7.6661030448400037E+04])
+    dKw1_corr = np.array([1.5384615384615384E+05, 0.0000000000000000E+00, 2.5641025641025644E+04, 0.0000000000000000E+00, 0.0000000000000000E+00, 0.0000000000000000E+00,
+                          6.0150026760833309E+04, 4.4466666666666640E-02, 2.3200724607750000E+06, 0.0000000000000000E+00, 1.3333333333333333E+06, 0.0000000000000000E+00,
+                          2.0895522388059701E+05, 0.0000000000000000E+00, 3.0000000000000000E+05, 0.0000000000000000E+00, 8.5000000000000000E+05, 0.0000000000000000E+00])
+    Kw1_corr = np.array([-1.7000000000000000E+01, 1.2000000000000000E+00, 2.0000000000000000E+00, 3.1000000000000001E+00, 3.0000000000000000E+00, 3.3333933333333407E+05,
+                         2.0000000000000000E+00, 1.6674666666666657E+04, 2.0000000000000000E+00, 1.2501000000000012E+05, 1.0000000000000000E+00, 1.1199999999999999E+01,
+                         2.0000000000000000E+00, 1.3100000000000000E+01, 3.0000000000000000E+00, 1.3334933333333349E+05, 2.0000000000000000E+00, -9.9998200000000058E+05])
+    f2_corr = np.array([9.6139749187955689E-02, -7.0035097674802979E+04, 9.0929742682568176E-02, 9.9033347541149030E-01, -1.8682217014888203E-01, 7.9563540593891166E+03,
+                        1.6159108733819277E-01, -6.1864472574988184E+04, -2.4486811347703245E-02, -9.3281941247731069E+04, -9.5613959613112642E-02, -4.0200538655163529E-02,
+                        7.4481928889347931E-04, 2.6550722271488880E-01, 1.1868607581575519E-01, -1.1706053832894897E+05, -1.6116853320366736E-01, -5.9132134578329467E+04])
+    Kw2_corr = np.array([-1.7000000000000000E+01, 2.0000010000000000E+06, 2.0000000000000000E+00, 3.1000000000000001E+00, 3.0000000000000000E+00, 3.3333933333333407E+05,
+                         2.0000000000000000E+00, 1.6674666666666657E+04, 2.0000000000000000E+00, 1.2501000000000012E+05, 1.0000000000000000E+00, 1.1199999999999999E+01,
+                         2.0000000000000000E+00, 1.3100000000000000E+01, 3.0000000000000000E+00, 1.3334933333333349E+05, 2.0000000000000000E+00, -9.9998200000000058E+05])
+    # with a perturbed mitral valve (R_vin_l_max doubled)
+    f1p_corr = np.array([-1.7000000000000001E-01, 1.0000000000000009E-03, 2.0000000000000000E-02, 9.2938295776260005E-01, 3.0000000000000002E-02, 3.3333833333337216E+03,
+                         2.0000000000000004E-02, -6.2755113060999989E+04, 1.9999999999999990E-02, -8.3742940571354251E+04, 1.0000000000000009E-02, 1.0200000000000001E-01,
+                         1.9999999999999990E-02, 4.3446011132625001E-01, 2.9999999999999999E-02, -1.0720371554200006E+05, 2.0000000000000018E-02, -7.6661030448400037E+04])
+    Kw1p_corr = np.array([-1.7000000000000000E+01, 1.1000000000000001E+00, 2.0000000000000000E+00, 3.1000000000000001E+00, 3.0000000000000000E+00, 3.3333933333333407E+05,
+                          2.0000000000000000E+00, 1.6674666666666657E+04, 2.0000000000000000E+00, 1.2501000000000012E+05, 1.0000000000000000E+00, 1.1199999999999999E+01,
+                          2.0000000000000000E+00, 1.3100000000000000E+01, 3.0000000000000000E+00, 1.3334933333333349E+05, 2.0000000000000000E+00, -9.9998200000000058E+05])
+    
+    # PETSc vectors and matrices
+    evaluate(s1)
+    checks.append(resultcheck.results_check_vec(df, df1_corr, comm, tol=tol))
+    checks.append(resultcheck.results_check_vec(f, f1_corr, comm, tol=tol))
+    checks.append(resultcheck.results_check_vec(dKw, dKw1_corr, comm, tol=tol))
+    checks.append(resultcheck.results_check_vec(Kw, Kw1_corr, comm, tol=tol))
+    
+    # another state, and back - no values of the previous state may be re-used
+    evaluate(s2)
+    checks.append(resultcheck.results_check_vec(f, f2_corr, comm, tol=tol))
+    checks.append(resultcheck.results_check_vec(Kw, Kw2_corr, comm, tol=tol))
+    
+    evaluate(s1)
+    checks.append(resultcheck.results_check_vec(f, f1_corr, comm, tol=tol))
+    checks.append(resultcheck.results_check_vec(Kw, Kw1_corr, comm, tol=tol))
+    
+    # NumPy arrays
+    df_np, f_np, dK_np, K_np = np.zeros(numdof), np.zeros(numdof), np.zeros((numdof,numdof)), np.zeros((numdof,numdof))
+    model.evaluate(s1, t, df=df_np, f=f_np, dK=dK_np, K=K_np, y=y)
+    checks.append(resultcheck.results_check_vec(petscvec(df_np), df1_corr, comm, tol=tol))
+    checks.append(resultcheck.results_check_vec(petscvec(f_np), f1_corr, comm, tol=tol))
+    checks.append(resultcheck.results_check_vec(petscvec(dK_np.dot(np.arange(1., numdof+1.))), dKw1_corr, comm, tol=tol))
+    checks.append(resultcheck.results_check_vec(petscvec(K_np.dot(np.arange(1., numdof+1.))), Kw1_corr, comm, tol=tol))
+    
+    # perturbation
+    model.induce_perturbation('mr', 2.)
+    evaluate(s1)
+    checks.append(resultcheck.results_check_vec(f, f1p_corr, comm, tol=tol))
+    checks.append(resultcheck.results_check_vec(Kw, Kw1p_corr, comm, tol=tol))
+    
+    # prescribed variable: residual entry is the deviation from the value, and the stiffness row the one of the identity
+    index_prescribed, val = model.varmap['p_v_l'], 1.0
+    
+    r_corr = np.copy(f1p_corr)
+    r_corr[index_prescribed] = s1[index_prescribed] - val
+    Kw_corr = np.copy(Kw1p_corr)
+    Kw_corr[index_prescribed] = index_prescribed+1.
+    
+    model.set_prescribed_variables(s, f, K, val, index_prescribed)
+    f.assemble(), K.assemble()
+    K.mult(w, Kw)
+    checks.append(resultcheck.results_check_vec(f, r_corr, comm, tol=tol))
+    checks.append(resultcheck.results_check_vec(Kw, Kw_corr, comm, tol=tol))
+    
+    model.evaluate(s1, t, f=f_np, K=K_np, y=y)
+    model.set_prescribed_variables(s1, f_np, K_np, val, index_prescribed)
+    checks.append(resultcheck.results_check_vec(petscvec(f_np), r_corr, comm, tol=tol))
+    checks.append(resultcheck.results_check_vec(petscvec(K_np.dot(np.arange(1., numdof+1.))), Kw_corr, comm, tol=tol))
+    
+    # output: each written result has to be in the file right away (without flushing or closing it)
+    model.write_output(basepath+'/tmp', t, s, aux, nm='evaluate')
+    
+    if comm.rank == 0:
+        res = np.loadtxt(basepath+'/tmp/results_evaluate_p_v_l.txt')
+        outcheck = bool(np.allclose(res, [t, s1[index_prescribed]], rtol=0., atol=tol))
+        print("Result on disk after writing: "+str(outcheck))
+        sys.stdout.flush()
+    else:
+        outcheck = None
+    
+    checks.append(comm.bcast(outcheck, root=0))
+    
+    model.close_output()
+    
+    success = resultcheck.success_check(checks, comm)
+    
+    return success
+
+
+def init():
+    
+    return {'q_vin_l_0' : 0.0,
+            'p_at_l_0' : 0.599950804034,
+            'q_vout_l_0' : 0.0,
+            'p_v_l_0' : 0.599950804034,
+            'p_ar_sys_0' : 9.68378038166,
+            'q_ar_sys_0' : 0.0,
+            'p_ven_sys_0' : 2.13315841434,
+            'q_ven_sys_0' : 0.0,
+            'q_vin_r_0' : 0.0,
+            'p_at_r_0' : 0.0933256806275,
+            'q_vout_r_0' : 0.0,
+            'p_v_r_0' : 0.0933256806275,
+            'p_ar_pul_0' : 3.22792679389,
+            'q_ar_pul_0' : 0.0,
+            'p_ven_pul_0' : 1.59986881076,
+            'q_ven_pul_0' : 0.0}
+
+
+def param():
+    
+    # parameters in kg-mm-s unit system
+    
+    R_ar_sys = 120.0e-6
+    tau_ar_sys = 1.0311433159
+    tau_ar_pul = 0.3
+    
+    # Diss Hirschvogel tab. 2.7
+    C_ar_sys = tau_ar_sys/R_ar_sys
+    Z_ar_sys = R_ar_sys/20.
+    R_ven_sys = R_ar_sys/5.
+    C_ven_sys = 30.*C_ar_sys
+    R_ar_pul = R_ar_sys/8.
+    C_ar_pul = tau_ar_pul/R_ar_pul
+    R_ven_pul = R_ar_pul
+    C_ven_pul = 2.5*C_ar_pul
+    
+    L_ar_sys = 0.667e-6
+    L_ven_sys = 0.
+    L_ar_pul = 0.
+    L_ven_pul = 0.
+    
+    # timings
+    t_ed = 0.2
+    t_es = 0.53
+    T_cycl = 1.0
+    
+    # atrial elastances
+    E_at_max_l = 2.9e-5
+    E_at_min_l = 9.0e-6
+    E_at_max_r = 1.8e-5
+    E_at_min_r = 8.0e-6
+    # ventricular elastances
+    E_v_max_l = 30.0e-5
+    E_v_min_l = 12.0e-6
+    E_v_max_r = 20.0e-5
+    E_v_min_r = 10.0e-6
+    
+    
+    return {'R_ar_sys' : R_ar_sys,
+            'C_ar_sys' : C_ar_sys,
+            'L_ar_sys' : L_ar_sys,
+            'Z_ar_sys' : Z_ar_sys,
+            'R_ar_pul' : R_ar_pul,
+            'C_ar_pul' : C_ar_pul,
+            'L_ar_pul' : L_ar_pul,
+            'R_ven_sys' : R_ven_sys,
+            'C_ven_sys' : C_ven_sys,
+            'L_ven_sys' : L_ven_sys,
+            'R_ven_pul' : R_ven_pul,
+            'C_ven_pul' : C_ven_pul,
+            'L_ven_pul' : L_ven_pul,
+            # atrial elastances
+            'E_at_max_l' : E_at_max_l,
+            'E_at_min_l' : E_at_min_l,
+            'E_at_max_r' : E_at_max_r,
+            'E_at_min_r' : E_at_min_r,
+            # ventricular elastances
+            'E_v_max_l' : E_v_max_l,
+            'E_v_min_l' : E_v_min_l,
+            'E_v_max_r' : E_v_max_r,
+            'E_v_min_r' : E_v_min_r,
+            # valve resistances
+            'R_vin_l_min' : 1.0e-6,
+            'R_vin_l_max' : 1.0e1,
+            'R_vout_l_min' : 1.0e-6,
+            'R_vout_l_max' : 1.0e1,
+            'R_vin_r_min' : 1.0e-6,
+            'R_vin_r_max' : 1.0e1,
+            'R_vout_r_min' : 1.0e-6,
+            'R_vout_r_max' : 1.0e1,
+            # timings
+            't_ed' : t_ed,
+            't_es' : t_es,
+            'T_cycl' : T_cycl,
+            # unstressed compartment volumes (for post-processing)
+            'V_at_l_u' : 0.0,
+            'V_at_r_u' : 0.0,
+            'V_v_l_u' : 0.0,
+            'V_v_r_u' : 0.0,
+            'V_ar_sys_u' : 0.0,
+            'V_ar_pul_u' : 0.0,
+            'V_ven_sys_u' : 0.0,
+            'V_ven_pul_u' : 0.0}
+
+
+
+
+if __name__ == "__main__":
+    
+    success = False
+    
+    try:
+        success = main()
+    except:
+        print(traceback.format_exc())
+    
+    if success:
+        sys.exit(0)
+    else:
+        sys.exit(1)
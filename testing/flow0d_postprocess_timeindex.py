@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+
+# 0D postprocessing only: the time steps of the end-diastolic and end-systolic points in the last cycle, as found by
+# time_index, against the former linear search (times compared rounded to two decimals, which works for a time step of 0.01)
+# and against the nearest time step for other time step sizes
+
+import sys, traceback
+import numpy as np
+from pathlib import Path
+
+basepath = str(Path(__file__).parent.absolute())
+sys.path.append(basepath+'/../modules/postprocess')
+
+from flow0d_plot import time_index
+
+
+def main():
+    
+    success = True
+    
+    T_cycl, t_ed, t_es, n_cycl = 1.0, 0.2, 0.53, 3
+    
+    # former linear search
+    def time_index_search(times, t):
+        for k in range(len(times)):
+            if round(times[k],2) == round(t,2):
+                return k
+        return -1
+    
+    for nstep_cycl in [100, 300, 1000]:
+        
+        dt = T_cycl/nstep_cycl
+        
+        # times of the last cycle, as read from the results
+        times = (n_cycl-1)*T_cycl + np.arange(1, nstep_cycl+1)*dt
+        
+        for t in [t_ed+(n_cycl-1)*T_cycl, t_es+(n_cycl-1)*T_cycl]:
+            
+            k = time_index(times, t, dt)
+            
+            if nstep_cycl == 100: k_corr = time_index_search(times, t)
+            else: k_corr = np.argmin(abs(times-t))
+            
+            print("nstep_cycl = %i, t = %.4f: index = %i,    CORR = %i" % (nstep_cycl, t, k, k_corr))
+            sys.stdout.flush()
+            
+            if k != k_corr: success = False
+        
+        # no time step within half a time step of the end of the previous cycle
+        k = time_index(times, (n_cycl-1)*T_cycl-dt, dt)
+        
+        print("nstep_cycl = %i, t outside: index = %i,    CORR = %i" % (nstep_cycl, k, -1))
+        sys.stdout.flush()
+        
+        if k != -1: success = False
+
+    if success:
+        print("Test passed. :-)")
+    else:
+        print("!!!Test failed!!!")
+    sys.stdout.flush()
+    
+    return success
+
+
+
+
+if __name__ == "__main__":
+    
+    success = False
+    
+    try:
+        success = main()
+    except:
+        print(traceback.format_exc())
+    
+    if success:
+        sys.exit(0)
+    else:
+        sys.exit(1)
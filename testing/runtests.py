@@ -82,6 +82,11 @@ if flow0d:
     errs['flow0d_0Dheart_syspulcaprespir_periodic 1'] = subprocess.call(['mpiexec', '-n', '1', 'python3', 'flow0d_0Dheart_syspulcaprespir_periodic.py'])
     errs['flow0d_0Dheart_syspulcaprespir_periodic 2'] = subprocess.call(['mpiexec', '-n', '2', 'python3', 'flow0d_0Dheart_syspulcaprespir_periodic.py'])
 
+    errs['flow0d_0Dheart_syspul_evaluate 1'] = subprocess.call(['mpiexec', '-n', '1', 'python3', 'flow0d_0Dheart_syspul_evaluate.py'])
+    errs['flow0d_0Dheart_syspul_evaluate 2'] = subprocess.call(['mpiexec', '-n', '2', 'python3', 'flow0d_0Dheart_syspul_evaluate.py'])
+
+    errs['flow0d_postprocess_timeindex 1'] = subprocess.call(['mpiexec', '-n', '1', 'python3', 'flow0d_postprocess_timeindex.py'])
+
 if solid_flow0d:
     errs['solid_flow0d_monolithicdirect_4elwindkesselLsZ_chamber 1'] = subprocess.call(['mpiexec', '-n', '1', 'python3', 'solid_flow0d_monolithicdirect_4elwindkesselLsZ_chamber.py'])
     errs['solid_flow0d_monolithicdirect_4elwindkesselLsZ_chamber 2'] = subprocess.call(['mpiexec', '-n', '2', 'python3', 'solid_flow0d_monolithicdirect_4elwindkesselLsZ_chamber.py'])